@@ -0,0 +1,94 @@
+"""
+Concurrency benchmark for the API controllers.
+
+Serves many concurrent requests on a single event loop against a repository
+that blocks for a fixed latency on every query, once with the service calls
+made inline (the previous behaviour) and once through the BoundedExecutor.
+
+Usage (from the project root):
+    python benchmarks/bench_async_controllers.py --requests 200 --latency-ms 20
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, List
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.domain import Trip  # noqa: E402
+from core.services import TripService  # noqa: E402
+from infrastructure.concurrency import BoundedExecutor  # noqa: E402
+from presentation.api.controllers.trip_controller import TripController  # noqa: E402
+
+
+class SlowTripRepository:
+    """Trip repository that sleeps to emulate a database round trip."""
+
+    def __init__(self, latency_seconds: float, trip_count: int = 20) -> None:
+        today = date.today()
+        self._latency_seconds = latency_seconds
+        self._trips: List[Trip] = [
+            Trip(
+                uuid4(),
+                today - timedelta(days=3),
+                today + timedelta(days=3),
+                False,
+                1e5,
+            )
+            for _ in range(trip_count)
+        ]
+
+    def get_all(self) -> List[Trip]:
+        time.sleep(self._latency_seconds)
+        return list(self._trips)
+
+
+class InlineExecutor:
+    """Executor that calls the service on the event loop, as before."""
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return func(*args, **kwargs)
+
+
+async def measure(controller: TripController, request_count: int) -> float:
+    """
+    Fires request_count concurrent requests and returns requests per second.
+    """
+    started = time.perf_counter()
+    await asyncio.gather(*(controller.get_all_trips() for _ in range(request_count)))
+    return request_count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, default=5)
+    args = parser.parse_args()
+
+    trip_service = TripService(SlowTripRepository(args.latency_ms / 1000))
+    executor = BoundedExecutor(args.workers)
+
+    inline = asyncio.run(
+        measure(TripController(trip_service, InlineExecutor()), args.requests)
+    )
+    offloaded = asyncio.run(
+        measure(TripController(trip_service, executor), args.requests)
+    )
+    executor.shutdown()
+
+    print(
+        f"requests={args.requests} latency={args.latency_ms}ms workers={args.workers}"
+    )
+    print(f"inline (before):   {inline:10.1f} req/s")
+    print(f"executor (after):  {offloaded:10.1f} req/s")
+    print(f"speedup:           {offloaded / inline:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
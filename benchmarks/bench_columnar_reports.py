@@ -0,0 +1,158 @@
+"""
+Report engine benchmark: Python objects vs NumPy columns.
+
+Builds the daily, type and summary reports of a single trip from synthetic
+rows, once by mapping every row to an Expense and aggregating the objects in
+Python (the previous ReportService) and once with ColumnarReportService.
+Each report loads its own data in both engines, and the timings include
+turning the fetched rows into the structure that is aggregated.
+
+Usage (from the project root):
+    python benchmarks/bench_columnar_reports.py --rows 10000 100000 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import List, Tuple
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from application.dto import ExpenseColumns  # noqa: E402
+from core.domain import Expense, Trip  # noqa: E402
+from core.enums import ExpenseType, PaymentMethod  # noqa: E402
+from core.services import ColumnarReportService  # noqa: E402
+
+Row = Tuple[date, str, str, Decimal]
+
+
+def make_rows(count: int, trip_days: int, seed: int = 7) -> List[Row]:
+    generator = random.Random(seed)
+    start = date(2025, 1, 1)
+    expense_types = [expense_type.value for expense_type in ExpenseType]
+    payment_methods = [payment_method.value for payment_method in PaymentMethod]
+    return [
+        (
+            start + timedelta(days=generator.randrange(trip_days)),
+            generator.choice(expense_types),
+            generator.choice(payment_methods),
+            Decimal(generator.randrange(100, 50_000_000)) / 100,
+        )
+        for _ in range(count)
+    ]
+
+
+def load_expenses(trip: Trip, rows: List[Row]) -> List[Expense]:
+    """
+    Maps fetched rows to Expense objects, as get_by_trip_id does.
+    """
+    return [
+        Expense(
+            uuid4(),
+            trip.trip_id,
+            expense_date,
+            float(amount),
+            "COP",
+            float(amount),
+            PaymentMethod(payment_method),
+            ExpenseType(expense_type),
+        )
+        for expense_date, expense_type, payment_method, amount in rows
+    ]
+
+
+def object_reports(trip: Trip, rows: List[Row]) -> None:
+    """
+    Builds the three reports by iterating Expense objects, loading the
+    expenses once per report like the previous ReportService.
+    """
+    daily = defaultdict(lambda: {"cash": 0.0, "card": 0.0, "total": 0.0})
+    for expense in load_expenses(trip, rows):
+        method = "cash" if expense.payment_method == PaymentMethod.CASH else "card"
+        daily[expense.expense_date][method] += expense.converted_amount_cop
+        daily[expense.expense_date]["total"] += expense.converted_amount_cop
+
+    by_type = defaultdict(lambda: {"cash": 0.0, "card": 0.0, "total": 0.0})
+    for expense in load_expenses(trip, rows):
+        method = "cash" if expense.payment_method == PaymentMethod.CASH else "card"
+        by_type[expense.expense_type][method] += expense.converted_amount_cop
+        by_type[expense.expense_type]["total"] += expense.converted_amount_cop
+
+    sum(expense.converted_amount_cop for expense in load_expenses(trip, rows))
+
+
+class RowsRepository:
+    """Expense repository that serves pre-fetched rows as columns."""
+
+    def __init__(self, rows: List[Row], preload: bool = False) -> None:
+        self._rows = rows
+        self._columns = ExpenseColumns.from_rows(rows) if preload else None
+
+    def get_columns(self, trip_id, batch_size: int = 10000) -> ExpenseColumns:
+        if self._columns is not None:
+            return self._columns
+        return ExpenseColumns.from_rows(self._rows)
+
+
+class StaticTripRepository:
+    """Trip repository that always returns the same trip."""
+
+    def __init__(self, trip: Trip) -> None:
+        self._trip = trip
+
+    def get_by_id(self, trip_id) -> Trip:
+        return self._trip
+
+
+def columnar_reports(service: ColumnarReportService, trip: Trip) -> None:
+    service.generate_daily_expense_report(trip.trip_id)
+    service.generate_expense_type_report(trip.trip_id)
+    service.get_trip_summary(trip.trip_id)
+
+
+def timed(func, *args) -> float:
+    started = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--trip-days", type=int, default=60)
+    args = parser.parse_args()
+
+    start = date(2025, 1, 1)
+    trip = Trip(uuid4(), start, start + timedelta(days=args.trip_days - 1), True, 1e6)
+
+    print(
+        f"{'rows':>10} {'objects':>12} {'columnar':>12} {'speedup':>9} "
+        f"{'aggregation only':>17}"
+    )
+    for count in args.rows:
+        rows = make_rows(count, args.trip_days)
+        trip_repository = StaticTripRepository(trip)
+        loading = ColumnarReportService(RowsRepository(rows), trip_repository)
+        preloaded = ColumnarReportService(
+            RowsRepository(rows, preload=True), trip_repository
+        )
+
+        objects = timed(object_reports, trip, rows)
+        columnar = timed(columnar_reports, loading, trip)
+        aggregation = timed(columnar_reports, preloaded, trip)
+        print(
+            f"{count:>10} {objects:>11.3f}s {columnar:>11.3f}s "
+            f"{objects / columnar:>8.1f}x {aggregation:>16.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
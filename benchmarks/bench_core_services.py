@@ -0,0 +1,283 @@
+"""
+Core service microbenchmarks against the in-memory repositories.
+
+Times ExpenseManager.register_expense and calculate_daily_difference, every
+ReportService method (with both report engines) and
+TripService.get_active_trips at several data sizes. A data set of size N has
+one international trip holding N expenses and N // 10 other trips, half of
+them active. Each case reports operations per second and the peak memory
+allocated by a single call, traced with tracemalloc in a separate pass so
+tracing does not skew the timings.
+
+Results can be saved as a JSON baseline and later runs compared against it;
+the script exits with status 1 when a case is slower than the baseline by
+more than the tolerance. Baselines are only comparable on the machine that
+recorded them.
+
+Usage (from the project root):
+    python benchmarks/bench_core_services.py --save benchmarks/baseline.json
+    python benchmarks/bench_core_services.py --compare benchmarks/baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from application.dto import ExpenseDTO  # noqa: E402
+from core.domain import Expense, Trip  # noqa: E402
+from core.enums import ExpenseType, PaymentMethod  # noqa: E402
+from core.services import ColumnarReportService, ExpenseManager  # noqa: E402
+from core.services import ReportService, TripService  # noqa: E402
+from infrastructure.persistence import InMemoryExpenseRepository  # noqa: E402
+from infrastructure.persistence import InMemoryTripRepository  # noqa: E402
+
+Case = Tuple[str, Callable[[], object]]
+
+
+class FixedRateConverter:
+    """Currency converter with a constant rate, standing in for the HTTP API."""
+
+    def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
+        return amount * 4000.0
+
+    def convert_on(
+        self, amount: float, from_currency: str, to_currency: str, on_date: date
+    ) -> float:
+        return amount * 4000.0
+
+    def convert_many(
+        self,
+        amounts: Sequence[float],
+        from_currency: str,
+        to_currency: str,
+        on_date: Optional[date] = None,
+    ) -> List[float]:
+        return [amount * 4000.0 for amount in amounts]
+
+    def convert_mixed(
+        self,
+        amounts: Sequence[float],
+        from_currencies: Sequence[str],
+        to_currency: str,
+        on_dates: Optional[Sequence[date]] = None,
+    ) -> List[float]:
+        return [amount * 4000.0 for amount in amounts]
+
+
+def build_cases(size: int, trip_days: int = 30, seed: int = 7) -> List[Case]:
+    """
+    Fills in-memory repositories with a data set of the given size and returns
+    the callables to time.
+    """
+    generator = random.Random(seed)
+    today = date.today()
+    trip_repository = InMemoryTripRepository()
+    expense_repository = InMemoryExpenseRepository()
+
+    start = today - timedelta(days=trip_days // 2)
+    trip = Trip(uuid4(), start, start + timedelta(days=trip_days - 1), True, 1e6, "USD")
+    trip_repository.save(trip)
+
+    for index in range(size // 10):
+        offset = -trip_days if index % 2 else -(trip_days // 2)
+        other_start = today + timedelta(days=offset)
+        trip_repository.save(
+            Trip(
+                uuid4(),
+                other_start,
+                other_start + timedelta(days=trip_days - 1 - index % 2),
+                False,
+                200000,
+            )
+        )
+
+    expense_types = list(ExpenseType)
+    payment_methods = list(PaymentMethod)
+    expense_repository.save_many(
+        [
+            Expense(
+                uuid4(),
+                trip.trip_id,
+                start + timedelta(days=generator.randrange(trip_days)),
+                amount,
+                "USD",
+                amount * 4000,
+                generator.choice(payment_methods),
+                generator.choice(expense_types),
+            )
+            for amount in (generator.randrange(100, 50000) / 100 for _ in range(size))
+        ]
+    )
+
+    converter = FixedRateConverter()
+    manager = ExpenseManager(expense_repository, trip_repository, converter)
+    trip_service = TripService(trip_repository)
+    expense_dto = ExpenseDTO(
+        trip.trip_id, today, 12.5, PaymentMethod.CARD, ExpenseType.FOOD
+    )
+
+    cases: List[Case] = [
+        (
+            "ExpenseManager.calculate_daily_difference",
+            lambda: manager.calculate_daily_difference(trip.trip_id, today),
+        ),
+        ("TripService.get_active_trips", trip_service.get_active_trips),
+    ]
+
+    for service_class in (ReportService, ColumnarReportService):
+        service = service_class(expense_repository, trip_repository)
+        name = service_class.__name__
+        cases += [
+            (
+                f"{name}.generate_daily_expense_report",
+                lambda service=service: service.generate_daily_expense_report(
+                    trip.trip_id
+                ),
+            ),
+            (
+                f"{name}.generate_expense_type_report",
+                lambda service=service: service.generate_expense_type_report(
+                    trip.trip_id
+                ),
+            ),
+            (
+                f"{name}.get_trip_summary",
+                lambda service=service: service.get_trip_summary(trip.trip_id),
+            ),
+            (f"{name}.get_dashboard_summary", service.get_dashboard_summary),
+        ]
+
+    # Registering grows the trip, so it runs after the cases that read it.
+    cases.append(
+        (
+            "ExpenseManager.register_expense",
+            lambda: manager.register_expense(expense_dto),
+        )
+    )
+    return cases
+
+
+def ops_per_second(
+    func: Callable[[], object], min_time: float, repeat: int = 3
+) -> float:
+    """
+    Grows the number of calls per batch until a batch takes at least min_time,
+    then times repeat batches and keeps the fastest to dampen noise.
+    """
+    calls = 1
+    while True:
+        elapsed = timed_batch(func, calls)
+        if elapsed >= min_time:
+            break
+        calls *= 2 if elapsed <= 0 else max(2, int(min_time / elapsed * 1.2))
+
+    best = min([elapsed] + [timed_batch(func, calls) for _ in range(repeat - 1)])
+    return calls / best
+
+
+def timed_batch(func: Callable[[], object], calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return time.perf_counter() - started
+
+
+def peak_kib(func: Callable[[], object]) -> float:
+    """
+    Returns the peak memory allocated while running func once, in KiB.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - baseline) / 1024
+
+
+def run(sizes: List[int], min_time: float) -> Iterator[Tuple[str, Dict[str, float]]]:
+    for size in sizes:
+        for name, func in build_cases(size):
+            yield f"{name}@{size}", {
+                "ops_per_sec": ops_per_second(func, min_time),
+                "peak_kib": peak_kib(func),
+            }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds to time each case"
+    )
+    parser.add_argument("--save", type=Path, help="write the results to this JSON file")
+    parser.add_argument("--compare", type=Path, help="baseline JSON file to compare")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="allowed ops/sec drop against the baseline, as a fraction",
+    )
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+
+    header = f"{'case':<58} {'ops/sec':>12} {'us/op':>10} {'peak KiB':>10}"
+    print(header + (f" {'vs baseline':>12}" if baseline else ""))
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressions = []
+    for key, result in run(args.sizes, args.min_time):
+        results[key] = result
+        ops = result["ops_per_sec"]
+        line = f"{key:<58} {ops:>12,.0f} {1e6 / ops:>10.1f} {result['peak_kib']:>10.1f}"
+
+        if key in baseline:
+            change = ops / baseline[key]["ops_per_sec"] - 1
+            line += f" {change:>+11.1%}"
+            if change < -args.tolerance:
+                regressions.append(key)
+                line += "  REGRESSION"
+        print(line)
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"\nSaved {len(results)} results to {args.save}")
+
+    if regressions:
+        print(
+            f"\n{len(regressions)} case(s) slower than the baseline by more than "
+            f"{args.tolerance:.0%}: {', '.join(regressions)}"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
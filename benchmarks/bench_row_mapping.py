@@ -0,0 +1,129 @@
+"""
+Row mapping benchmark: dictionary rows and __dict__ objects vs tuple rows and slots.
+
+Maps the same expense rows to domain objects twice: the previous way (a
+dictionary per row, as cursor(dictionary=True) builds them, mapped to an
+Expense with a per-instance __dict__) and through
+MySQLExpenseRepository._map_to_expense, which unpacks tuple rows into the
+slotted Expense. Reports throughput, peak traced memory while mapping and the
+memory still held by the mapped objects.
+
+Usage (from the project root):
+    python benchmarks/bench_row_mapping.py --rows 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Callable, List, Tuple
+from uuid import UUID, uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from core.domain import Expense  # noqa: E402
+from core.enums import ExpenseType, PaymentMethod  # noqa: E402
+from infrastructure.persistence import MySQLExpenseRepository  # noqa: E402
+
+COLUMNS = MySQLExpenseRepository._COLUMNS
+
+# Same constructor as Expense, without __slots__, as the class was before.
+DictExpense = type("DictExpense", (), {"__init__": Expense.__init__})
+
+
+def make_rows(count: int, seed: int = 11) -> List[Tuple]:
+    generator = random.Random(seed)
+    trip_id = str(uuid4())
+    start = date(2025, 1, 1)
+    return [
+        (
+            str(uuid4()),
+            trip_id,
+            start + timedelta(days=generator.randrange(60)),
+            Decimal(generator.randrange(100, 10_000_000)) / 100,
+            "USD",
+            Decimal(generator.randrange(100, 50_000_000)) / 100,
+            generator.choice(list(PaymentMethod)).value,
+            generator.choice(list(ExpenseType)).value,
+        )
+        for _ in range(count)
+    ]
+
+
+def map_dictionary_rows(rows: List[Tuple]) -> list:
+    """
+    Builds a dictionary per row and maps it the way the repository used to.
+    """
+    dictionary_rows = [dict(zip(COLUMNS, row)) for row in rows]
+    return [
+        DictExpense(
+            expense_id=UUID(row["expense_id"]),
+            trip_id=UUID(row["trip_id"]),
+            expense_date=row["expense_date"],
+            original_amount=float(row["original_amount"]),
+            currency=row["currency"],
+            converted_amount_cop=float(row["converted_amount_cop"]),
+            payment_method=PaymentMethod(row["payment_method"]),
+            expense_type=ExpenseType(row["expense_type"]),
+        )
+        for row in dictionary_rows
+    ]
+
+
+def map_tuple_rows(rows: List[Tuple]) -> list:
+    """
+    Maps tuple rows with the repository's positional mapper.
+    """
+    repository = MySQLExpenseRepository(db_connection=None)
+    return [repository._map_to_expense(row) for row in rows]
+
+
+def measure(mapper: Callable[[List[Tuple]], list], rows: List[Tuple]):
+    """
+    Returns rows per second, peak traced bytes and bytes retained by the result.
+    """
+    started = time.perf_counter()
+    mapper(rows)
+    rows_per_second = len(rows) / (time.perf_counter() - started)
+
+    tracemalloc.start()
+    mapped = mapper(rows)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del mapped
+
+    return rows_per_second, peak, retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    before = measure(map_dictionary_rows, rows)
+    after = measure(map_tuple_rows, rows)
+
+    print(f"rows={args.rows}")
+    print(f"{'':24} {'rows/s':>12} {'peak MiB':>10} {'held MiB':>10}")
+    for label, (rows_per_second, peak, retained) in (
+        ("dict rows (before)", before),
+        ("tuple rows (after)", after),
+    ):
+        print(
+            f"{label:24} {rows_per_second:>12,.0f} "
+            f"{peak / 2**20:>10.1f} {retained / 2**20:>10.1f}"
+        )
+    print(
+        f"throughput x{after[0] / before[0]:.2f}, "
+        f"peak memory -{1 - after[1] / before[1]:.0%}, "
+        f"held memory -{1 - after[2] / before[2]:.0%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Repository backend benchmark: SQLite against MySQL on the same workloads.
+
+Seeds one trip with N expenses spread over 30 days through save_many, then
+times the reads the services issue (lookups by trip and date, keyset pages,
+streaming, rollup totals, report columns) and finally the writes, single
+saves and batches of 100, which grow the data set and so run last. Each case
+reports operations per second per backend.
+
+The SQLite database is a fresh file in a temporary directory. The MySQL
+backend uses the DB_* settings, expects the migrations to be applied and
+leaves its benchmark trip behind, so point DB_NAME at a scratch database; it
+is skipped when the server cannot be reached.
+
+Usage (from the project root):
+    python benchmarks/bench_sqlite_backend.py --sizes 1000 10000
+    python benchmarks/bench_sqlite_backend.py --backends sqlite
+"""
+
+import argparse
+import os
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from bench_core_services import ops_per_second  # noqa: E402
+from core.domain import Expense, Trip  # noqa: E402
+from core.enums import ExpenseType, PaymentMethod  # noqa: E402
+from infrastructure.database import DatabaseConnection  # noqa: E402
+from infrastructure.database import SQLiteConnection  # noqa: E402
+from infrastructure.persistence import create_repositories  # noqa: E402
+
+Case = Tuple[str, Callable[[], object]]
+
+BACKENDS = ("sqlite", "mysql")
+
+
+def build_cases(
+    backend: str, size: int, workdir: str, trip_days: int = 30, seed: int = 7
+) -> List[Case]:
+    """
+    Seeds a new trip with size expenses on the given backend and returns the
+    callables to time.
+    """
+    generator = random.Random(seed)
+    trip_repository, expense_repository = create_repositories(
+        backend,
+        sqlite_connection_factory=lambda: SQLiteConnection(
+            os.path.join(workdir, f"bench-{size}.db")
+        ),
+    )
+
+    start = date(2026, 1, 1)
+    trip = Trip(uuid4(), start, start + timedelta(days=trip_days - 1), True, 1e6, "USD")
+    trip_repository.save(trip)
+
+    expense_types = list(ExpenseType)
+    payment_methods = list(PaymentMethod)
+
+    def make_expense() -> Expense:
+        amount = generator.randrange(100, 50000) / 100
+        return Expense(
+            uuid4(),
+            trip.trip_id,
+            start + timedelta(days=generator.randrange(trip_days)),
+            amount,
+            "USD",
+            amount * 4000,
+            generator.choice(payment_methods),
+            generator.choice(expense_types),
+        )
+
+    for offset in range(0, size, 1000):
+        expense_repository.save_many(
+            [make_expense() for _ in range(min(1000, size - offset))]
+        )
+
+    middle = expense_repository.get_page(trip.trip_id, size // 2)[-1]
+    after = (middle.expense_date, middle.expense_id)
+    mid_trip = start + timedelta(days=trip_days // 2)
+
+    return [
+        ("TripRepository.get_by_id", lambda: trip_repository.get_by_id(trip.trip_id)),
+        (
+            "get_by_trip_and_date",
+            lambda: expense_repository.get_by_trip_and_date(trip.trip_id, mid_trip),
+        ),
+        (
+            "get_page(100, after middle)",
+            lambda: expense_repository.get_page(trip.trip_id, 100, after),
+        ),
+        (
+            "iter_by_trip_id",
+            lambda: sum(1 for _ in expense_repository.iter_by_trip_id(trip.trip_id)),
+        ),
+        (
+            "get_daily_totals",
+            lambda: expense_repository.get_daily_totals(trip.trip_id),
+        ),
+        ("get_type_totals", lambda: expense_repository.get_type_totals(trip.trip_id)),
+        ("get_trip_totals", lambda: expense_repository.get_trip_totals(trip.trip_id)),
+        ("get_columns", lambda: expense_repository.get_columns(trip.trip_id)),
+        # Writes grow the trip, so they run after the cases that read it.
+        ("save", lambda: expense_repository.save(make_expense())),
+        (
+            "save_many(100)",
+            lambda: expense_repository.save_many([make_expense() for _ in range(100)]),
+        ),
+    ]
+
+
+def mysql_unavailable() -> Optional[str]:
+    """
+    Returns why the MySQL backend cannot be benchmarked, or None if it can.
+    """
+    try:
+        with DatabaseConnection().get_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute("SELECT 1 FROM expenses LIMIT 1")
+            cursor.fetchall()
+    except Exception as e:
+        return str(e)
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument(
+        "--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS)
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="seconds to time each case"
+    )
+    args = parser.parse_args()
+
+    backends = list(args.backends)
+    if "mysql" in backends:
+        reason = mysql_unavailable()
+        if reason:
+            print(f"Skipping mysql: {reason}\n")
+            backends.remove("mysql")
+
+    print(
+        f"{'case':<40}"
+        + "".join(f" {backend + ' ops/sec':>18}" for backend in backends)
+    )
+
+    with TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            results: Dict[str, Dict[str, float]] = {}
+            for backend in backends:
+                for name, func in build_cases(backend, size, workdir):
+                    results.setdefault(name, {})[backend] = ops_per_second(
+                        func, args.min_time
+                    )
+
+            for name, by_backend in results.items():
+                print(
+                    f"{name + '@' + str(size):<40}"
+                    + "".join(f" {by_backend[backend]:>18,.0f}" for backend in backends)
+                )
+
+
+if __name__ == "__main__":
+    main()
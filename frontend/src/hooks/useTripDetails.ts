@@ -12,7 +12,7 @@ export function useTripDetails(tripId: string | undefined) {
 
   const fetchExpensesCallback = useCallback(async (id: string) => {
     const response = await serviceContainer.expenseService.getTripExpenses(id);
-    return response.data;
+    return response.data.expenses;
   }, []);
 
   const {
@@ -60,7 +60,7 @@ const TripDetails = () => {
     const fetchExpenses = async () => {
       try {
         const response = await api.getTripExpenses(id);
-        setExpenses(response.data);
+        setExpenses(response.data.expenses);
       } catch (error) {
         console.error("Error fetching expenses:", error);
         toast.error("Failed to load expenses.");
@@ -98,7 +98,7 @@ const TripDetails = () => {
     api
       .addExpense(expenseData)
       .then(() => {
-        api.getTripExpenses(id).then((res) => setExpenses(res.data));
+        api.getTripExpenses(id).then((res) => setExpenses(res.data.expenses));
         toast.success("Expense added successfully!");
         setShowExpenseForm(false);
       })
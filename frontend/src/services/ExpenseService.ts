@@ -1,6 +1,10 @@
 import type { IExpenseService } from "./interfaces/IExpenseService";
 import type { IApiClient } from "./interfaces/IApiClient";
-import type { Expense, CreateExpenseRequest } from "../types/expense";
+import type {
+  Expense,
+  CreateExpenseRequest,
+  ExpenseListResponse,
+} from "../types/expense";
 import type { ApiResponse } from "../types/common";
 
 export class ExpenseService implements IExpenseService {
@@ -25,7 +29,13 @@ export class ExpenseService implements IExpenseService {
     );
   }
 
-  async getTripExpenses(tripId: string): Promise<ApiResponse<Expense[]>> {
-    return this.apiClient.get<ApiResponse<Expense[]>>(`/expenses/${tripId}`);
+  async getTripExpenses(
+    tripId: string,
+    cursor?: string,
+  ): Promise<ApiResponse<ExpenseListResponse>> {
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    return this.apiClient.get<ApiResponse<ExpenseListResponse>>(
+      `/expenses/${tripId}${query}`,
+    );
   }
 }
@@ -21,3 +21,10 @@ export interface CreateExpenseRequest {
   payment_method: PaymentMethod
   expense_type: ExpenseType
 }
+
+export interface ExpenseListResponse {
+  expenses: Expense[]
+  total_amount: number
+  total_count: number
+  next_cursor: string | null
+}
@@ -1,3 +1,6 @@
+from .expense_columns import ExpenseColumns
+from .expense_cursor import ExpenseCursor
 from .expense_dto import ExpenseDTO
+from .expense_page_dto import ExpensePageDTO
 
-__all__ = ["ExpenseDTO"]
+__all__ = ["ExpenseColumns", "ExpenseCursor", "ExpenseDTO", "ExpensePageDTO"]
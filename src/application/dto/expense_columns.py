@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from enum import Enum
+from typing import ClassVar, Iterable, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.enums import ExpenseType, PaymentMethod
+
+
+@dataclass(frozen=True)
+class ExpenseColumns:
+    """
+    Columnar view of the expenses of a trip, one NumPy array per field.
+    Amounts are kept as integer cents so sums are exact, and enums as small integer
+    codes indexing EXPENSE_TYPES and PAYMENT_METHODS, which follow the order of
+    their stored values.
+    """
+
+    EXPENSE_TYPES: ClassVar[Tuple[ExpenseType, ...]] = tuple(
+        sorted(ExpenseType, key=lambda expense_type: expense_type.value)
+    )
+    PAYMENT_METHODS: ClassVar[Tuple[PaymentMethod, ...]] = tuple(
+        sorted(PaymentMethod, key=lambda payment_method: payment_method.value)
+    )
+
+    dates: np.ndarray
+    type_codes: np.ndarray
+    payment_codes: np.ndarray
+    amount_cents: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.amount_cents)
+
+    @classmethod
+    def from_batches(
+        cls,
+        batches: Iterable[
+            Sequence[Tuple[Union[date, str], str, str, Union[Decimal, float]]]
+        ],
+        capacity: int = 1024,
+    ) -> "ExpenseColumns":
+        """
+        Builds the columns from batches of (expense_date, expense_type,
+        payment_method, converted_amount_cop) rows as fetched from the database.
+        Each batch is encoded into NumPy arrays that grow by doubling, so only
+        one batch of row tuples is alive at a time.
+            :param batches: Iterable of row batches, e.g. successive fetchmany results.
+                Dates may be date objects or ISO strings.
+            :param capacity: Initial number of rows the arrays are sized for.
+            :return: The expenses as columns.
+            :raises ValueError: If a row holds an unknown expense type or payment method.
+        """
+        day_numbers = np.empty(capacity, dtype=np.int64)
+        type_codes = np.empty(capacity, dtype=np.int8)
+        payment_codes = np.empty(capacity, dtype=np.int8)
+        amount_cents = np.empty(capacity, dtype=np.int64)
+        size = 0
+
+        for batch in batches:
+            if not batch:
+                continue
+
+            end = size + len(batch)
+            if end > len(amount_cents):
+                new_capacity = max(end, 2 * len(amount_cents))
+                day_numbers = np.resize(day_numbers, new_capacity)
+                type_codes = np.resize(type_codes, new_capacity)
+                payment_codes = np.resize(payment_codes, new_capacity)
+                amount_cents = np.resize(amount_cents, new_capacity)
+
+            dates, expense_types, payment_methods, amounts = zip(*batch)
+            day_numbers[size:end] = np.array(dates, dtype="datetime64[D]").astype(
+                np.int64
+            )
+            type_codes[size:end] = cls._encode(expense_types, cls.EXPENSE_TYPES)
+            payment_codes[size:end] = cls._encode(payment_methods, cls.PAYMENT_METHODS)
+            # DECIMAL(15, 2) amounts are recovered exactly by rounding to the cent.
+            amount_cents[size:end] = np.rint(np.array(amounts, dtype=np.float64) * 100)
+            size = end
+
+        return cls(
+            dates=day_numbers[:size].astype("datetime64[D]"),
+            type_codes=type_codes[:size].copy(),
+            payment_codes=payment_codes[:size].copy(),
+            amount_cents=amount_cents[:size].copy(),
+        )
+
+    @staticmethod
+    def _encode(values: Tuple[str, ...], members: Tuple[Enum, ...]) -> np.ndarray:
+        """
+        Maps stored enum values to their index in members, which is sorted by value.
+            :param values: Stored enum values, one per row.
+            :param members: Enum members ordered by value.
+            :return: Array of integer codes.
+            :raises ValueError: If a value does not belong to the enum.
+        """
+        known = np.array([member.value for member in members])
+        stored = np.array(values, dtype=str)
+        codes = np.searchsorted(known, stored)
+
+        invalid = (codes >= len(known)) | (
+            known[np.minimum(codes, len(known) - 1)] != stored
+        )
+        if invalid.any():
+            raise ValueError(f"Unknown value: {stored[invalid][0]}")
+
+        return codes.astype(np.int8)
@@ -0,0 +1,42 @@
+import base64
+import binascii
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from core.exceptions import InvalidCursorError
+
+
+@dataclass(frozen=True)
+class ExpenseCursor:
+    """
+    Position of the last expense of a page in the (expense_date, expense_id) order.
+    Encoded as an opaque URL-safe token for API clients.
+    """
+
+    expense_date: date
+    expense_id: UUID
+
+    def encode(self) -> str:
+        """
+        Encodes the cursor as an opaque token.
+            :return: URL-safe token representing this position.
+        """
+        raw = f"{self.expense_date.isoformat()}|{self.expense_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "ExpenseCursor":
+        """
+        Decodes a token produced by encode.
+            :param token: Opaque cursor token.
+            :return: The decoded cursor.
+            :raises InvalidCursorError: If the token is malformed.
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode()).decode()
+            expense_date, expense_id = raw.split("|")
+            return cls(date.fromisoformat(expense_date), UUID(expense_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+            raise InvalidCursorError(token) from e
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+from core.domain import Expense
+
+
+@dataclass
+class ExpensePageDTO:
+    """
+    Data Transfer Object for a page of expenses.
+    Carries the expenses of the page, the cursor of the next page and the trip totals.
+    """
+
+    expenses: List[Expense]
+    next_cursor: Optional[str]
+    total_amount: float
+    total_count: int
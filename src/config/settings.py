@@ -28,8 +28,92 @@ class Settings(BaseSettings):
     db_user: str = os.getenv("DB_USER", "root")
     db_password: str = os.getenv("DB_PASSWORD", "password")
 
+    # Repository backend: "mysql", "sqlite" (embedded file) or "memory"
+    # (in-process, nothing persisted)
+    repository_backend: str = os.getenv("REPOSITORY_BACKEND", "mysql")
+
+    # SQLite backend configuration
+    sqlite_path: str = os.getenv("SQLITE_PATH", "travel_expense_tracker.db")
+    # Seconds a statement waits for another writer to release the database.
+    sqlite_busy_timeout_seconds: float = float(
+        os.getenv("SQLITE_BUSY_TIMEOUT_SECONDS", "5")
+    )
+
+    # Connection pool configuration
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_pool_reset_session: bool = (
+        os.getenv("DB_POOL_RESET_SESSION", "true").lower() == "true"
+    )
+    # Connections older than this are reconnected on checkout; 0 disables it.
+    db_pool_max_age_seconds: int = int(os.getenv("DB_POOL_MAX_AGE_SECONDS", "1800"))
+    db_pool_warmup: bool = os.getenv("DB_POOL_WARMUP", "true").lower() == "true"
+    # Checkouts wait in FIFO order for a free connection; when more than
+    # DB_POOL_MAX_WAITERS are already waiting, new checkouts are rejected.
+    db_pool_checkout_timeout_seconds: float = float(
+        os.getenv("DB_POOL_CHECKOUT_TIMEOUT_SECONDS", "5")
+    )
+    db_pool_max_waiters: int = int(os.getenv("DB_POOL_MAX_WAITERS", "32"))
+    # Statements taking at least this long are logged; 0 logs every statement
+    # and a negative value disables the slow-query log.
+    slow_query_threshold_ms: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+
+    # Blocking I/O executor configuration
+    # Keep at or below DB_POOL_SIZE so workers never exhaust the pool. Requests
+    # queue for a worker instead, and once EXECUTOR_MAX_PENDING are queued new
+    # ones are rejected with 503.
+    executor_max_workers: int = int(os.getenv("EXECUTOR_MAX_WORKERS", "5"))
+    executor_max_pending: int = int(os.getenv("EXECUTOR_MAX_PENDING", "32"))
+
     # External API configuration
     api_url: str = os.getenv("API_URL", "")
+    # URL of the rates published on a past date, with a {date} placeholder for
+    # the ISO date; the base currency file name is appended as with API_URL.
+    # Left empty, a past date with no stored rate within RATE_HISTORY_MAX_GAP_DAYS
+    # cannot be converted and raises ConversionError.
+    api_history_url: str = os.getenv("API_HISTORY_URL", "")
+    # The currency API is reached through one pooled keep-alive session.
+    api_connect_timeout_seconds: float = float(
+        os.getenv("API_CONNECT_TIMEOUT_SECONDS", "3")
+    )
+    api_read_timeout_seconds: float = float(os.getenv("API_READ_TIMEOUT_SECONDS", "10"))
+    # Retries on connection errors, timeouts and 5xx answers, with jittered
+    # exponential backoff; 0 disables them.
+    api_max_retries: int = int(os.getenv("API_MAX_RETRIES", "3"))
+    api_retry_backoff_seconds: float = float(
+        os.getenv("API_RETRY_BACKOFF_SECONDS", "0.25")
+    )
+    # Connections kept open to the API host; extra requests wait for one.
+    api_pool_maxsize: int = int(os.getenv("API_POOL_MAXSIZE", "10"))
+
+    # Exchange-rate cache configuration
+    rate_cache_enabled: bool = os.getenv("RATE_CACHE_ENABLED", "true").lower() == "true"
+    rate_cache_ttl_seconds: int = int(os.getenv("RATE_CACHE_TTL_SECONDS", "3600"))
+    rate_cache_max_entries: int = int(os.getenv("RATE_CACHE_MAX_ENTRIES", "32"))
+    # The API preloads the rate tables of the currencies of active trips at
+    # startup and reloads them on this interval. Keep it below
+    # RATE_CACHE_TTL_SECONDS, after which preloaded tables are no longer used.
+    rate_refresh_enabled: bool = (
+        os.getenv("RATE_REFRESH_ENABLED", "true").lower() == "true"
+    )
+    rate_refresh_interval_seconds: int = int(
+        os.getenv("RATE_REFRESH_INTERVAL_SECONDS", "900")
+    )
+
+    # Historical rates are kept in the repository backend. A stored rate up to
+    # this many days older than the requested date is used as is, which covers
+    # days with no published rates.
+    rate_history_max_gap_days: int = int(os.getenv("RATE_HISTORY_MAX_GAP_DAYS", "3"))
+
+    # Trip cache configuration
+    trip_cache_enabled: bool = os.getenv("TRIP_CACHE_ENABLED", "true").lower() == "true"
+    trip_cache_ttl_seconds: int = int(os.getenv("TRIP_CACHE_TTL_SECONDS", "300"))
+    trip_cache_max_entries: int = int(os.getenv("TRIP_CACHE_MAX_ENTRIES", "1024"))
+
+    # Report engine: "sql" aggregates in the database, "columnar" with NumPy
+    report_engine: str = os.getenv("REPORT_ENGINE", "sql")
+
+    # Metrics configuration: exposes /metrics in the Prometheus text format
+    metrics_enabled: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
 
     # CORS configuration
     cors_origins: list = ["*"]
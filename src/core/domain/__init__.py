@@ -1,4 +1,5 @@
+from .exchange_rate import ExchangeRate
 from .expense import Expense
 from .trip import Trip
 
-__all__ = ["Trip", "Expense"]
+__all__ = ["Trip", "Expense", "ExchangeRate"]
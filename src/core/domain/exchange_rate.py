@@ -0,0 +1,58 @@
+from datetime import date
+
+
+class ExchangeRate:
+    """
+    Represents the rate published on a date to convert one unit of a base
+    currency into a target currency. Currency codes are kept uppercase.
+    Uses __slots__ so the bulk-loaded rate tables stay compact.
+    """
+
+    __slots__ = ("_rate_date", "_base_currency", "_target_currency", "_rate")
+
+    def __init__(
+        self, rate_date: date, base_currency: str, target_currency: str, rate: float
+    ):
+        """
+        Initializes an ExchangeRate instance.
+            :param rate_date: Date the rate was published for.
+            :param base_currency: Currency code converted from (e.g., 'USD').
+            :param target_currency: Currency code converted into (e.g., 'COP').
+            :param rate: Units of the target currency per unit of the base one.
+        """
+        self._rate_date: date = rate_date
+        self._base_currency: str = base_currency.upper()
+        self._target_currency: str = target_currency.upper()
+        self._rate: float = rate
+
+    @property
+    def rate_date(self) -> date:
+        """
+        Returns the date the rate was published for.
+            :return: Rate date as a date object.
+        """
+        return self._rate_date
+
+    @property
+    def base_currency(self) -> str:
+        """
+        Returns the currency converted from.
+            :return: Uppercase currency code.
+        """
+        return self._base_currency
+
+    @property
+    def target_currency(self) -> str:
+        """
+        Returns the currency converted into.
+            :return: Uppercase currency code.
+        """
+        return self._target_currency
+
+    @property
+    def rate(self) -> float:
+        """
+        Returns the units of the target currency per unit of the base one.
+            :return: Rate as a float.
+        """
+        return self._rate
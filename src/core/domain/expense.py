@@ -8,8 +8,21 @@ class Expense:
     """
     Represents an expense incurred during a trip,
     including details such as date, amount, currency, and type.
+    Uses __slots__ so each instance carries no per-instance __dict__,
+    which matters when a trip loads tens of thousands of expenses.
     """
 
+    __slots__ = (
+        "_expense_id",
+        "_trip_id",
+        "_expense_date",
+        "_original_amount",
+        "_currency",
+        "_converted_amount_cop",
+        "_payment_method",
+        "_expense_type",
+    )
+
     def __init__(
         self,
         expense_id: UUID,
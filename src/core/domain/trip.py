@@ -5,8 +5,20 @@ from uuid import UUID
 class Trip:
     """
     Represents a trip with details such as start and end dates, budget, and currency.
+    Uses __slots__ so each instance carries no per-instance __dict__;
+    __weakref__ keeps trips usable in weak identity maps.
     """
 
+    __slots__ = (
+        "_trip_id",
+        "_start_date",
+        "_end_date",
+        "_is_international",
+        "_daily_budget",
+        "_currency",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         trip_id: UUID,
@@ -1,4 +1,5 @@
 from .inactive_trip_error import InactiveTripError
+from .invalid_cursor_error import InvalidCursorError
 from .trip_not_found_error import TripNotFoundError
 
-__all__ = ["InactiveTripError", "TripNotFoundError"]
+__all__ = ["InactiveTripError", "InvalidCursorError", "TripNotFoundError"]
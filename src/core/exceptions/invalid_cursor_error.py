@@ -0,0 +1,10 @@
+class InvalidCursorError(ValueError):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, cursor: str) -> None:
+        """
+        Initializes the InvalidCursorError with the rejected cursor.
+            :param cursor: The malformed cursor token.
+        """
+        self.cursor: str = cursor
+        super().__init__(f"Invalid cursor: {cursor}")
@@ -1,4 +1,6 @@
 from abc import ABCMeta, abstractmethod
+from datetime import date
+from typing import List, Optional, Sequence
 
 
 class CurrencyConverter(metaclass=ABCMeta):
@@ -16,7 +18,12 @@ class CurrencyConverter(metaclass=ABCMeta):
         """
         return all(
             (hasattr(subclass, method) and callable(getattr(subclass, method)))
-            for method in ["convert"]
+            for method in [
+                "convert",
+                "convert_on",
+                "convert_many",
+                "convert_mixed",
+            ]
         )
 
     @abstractmethod
@@ -29,3 +36,57 @@ class CurrencyConverter(metaclass=ABCMeta):
             :return: The converted amount in the target currency.
         """
         raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def convert_on(
+        self, amount: float, from_currency: str, to_currency: str, on_date: date
+    ) -> float:
+        """
+        Converts an amount with the exchange rate in effect on a given date.
+            :param amount: The amount of money to convert.
+            :param from_currency: The currency code of the original amount (e.g., 'USD').
+            :param to_currency: The currency code to convert the amount into (e.g., 'EUR').
+            :param on_date: Date whose exchange rate is applied.
+            :return: The converted amount in the target currency.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def convert_many(
+        self,
+        amounts: Sequence[float],
+        from_currency: str,
+        to_currency: str,
+        on_date: Optional[date] = None,
+    ) -> List[float]:
+        """
+        Converts several amounts from one currency to another, resolving the
+        exchange rate once for the whole batch.
+            :param amounts: The amounts of money to convert.
+            :param from_currency: The currency code of every amount (e.g., 'USD').
+            :param to_currency: The currency code to convert the amounts into (e.g., 'EUR').
+            :param on_date: Date whose exchange rate is applied; the latest
+                rate when omitted.
+            :return: The converted amounts, in the order given.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def convert_mixed(
+        self,
+        amounts: Sequence[float],
+        from_currencies: Sequence[str],
+        to_currency: str,
+        on_dates: Optional[Sequence[date]] = None,
+    ) -> List[float]:
+        """
+        Converts amounts in different currencies into one currency, resolving
+        each distinct exchange rate once for the whole batch.
+            :param amounts: The amounts of money to convert.
+            :param from_currencies: The currency code of each amount.
+            :param to_currency: The currency code to convert the amounts into.
+            :param on_dates: Date whose exchange rate applies to each amount;
+                the latest rates when omitted.
+            :return: The converted amounts, in the order given.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
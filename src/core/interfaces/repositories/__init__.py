@@ -1,4 +1,5 @@
+from .exchange_rate_repository import ExchangeRateRepository
 from .expense_repository import ExpenseRepository
 from .trip_respository import TripRepository
 
-__all__ = ["TripRepository", "ExpenseRepository"]
+__all__ = ["TripRepository", "ExpenseRepository", "ExchangeRateRepository"]
@@ -0,0 +1,47 @@
+from abc import ABCMeta, abstractmethod
+from datetime import date
+from typing import List, Optional
+
+from core.domain import ExchangeRate
+
+
+class ExchangeRateRepository(metaclass=ABCMeta):
+    """
+    Abstract base class for the historical exchange-rate store.
+    Rates are keyed by (base currency, target currency, date) and are written
+    in bulk, one published table at a time.
+    """
+
+    @classmethod
+    def __subclasshook__(cls, subclass: type, /) -> bool:
+        """
+        Checks if a subclass is a valid ExchangeRateRepository.
+            :param subclass: The class to check.
+            :return: True if subclass implements all abstract methods, False otherwise.
+        """
+        return all(
+            (hasattr(subclass, method) and callable(getattr(subclass, method)))
+            for method in ["save_many", "get_rate"]
+        )
+
+    @abstractmethod
+    def save_many(self, rates: List[ExchangeRate]) -> None:
+        """
+        Saves several rates at once, replacing any stored for the same
+        currencies and date.
+            :param rates: ExchangeRate objects to be saved.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_rate(
+        self, base_currency: str, target_currency: str, on_date: date
+    ) -> Optional[ExchangeRate]:
+        """
+        Retrieves the most recent rate published on or before a date.
+            :param base_currency: Currency code converted from.
+            :param target_currency: Currency code converted into.
+            :param on_date: Date the rate is needed for.
+            :return: The rate, or None if none was stored up to that date.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
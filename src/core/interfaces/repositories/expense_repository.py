@@ -1,9 +1,12 @@
 from abc import ABCMeta, abstractmethod
 from datetime import date
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
+from application.dto import ExpenseColumns
 from core.domain import Expense
+from core.enums import ExpenseType
+
 
 class ExpenseRepository(metaclass=ABCMeta):
     """
@@ -20,7 +23,20 @@ class ExpenseRepository(metaclass=ABCMeta):
         """
         return all(
             (hasattr(subclass, method) and callable(getattr(subclass, method)))
-            for method in ["save", "get_by_trip_id", "get_by_trip_and_date"]
+            for method in [
+                "save",
+                "save_many",
+                "get_by_trip_id",
+                "iter_by_trip_id",
+                "get_by_trip_and_date",
+                "get_page",
+                "get_columns",
+                "get_daily_total",
+                "get_daily_totals",
+                "get_type_totals",
+                "get_trip_totals",
+                "get_total_amount",
+            ]
         )
 
     @abstractmethod
@@ -31,6 +47,14 @@ class ExpenseRepository(metaclass=ABCMeta):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    @abstractmethod
+    def save_many(self, expenses: List[Expense]) -> None:
+        """
+        Saves several expenses to the repository in a single transaction.
+            :param expenses: The expense objects to be saved.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
     @abstractmethod
     def get_by_trip_id(self, trip_id: UUID) -> List[Expense]:
         """
@@ -40,6 +64,19 @@ class ExpenseRepository(metaclass=ABCMeta):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    @abstractmethod
+    def iter_by_trip_id(
+        self, trip_id: UUID, batch_size: int = 1000
+    ) -> Iterator[Expense]:
+        """
+        Lazily iterates over all expenses for a specific trip, ordered by date,
+        without holding the whole result in memory.
+            :param trip_id: Unique identifier for the trip.
+            :param batch_size: Number of rows fetched from the storage at a time.
+            :return: Iterator of Expense objects for the given trip_id.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
     @abstractmethod
     def get_by_trip_and_date(self, trip_id: UUID, expense_date: date) -> List[Expense]:
         """
@@ -49,3 +86,77 @@ class ExpenseRepository(metaclass=ABCMeta):
             :return: Expense object corresponding to the given trip_id and date.
         """
         raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_page(
+        self,
+        trip_id: UUID,
+        limit: int,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> List[Expense]:
+        """
+        Retrieves a page of expenses for a trip ordered by date and expense ID.
+            :param trip_id: Unique identifier for the trip.
+            :param limit: Maximum number of expenses to return.
+            :param after: (expense_date, expense_id) of the last expense already seen.
+                Starts from the first expense when omitted.
+            :return: List of Expense objects following the given position.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_columns(self, trip_id: UUID, batch_size: int = 10000) -> ExpenseColumns:
+        """
+        Loads the date, type, payment method and COP amount of every expense
+        of a trip into columnar arrays, without building Expense objects.
+            :param trip_id: Unique identifier for the trip.
+            :param batch_size: Number of rows fetched from the storage at a time.
+            :return: The expenses of the trip as columns.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_daily_total(self, trip_id: UUID, expense_date: date) -> float:
+        """
+        Retrieves the total converted amount spent on a trip on a given date.
+            :param trip_id: Unique identifier for the trip.
+            :param expense_date: Date of the expenses.
+            :return: Total amount in COP for that trip and date.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_daily_totals(self, trip_id: UUID) -> Dict[date, Dict[str, float]]:
+        """
+        Retrieves the spend of a trip per date, split by payment method.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with dates as keys and cash, card and total as values.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_type_totals(self, trip_id: UUID) -> Dict[ExpenseType, Dict[str, float]]:
+        """
+        Retrieves the spend of a trip per expense type, split by payment method.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with expense types as keys and cash, card and total
+                as values.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_trip_totals(self, trip_id: UUID) -> Dict[str, float]:
+        """
+        Retrieves the overall spend and number of expenses of a trip.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with total (amount in COP) and count.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_total_amount(self) -> float:
+        """
+        Retrieves the sum of the converted amounts of every stored expense.
+            :return: Total amount in COP across all trips.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
@@ -1,5 +1,6 @@
 from abc import ABCMeta, abstractmethod
-from typing import List
+from datetime import date
+from typing import Dict, List
 from uuid import UUID
 
 from core.domain import Trip
@@ -20,7 +21,13 @@ class TripRepository(metaclass=ABCMeta):
         """
         return all(
             (hasattr(subclass, method) and callable(getattr(subclass, method)))
-            for method in ["save", "get_by_id", "get_all"]
+            for method in [
+                "save",
+                "get_by_id",
+                "get_all",
+                "get_dashboard_totals",
+                "get_active_currencies",
+            ]
         )
 
     @abstractmethod
@@ -47,3 +54,21 @@ class TripRepository(metaclass=ABCMeta):
             :return: A list of all Trip objects.
         """
         raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_dashboard_totals(self, reference_date: date) -> Dict[str, int]:
+        """
+        Aggregates trip statistics for the dashboard in a single pass.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Dictionary with total_trips, active_trips and total_days.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
+
+    @abstractmethod
+    def get_active_currencies(self, reference_date: date) -> List[str]:
+        """
+        Lists the distinct currencies of the trips active on a date.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Sorted list of currency codes.
+        """
+        raise NotImplementedError("Subclasses must implement this method")
@@ -1,5 +1,6 @@
+from .columnar_report_service import ColumnarReportService
 from .expense_manager import ExpenseManager
 from .report_service import ReportService
 from .trip_service import TripService
 
-__all__ = ["ExpenseManager", "ReportService", "TripService"]
+__all__ = ["ColumnarReportService", "ExpenseManager", "ReportService", "TripService"]
@@ -0,0 +1,113 @@
+from datetime import date
+from typing import Dict
+from uuid import UUID
+
+import numpy as np
+
+from application.dto import ExpenseColumns
+from core.enums import ExpenseType, PaymentMethod
+from core.services.report_service import ReportService
+
+
+class ColumnarReportService(ReportService):
+    """
+    Report engine that aggregates expenses as NumPy columns.
+    Loads the date, type, payment method and amount of every expense of a trip
+    into arrays and groups them with vectorized operations, producing the same
+    reports as ReportService without relying on pre-aggregated queries.
+    Amounts are summed as integer cents, so totals match the database sums exactly.
+    """
+
+    _CASH_CODE: int = ExpenseColumns.PAYMENT_METHODS.index(PaymentMethod.CASH)
+
+    def generate_daily_expense_report(
+        self, trip_id: UUID
+    ) -> Dict[date, Dict[str, float]]:
+        """
+        Generates a daily expense report for a trip.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with dates as keys and payment method breakdown as values.
+        """
+        columns = self._expense_repository.get_columns(trip_id)
+        if len(columns) == 0:
+            return {}
+
+        day_numbers = columns.dates.astype(np.int64)
+        first_day = int(day_numbers.min())
+        day_index = day_numbers - first_day
+        is_cash = columns.payment_codes == self._CASH_CODE
+
+        day_sizes = np.bincount(day_index)
+        total_cents = np.zeros(len(day_sizes), dtype=np.int64)
+        cash_cents = np.zeros(len(day_sizes), dtype=np.int64)
+        np.add.at(total_cents, day_index, columns.amount_cents)
+        np.add.at(cash_cents, day_index[is_cash], columns.amount_cents[is_cash])
+
+        present = np.flatnonzero(day_sizes)
+        days = (present + first_day).astype("datetime64[D]")
+        total_cents = total_cents[present]
+        cash_cents = cash_cents[present]
+        card_cents = total_cents - cash_cents
+
+        return {
+            expense_date: {
+                "cash": cash / 100,
+                "card": card / 100,
+                "total": total / 100,
+            }
+            for expense_date, cash, card, total in zip(
+                days.tolist(),
+                cash_cents.tolist(),
+                card_cents.tolist(),
+                total_cents.tolist(),
+            )
+        }
+
+    def generate_expense_type_report(
+        self, trip_id: UUID
+    ) -> Dict[ExpenseType, Dict[str, float]]:
+        """
+        Generates a report of expenses categorized by type for a trip.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with expense types as keys and payment method breakdown as values.
+        """
+        columns = self._expense_repository.get_columns(trip_id)
+        method_count = len(ExpenseColumns.PAYMENT_METHODS)
+        group_count = len(ExpenseColumns.EXPENSE_TYPES) * method_count
+
+        groups = columns.type_codes.astype(np.intp) * method_count
+        groups += columns.payment_codes
+        group_sizes = np.bincount(groups, minlength=group_count)
+        group_cents = np.zeros(group_count, dtype=np.int64)
+        np.add.at(group_cents, groups, columns.amount_cents)
+
+        type_totals: Dict[ExpenseType, Dict[str, float]] = {}
+        group_cents_list = group_cents.tolist()
+        for group in np.flatnonzero(group_sizes).tolist():
+            expense_type = ExpenseColumns.EXPENSE_TYPES[group // method_count]
+            amount = group_cents_list[group] / 100
+            entry = type_totals.setdefault(
+                expense_type, {"cash": 0.0, "card": 0.0, "total": 0.0}
+            )
+
+            if group % method_count == self._CASH_CODE:
+                entry["cash"] += amount
+            else:
+                entry["card"] += amount
+
+            entry["total"] += amount
+
+        return type_totals
+
+    def get_trip_summary(self, trip_id: UUID) -> Dict[str, float]:
+        """
+        Generates a summary of expenses for a trip, including total expenses,
+        total budget, remaining budget, trip days, and average daily expense.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary containing summary statistics for the trip.
+        """
+        trip = self._trip_repository.get_by_id(trip_id)
+        columns = self._expense_repository.get_columns(trip_id)
+        total_expenses = int(columns.amount_cents.sum()) / 100
+
+        return self._build_trip_summary(trip, total_expenses)
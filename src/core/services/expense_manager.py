@@ -1,8 +1,10 @@
 from datetime import date
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple
 from uuid import UUID, uuid4
 
-from application.dto import ExpenseDTO
-from core.domain import Expense
+from application.dto import ExpenseCursor, ExpenseDTO, ExpensePageDTO
+from core.domain import Expense, Trip
 from core.exceptions import InactiveTripError
 from core.interfaces import CurrencyConverter
 from core.interfaces.repositories import ExpenseRepository, TripRepository
@@ -53,8 +55,8 @@ class ExpenseManager:
         )
 
         if trip.is_international:
-            converted_amount = self._currency_converter.convert(
-                expense_dto.amount, trip.currency, "COP"
+            converted_amount = self._currency_converter.convert_on(
+                expense_dto.amount, trip.currency, "COP", expense_dto.expense_date
             )
             expense.converted_amount_cop = converted_amount
         else:
@@ -77,13 +79,89 @@ class ExpenseManager:
         if not trip or not trip.is_active():
             raise InactiveTripError()
 
-        daily_budget = trip.daily_budget
-        expenses = self._expense_repository.get_by_trip_and_date(trip_id, expense_date)
+        return self._daily_difference(trip, expense_date)
 
-        total_expenses = sum(expense.converted_amount_cop for expense in expenses)
-        daily_difference = daily_budget - total_expenses
+    def register_expenses(
+        self, expense_dtos: List[ExpenseDTO]
+    ) -> Dict[Tuple[UUID, date], float]:
+        """
+        Registers several expenses at once and calculates the daily budget
+        difference of every affected trip and date.
+        Each distinct trip is looked up once, international amounts are
+        converted in one batch that resolves each currency and expense date
+        once, and all expenses are written in a single batched insert.
+            :param expense_dtos: Data Transfer Objects containing expense details.
+            :return: Daily budget difference keyed by (trip_id, expense_date),
+                in the order the dates first appear in the batch.
+            Raises:
+            InactiveTripError: If any trip in the batch is not active.
+        """
+        trips: Dict[UUID, Trip] = {}
+        for expense_dto in expense_dtos:
+            if expense_dto.trip_id not in trips:
+                trip = self._trip_repository.get_by_id(expense_dto.trip_id)
+
+                if trip and not trip.is_active():
+                    raise InactiveTripError()
+
+                trips[expense_dto.trip_id] = trip
+
+        international = [
+            position
+            for position, expense_dto in enumerate(expense_dtos)
+            if trips[expense_dto.trip_id].is_international
+        ]
+        converted_amounts = [expense_dto.amount for expense_dto in expense_dtos]
+        if international:
+            converted = self._currency_converter.convert_mixed(
+                [expense_dtos[position].amount for position in international],
+                [
+                    trips[expense_dtos[position].trip_id].currency
+                    for position in international
+                ],
+                "COP",
+                [expense_dtos[position].expense_date for position in international],
+            )
+            for position, amount in zip(international, converted):
+                converted_amounts[position] = amount
+
+        expenses: List[Expense] = []
+        for expense_dto, converted_amount in zip(expense_dtos, converted_amounts):
+            expense = Expense(
+                expense_id=uuid4(),
+                trip_id=expense_dto.trip_id,
+                expense_date=expense_dto.expense_date,
+                original_amount=expense_dto.amount,
+                payment_method=expense_dto.payment_method,
+                expense_type=expense_dto.expense_type,
+                converted_amount_cop=converted_amount,
+            )
+            expenses.append(expense)
+
+        self._expense_repository.save_many(expenses)
+
+        daily_differences: Dict[Tuple[UUID, date], float] = {}
+        for expense in expenses:
+            key = (expense.trip_id, expense.expense_date)
+            if key not in daily_differences:
+                daily_differences[key] = self._daily_difference(
+                    trips[expense.trip_id], expense.expense_date
+                )
+
+        return daily_differences
+
+    def _daily_difference(self, trip: Trip, expense_date: date) -> float:
+        """
+        Calculates the daily budget difference for an already loaded trip.
+            :param trip: Trip whose daily budget is compared.
+            :param expense_date: Date for which to calculate the difference.
+            :return: The difference between the daily budget and total expenses for that date.
+        """
+        total_expenses = self._expense_repository.get_daily_total(
+            trip.trip_id, expense_date
+        )
 
-        return daily_difference
+        return trip.daily_budget - total_expenses
 
     def get_expenses_by_trip_id(self, trip_id: UUID) -> list[Expense]:
         """
@@ -92,3 +170,61 @@ class ExpenseManager:
             :return: List of Expense objects for the specified trip.
         """
         return self._expense_repository.get_by_trip_id(trip_id)
+
+    def iter_expenses_by_trip_id(self, trip_id: UUID) -> Iterator[Expense]:
+        """
+        Lazily iterates over all expenses of a trip, ordered by date.
+        The trip is validated and the first page of expenses is read
+        immediately, so connection and query errors are raised here rather
+        than while the iterator is consumed; later pages are read as it is.
+            :param trip_id: Unique identifier for the trip.
+            :return: Iterator of Expense objects for the specified trip.
+            :raises TripNotFoundError: If the trip does not exist.
+            :raises RuntimeError: If the first page cannot be read.
+        """
+        self._trip_repository.get_by_id(trip_id)
+
+        expenses = self._expense_repository.iter_by_trip_id(trip_id)
+        first_expense = next(expenses, None)
+        if first_expense is None:
+            return iter(())
+
+        return chain((first_expense,), expenses)
+
+    def get_expenses_page(
+        self, trip_id: UUID, limit: int, cursor: Optional[str] = None
+    ) -> ExpensePageDTO:
+        """
+        Retrieves one page of the expenses of a trip, ordered by date.
+            :param trip_id: Unique identifier for the trip.
+            :param limit: Maximum number of expenses in the page.
+            :param cursor: Opaque cursor returned with the previous page, if any.
+            :return: The page of expenses with the next cursor and the trip totals.
+            :raises InvalidCursorError: If the cursor is malformed.
+            :raises TripNotFoundError: If the trip does not exist.
+        """
+        after = None
+        if cursor:
+            decoded = ExpenseCursor.decode(cursor)
+            after = (decoded.expense_date, decoded.expense_id)
+
+        self._trip_repository.get_by_id(trip_id)
+
+        expenses = self._expense_repository.get_page(trip_id, limit + 1, after)
+
+        next_cursor = None
+        if len(expenses) > limit:
+            expenses = expenses[:limit]
+            last_expense = expenses[-1]
+            next_cursor = ExpenseCursor(
+                last_expense.expense_date, last_expense.expense_id
+            ).encode()
+
+        trip_totals = self._expense_repository.get_trip_totals(trip_id)
+
+        return ExpensePageDTO(
+            expenses=expenses,
+            next_cursor=next_cursor,
+            total_amount=trip_totals["total"],
+            total_count=trip_totals["count"],
+        )
@@ -1,9 +1,9 @@
-from collections import defaultdict
 from datetime import date
 from typing import Dict
 from uuid import UUID
 
-from core.enums import ExpenseType, PaymentMethod
+from core.domain import Trip
+from core.enums import ExpenseType
 from core.interfaces.repositories import ExpenseRepository, TripRepository
 
 
@@ -33,21 +33,7 @@ class ReportService:
             :param trip_id: Unique identifier for the trip.
             :return: Dictionary with dates as keys and payment method breakdown as values.
         """
-        expenses = self._expense_repository.get_by_trip_id(trip_id)
-        daily_report = defaultdict(lambda: {"cash": 0.0, "card": 0.0, "total": 0.0})
-
-        for expense in expenses:
-            expense_date = expense.expense_date
-            amount = expense.converted_amount_cop
-
-            if expense.payment_method == PaymentMethod.CASH:
-                daily_report[expense_date]["cash"] += amount
-            else:
-                daily_report[expense_date]["card"] += amount
-
-            daily_report[expense_date]["total"] += amount
-
-        return dict(daily_report)
+        return self._expense_repository.get_daily_totals(trip_id)
 
     def generate_expense_type_report(
         self, trip_id: UUID
@@ -57,21 +43,7 @@ class ReportService:
             :param trip_id: Unique identifier for the trip.
             :return: Dictionary with expense types as keys and payment method breakdown as values.
         """
-        expenses = self._expense_repository.get_by_trip_id(trip_id)
-        type_report = defaultdict(lambda: {"cash": 0.0, "card": 0.0, "total": 0.0})
-
-        for expense in expenses:
-            expense_type = expense.expense_type
-            amount = expense.converted_amount_cop
-
-            if expense.payment_method == PaymentMethod.CASH:
-                type_report[expense_type]["cash"] += amount
-            else:
-                type_report[expense_type]["card"] += amount
-
-            type_report[expense_type]["total"] += amount
-
-        return dict(type_report)
+        return self._expense_repository.get_type_totals(trip_id)
 
     def get_trip_summary(self, trip_id: UUID) -> Dict[str, float]:
         """
@@ -81,9 +53,18 @@ class ReportService:
             :return: Dictionary containing summary statistics for the trip.
         """
         trip = self._trip_repository.get_by_id(trip_id)
-        expenses = self._expense_repository.get_by_trip_id(trip_id)
+        total_expenses = self._expense_repository.get_trip_totals(trip_id)["total"]
 
-        total_expenses = sum(expense.converted_amount_cop for expense in expenses)
+        return self._build_trip_summary(trip, total_expenses)
+
+    @staticmethod
+    def _build_trip_summary(trip: Trip, total_expenses: float) -> Dict[str, float]:
+        """
+        Builds the summary statistics of a trip from its total spend.
+            :param trip: The trip being summarized.
+            :param total_expenses: Total spent on the trip in COP.
+            :return: Dictionary containing summary statistics for the trip.
+        """
         trip_days = (trip.end_date - trip.start_date).days + 1
         total_budget = trip.daily_budget * trip_days
 
@@ -94,3 +75,25 @@ class ReportService:
             "trip_days": trip_days,
             "average_daily_expense": total_expenses / trip_days if trip_days > 0 else 0,
         }
+
+    def get_dashboard_summary(self) -> Dict[str, float]:
+        """
+        Generates the dashboard statistics across all trips, including total trips,
+        active trips, total expenses, trip days, and average daily expense.
+        Aggregation is delegated to the repositories so the number of queries
+        does not grow with the number of trips.
+            :return: Dictionary containing dashboard statistics.
+        """
+        trip_totals = self._trip_repository.get_dashboard_totals(date.today())
+        total_expenses = self._expense_repository.get_total_amount()
+        total_days = trip_totals["total_days"]
+
+        return {
+            "total_trips": trip_totals["total_trips"],
+            "active_trips": trip_totals["active_trips"],
+            "total_expenses": total_expenses,
+            "total_days": total_days,
+            "average_daily_expense": (
+                total_expenses / total_days if total_days > 0 else 0
+            ),
+        }
@@ -0,0 +1,3 @@
+from .ttl_lru_cache import TTLLRUCache
+
+__all__ = ["TTLLRUCache"]
@@ -0,0 +1,105 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLLRUCache:
+    """
+    Thread-safe in-process cache with a time-to-live per entry and
+    least-recently-used eviction once the maximum number of entries is reached.
+    Keeps hit, miss and eviction counters for observability.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the cache.
+            :param max_entries: Maximum number of entries kept before evicting.
+            :param ttl_seconds: Seconds an entry stays valid after being stored.
+            :param clock: Monotonic time source, injectable for testing.
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries must be greater than zero")
+
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than zero")
+
+        self._max_entries: int = max_entries
+        self._ttl_seconds: float = ttl_seconds
+        self._clock: Callable[[], float] = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock: Lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Retrieves a value from the cache if present and not expired.
+            :param key: Key of the entry.
+            :return: The cached value, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Stores a value, evicting the least recently used entry if the cache is full.
+            :param key: Key of the entry.
+            :param value: Value to store.
+        """
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes an entry from the cache if present.
+            :param key: Key of the entry to remove.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry from the cache, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the cache counters.
+            :return: Dictionary with hits, misses, evictions, size and hit_rate.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "hit_rate": self._hits / lookups if lookups > 0 else 0.0,
+            }
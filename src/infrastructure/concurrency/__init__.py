@@ -0,0 +1,4 @@
+from .bounded_executor import BoundedExecutor
+from .single_flight import SingleFlight
+
+__all__ = ["BoundedExecutor", "SingleFlight"]
@@ -0,0 +1,113 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Optional, TypeVar
+
+from infrastructure.exceptions import PoolExhaustedError
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Runs blocking callables (database queries, HTTP requests) on a bounded pool
+    of worker threads so that coroutines can await them without stalling
+    the event loop. Calls that find every worker busy wait in a bounded
+    queue; once it is full, further calls are rejected at once instead of
+    piling up behind the workers.
+    """
+
+    def __init__(
+        self, max_workers: int, max_pending: int, retry_after: int = 1
+    ) -> None:
+        """
+        Initializes the executor.
+            :param max_workers: Maximum number of blocking calls running at once.
+            :param max_pending: Maximum number of calls waiting for a worker.
+            :param retry_after: Seconds a rejected caller is told to wait.
+            :raises ValueError: If max_workers is not positive or max_pending
+                is negative.
+        """
+        if max_workers <= 0:
+            raise ValueError("max_workers must be greater than zero")
+
+        if max_pending < 0:
+            raise ValueError("max_pending must not be negative")
+
+        self._max_workers: int = max_workers
+        self._max_pending: int = max_pending
+        self._retry_after: int = retry_after
+        self._lock: Lock = Lock()
+        self._in_flight: int = 0
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="blocking-io"
+        )
+
+    @property
+    def max_workers(self) -> int:
+        """
+        Returns the maximum number of concurrent blocking calls.
+            :return: Number of worker threads.
+        """
+        return self._max_workers
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Returns the number of calls running or waiting for a worker.
+            :return: Number of accepted calls that have not finished.
+        """
+        with self._lock:
+            return self._in_flight
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Runs a blocking callable on a worker thread and awaits its result.
+        The caller's context variables are propagated to the worker thread.
+            :param func: Blocking callable to run.
+            :param args: Positional arguments for the callable.
+            :param kwargs: Keyword arguments for the callable.
+            :return: The value returned by the callable.
+            :raises PoolExhaustedError: If every worker is busy and the wait
+                queue is full.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+
+        self._reserve()
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self._release()
+            raise
+
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _reserve(self) -> None:
+        """
+        Takes a slot for a new call, counting both running and queued calls.
+            :raises PoolExhaustedError: If no slot is left.
+        """
+        with self._lock:
+            if self._in_flight >= self._max_workers + self._max_pending:
+                raise PoolExhaustedError(
+                    "Too many blocking calls waiting for a worker thread",
+                    self._retry_after,
+                )
+            self._in_flight += 1
+
+    def _release(self, future: Optional[Future] = None) -> None:
+        """
+        Frees the slot of a call once it finishes or is cancelled.
+            :param future: The finished future, passed by add_done_callback.
+        """
+        with self._lock:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        """Waits for running calls to finish and releases the worker threads."""
+        self._executor.shutdown(wait=True)
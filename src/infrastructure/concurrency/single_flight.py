@@ -0,0 +1,89 @@
+from threading import Event, Lock
+from typing import Callable, Dict, Generic, Hashable, Optional, TypeVar
+
+from infrastructure.monitoring import SINGLE_FLIGHT_CALLS
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """A call in flight, shared by the caller running it and those waiting."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done: Event = Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls made from threads. While a call for a key
+    is running, other calls for the same key wait for it and get its result,
+    or its exception, instead of running again. Nothing is cached: the next
+    call after it finishes runs again.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Initializes the group.
+            :param name: Group name, used as the label of the call metrics.
+        """
+        self._name = name
+        self._lock = Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executed = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the call counters of the group.
+            :return: Dictionary with executed, coalesced and in_flight.
+        """
+        with self._lock:
+            return {
+                "executed": self._executed,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        Runs func, unless a call for the same key is already running, in which
+        case waits for that one and returns its result.
+            :param key: Identifies calls that can share a result.
+            :param func: Callable producing the result.
+            :return: The value returned by func, here or in the running call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self._executed += 1
+                leader = True
+            else:
+                self._coalesced += 1
+                leader = False
+
+        if not leader:
+            SINGLE_FLIGHT_CALLS.inc(group=self._name, outcome="coalesced")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        SINGLE_FLIGHT_CALLS.inc(group=self._name, outcome="executed")
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
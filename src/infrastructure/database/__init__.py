@@ -1,3 +1,16 @@
 from .connection import DatabaseConnection
+from .pool_stats import PoolStats
+from .query_instrumentation import (InstrumentedConnection, InstrumentedCursor,
+                                    QueryCounter, QueryRecord, track_queries)
+from .sqlite_connection import SQLiteConnection
 
-__all__ = ["DatabaseConnection"]
+__all__ = [
+    "DatabaseConnection",
+    "InstrumentedConnection",
+    "InstrumentedCursor",
+    "PoolStats",
+    "QueryCounter",
+    "QueryRecord",
+    "SQLiteConnection",
+    "track_queries",
+]
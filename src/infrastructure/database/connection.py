@@ -1,15 +1,29 @@
+import math
+import time
+from collections import deque
 from contextlib import contextmanager
-from typing import Optional
+from threading import Event, Lock
+from typing import Deque, Dict, Optional
 
-from mysql.connector import Error, pooling
+from mysql.connector import Error, PoolError, pooling
 
 from config.settings import Settings
+from infrastructure.database.pool_stats import PoolStats
+from infrastructure.database.query_instrumentation import \
+    InstrumentedConnection
+from infrastructure.exceptions import PoolExhaustedError
 
 
 class DatabaseConnection:
     """
     Manages database connections following the Singleton pattern.
     Handles MySQL connection configuration and provides connection context.
+    Pool size, session reset and connection max-age come from Settings.
+    Liveness is checked on checkout by the pool itself, which pings every
+    connection it hands out and reconnects the ones that dropped.
+    When every connection is in use, checkouts wait in a bounded FIFO queue
+    instead of failing immediately. Connections are handed out wrapped in an
+    InstrumentedConnection that times every statement.
     """
 
     _instance: Optional["DatabaseConnection"] = None
@@ -28,15 +42,39 @@ class DatabaseConnection:
             self._database = settings.db_name
             self._user = settings.db_user
             self._password = settings.db_password
+            self._pool_size = settings.db_pool_size
+            self._pool_reset_session = settings.db_pool_reset_session
+            self._max_age_seconds = settings.db_pool_max_age_seconds
+            self._checkout_timeout = settings.db_pool_checkout_timeout_seconds
+            self._max_waiters = settings.db_pool_max_waiters
+            self._retry_after = max(1, math.ceil(self._checkout_timeout))
+            self._slow_query_threshold_ms = settings.slow_query_threshold_ms
+
+            self._pool_lock = Lock()
+            self._state_lock = Lock()
+            self._free_slots = self._pool_size
+            self._waiters: Deque[Event] = deque()
+            self._opened_at: Dict[int, float] = {}
+            self._in_use = 0
+            self._checkouts = 0
+            self._waits = 0
+            self._timeouts = 0
+            self._rejected = 0
+            self._recycled = 0
+            self._checkout_seconds_total = 0.0
+            self._checkout_seconds_max = 0.0
             self._initialized = True
 
     def create_connection_pool(self) -> None:
-        """Creates a connection pool for database connections."""
+        """
+        Creates a connection pool for database connections.
+        Connector/Python opens every connection of the pool here.
+        """
         try:
             self._connection_pool = pooling.MySQLConnectionPool(
                 pool_name="travel_expense_pool",
-                pool_size=5,
-                pool_reset_session=True,
+                pool_size=self._pool_size,
+                pool_reset_session=self._pool_reset_session,
                 host=self._host,
                 port=self._port,
                 database=self._database,
@@ -47,26 +85,207 @@ class DatabaseConnection:
         except Error as e:
             raise ConnectionError(f"Error creating connection pool: {str(e)}")
 
+    def warm_up(self) -> int:
+        """
+        Creates the connection pool eagerly, so the connection handshakes happen
+        at startup instead of on the first request.
+            :return: Number of connections opened by the pool.
+            :raises ConnectionError: If the pool cannot be created.
+        """
+        with self._pool_lock:
+            if self._connection_pool is None:
+                self.create_connection_pool()
+
+        return self._pool_size
+
     @contextmanager
     def get_connection(self):
         """
         Context manager for database connections.
         Ensures proper connection handling and cleanup.
+            :raises PoolExhaustedError: If the wait queue is full or the checkout
+                times out.
         """
         if self._connection_pool is None:
-            self.create_connection_pool()
+            self.warm_up()
 
         connection = None
+        instrumented = None
         try:
             if not self._connection_pool:
                 raise ConnectionError("Connection pool is not initialized.")
 
-            connection = self._connection_pool.get_connection()
-            yield connection
+            connection = self._checkout()
+            instrumented = InstrumentedConnection(
+                connection, self._slow_query_threshold_ms
+            )
+            yield instrumented
         except Error as e:
             if connection:
                 connection.rollback()
             raise e
         finally:
-            if connection and connection.is_connected():
+            if instrumented:
+                instrumented.flush()
+            if connection:
+                self._release(connection)
+
+    def get_pool_stats(self) -> PoolStats:
+        """
+        Returns a snapshot of the pool counters.
+            :return: PoolStats with usage, queueing and checkout latency figures.
+        """
+        with self._state_lock:
+            return PoolStats(
+                pool_size=self._pool_size,
+                in_use=self._in_use,
+                idle=self._pool_size - self._in_use,
+                waiting=len(self._waiters),
+                checkouts=self._checkouts,
+                waits=self._waits,
+                timeouts=self._timeouts,
+                rejected=self._rejected,
+                recycled=self._recycled,
+                average_checkout_ms=(
+                    self._checkout_seconds_total / self._checkouts * 1000
+                    if self._checkouts
+                    else 0.0
+                ),
+                max_checkout_ms=self._checkout_seconds_max * 1000,
+            )
+
+    def _checkout(self):
+        """
+        Takes a connection from the pool once a slot is free, reconnecting it when
+        it is older than the configured max-age, and records the checkout in the
+        pool counters.
+            :return: Pooled connection ready to use.
+            :raises PoolExhaustedError: If no connection is obtained in time.
+        """
+        started = time.monotonic()
+        self._acquire_slot()
+
+        try:
+            try:
+                connection = self._connection_pool.get_connection()
+            except PoolError as e:
+                raise PoolExhaustedError(str(e), self._retry_after) from e
+
+            try:
+                recycled = self._recycle_if_expired(connection)
+            except Error:
                 connection.close()
+                raise
+        except BaseException:
+            self._release_slot()
+            raise
+
+        elapsed = time.monotonic() - started
+
+        with self._state_lock:
+            self._in_use += 1
+            self._checkouts += 1
+            self._recycled += recycled
+            self._checkout_seconds_total += elapsed
+            self._checkout_seconds_max = max(self._checkout_seconds_max, elapsed)
+
+        return connection
+
+    def _release(self, connection) -> None:
+        """
+        Returns a connection to the pool and hands its slot to the next waiter.
+        A connection that dropped while in use is returned as well, so its slot
+        is not lost; the pool reconnects it on the next checkout.
+            :param connection: Pooled connection being released.
+        """
+        with self._state_lock:
+            self._in_use -= 1
+
+        try:
+            connection.close()
+        except Error:
+            pass
+        finally:
+            self._release_slot()
+
+    def _acquire_slot(self) -> None:
+        """
+        Reserves one of the pool's connections, queueing behind earlier
+        checkouts while all of them are in use.
+            :raises PoolExhaustedError: If the wait queue is full or the wait
+                times out.
+        """
+        with self._state_lock:
+            if self._free_slots > 0 and not self._waiters:
+                self._free_slots -= 1
+                return
+
+            if len(self._waiters) >= self._max_waiters:
+                self._rejected += 1
+                raise PoolExhaustedError(
+                    "Too many requests waiting for a database connection",
+                    self._retry_after,
+                )
+
+            waiter = Event()
+            self._waiters.append(waiter)
+            self._waits += 1
+
+        if waiter.wait(self._checkout_timeout):
+            return
+
+        with self._state_lock:
+            # The slot may have been handed over right after the wait timed out.
+            if waiter.is_set():
+                return
+
+            self._waiters.remove(waiter)
+            self._timeouts += 1
+
+        raise PoolExhaustedError(
+            f"Timed out after {self._checkout_timeout}s waiting for a database "
+            "connection",
+            self._retry_after,
+        )
+
+    def _release_slot(self) -> None:
+        """
+        Hands a released slot to the longest waiting checkout, or frees it.
+        """
+        with self._state_lock:
+            if self._waiters:
+                self._waiters.popleft().set()
+            else:
+                self._free_slots += 1
+
+    def _recycle_if_expired(self, connection) -> bool:
+        """
+        Reconnects a connection that has been open longer than the max-age.
+        Connections are tracked by server connection ID, which changes whenever
+        the connection is reopened, and their age counts from the first checkout.
+            :param connection: Pooled connection just taken from the pool.
+            :return: True if the connection was reconnected.
+        """
+        if self._max_age_seconds <= 0:
+            return False
+
+        now = time.monotonic()
+        connection_id = connection.connection_id
+
+        with self._state_lock:
+            opened_at = self._opened_at.setdefault(connection_id, now)
+            # Connections reopened by the pool's own liveness check leave stale
+            # IDs behind; drop the oldest entries once they pile up.
+            while len(self._opened_at) > 2 * self._pool_size:
+                self._opened_at.pop(next(iter(self._opened_at)))
+
+        if now - opened_at < self._max_age_seconds:
+            return False
+
+        connection.reconnect()
+
+        with self._state_lock:
+            self._opened_at.pop(connection_id, None)
+            self._opened_at[connection.connection_id] = time.monotonic()
+
+        return True
@@ -0,0 +1,5 @@
+from .migration import IndexDefinition, Migration
+from .runner import MigrationRunner
+from .versions import MIGRATIONS
+
+__all__ = ["IndexDefinition", "MIGRATIONS", "Migration", "MigrationRunner"]
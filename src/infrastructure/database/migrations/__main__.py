@@ -0,0 +1,49 @@
+"""
+Command that creates or upgrades the database schema.
+
+Usage:
+    python -m infrastructure.database.migrations [--target VERSION] [--list]
+"""
+
+import argparse
+import sys
+
+from infrastructure.database import DatabaseConnection
+
+from .runner import MigrationRunner
+
+
+def main() -> None:
+    """
+    Entry point for the migration command.
+    """
+    parser = argparse.ArgumentParser(
+        description="Apply pending schema migrations to the configured database."
+    )
+    parser.add_argument(
+        "--target", type=int, default=None, help="Stop after this version."
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="Only list the pending migrations."
+    )
+    args = parser.parse_args()
+
+    runner = MigrationRunner(DatabaseConnection())
+
+    try:
+        if args.list:
+            migrations = runner.pending(args.target)
+        else:
+            migrations = runner.upgrade(args.target)
+    except (ConnectionError, RuntimeError) as e:
+        print(f"Migration failed: {e}")
+        sys.exit(1)
+
+    action = "Pending" if args.list else "Applied"
+    for migration in migrations:
+        print(f"{action} {migration.version:04d} {migration.name}")
+    print(f"{action} {len(migrations)} migration(s).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+
+@dataclass(frozen=True)
+class IndexDefinition:
+    """
+    Secondary index created by a migration.
+    MySQL has no CREATE INDEX IF NOT EXISTS, so the runner checks
+    information_schema first and skips indexes that were already created by hand.
+    """
+
+    table: str
+    name: str
+    columns: Tuple[str, ...]
+
+    def create_statement(self) -> str:
+        """
+        Builds the CREATE INDEX statement for this index.
+            :return: DDL statement creating the index.
+        """
+        return f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)})"
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    Versioned schema change.
+    Steps are DDL statements or index definitions applied in order; every step
+    must be safe to re-run, since MySQL commits DDL implicitly and a failed
+    migration can leave earlier steps applied.
+    """
+
+    version: int
+    name: str
+    steps: Tuple[Union[str, IndexDefinition], ...]
@@ -0,0 +1,117 @@
+from typing import List, Optional, Sequence, Set
+
+from mysql.connector import Error
+
+from infrastructure.database import DatabaseConnection
+
+from .migration import IndexDefinition, Migration
+from .versions import MIGRATIONS
+
+
+class MigrationRunner:
+    """
+    Applies versioned schema migrations to the database.
+    Applied versions are recorded in the schema_migrations table, so running
+    the upgrade again only applies the migrations that are still pending.
+    """
+
+    _CREATE_VERSION_TABLE = """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT NOT NULL,
+            name VARCHAR(255) NOT NULL,
+            applied_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (version)
+        )
+    """
+
+    _INDEX_EXISTS_QUERY = """
+        SELECT COUNT(*) FROM information_schema.statistics
+        WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+    """
+
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        migrations: Sequence[Migration] = MIGRATIONS,
+    ) -> None:
+        """
+        Initializes the runner.
+            :param db_connection: Connection provider for the target database.
+            :param migrations: Known migrations, ordered by version.
+        """
+        self._db_connection = db_connection
+        self._migrations: List[Migration] = sorted(
+            migrations, key=lambda migration: migration.version
+        )
+
+    def applied_versions(self) -> Set[int]:
+        """
+        Retrieves the versions already applied, creating the version table if needed.
+            :return: Set of applied migration versions.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._CREATE_VERSION_TABLE)
+                cursor.execute("SELECT version FROM schema_migrations")
+
+                return {version for (version,) in cursor.fetchall()}
+        except Error as e:
+            raise RuntimeError(f"Error reading applied migrations: {e}") from e
+
+    def pending(self, target: Optional[int] = None) -> List[Migration]:
+        """
+        Lists the migrations that have not been applied yet.
+            :param target: Highest version to consider. All versions when omitted.
+            :return: Pending migrations ordered by version.
+        """
+        applied = self.applied_versions()
+
+        return [
+            migration
+            for migration in self._migrations
+            if migration.version not in applied
+            and (target is None or migration.version <= target)
+        ]
+
+    def upgrade(self, target: Optional[int] = None) -> List[Migration]:
+        """
+        Applies the pending migrations in version order.
+            :param target: Highest version to apply. All versions when omitted.
+            :return: The migrations that were applied.
+            :raises RuntimeError: If a migration fails; later migrations are not applied.
+        """
+        applied: List[Migration] = []
+
+        for migration in self.pending(target):
+            try:
+                with self._db_connection.get_connection() as connection:
+                    cursor = connection.cursor()
+
+                    for step in migration.steps:
+                        if isinstance(step, IndexDefinition):
+                            cursor.execute(
+                                self._INDEX_EXISTS_QUERY, (step.table, step.name)
+                            )
+                            (index_exists,) = cursor.fetchone()
+                            if index_exists:
+                                continue
+                            step = step.create_statement()
+
+                        cursor.execute(step)
+
+                    cursor.execute(
+                        "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                        (migration.version, migration.name),
+                    )
+                    connection.commit()
+            except Error as e:
+                raise RuntimeError(
+                    f"Error applying migration {migration.version} "
+                    f"({migration.name}): {e}"
+                ) from e
+
+            applied.append(migration)
+
+        return applied
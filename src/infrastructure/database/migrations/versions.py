@@ -0,0 +1,108 @@
+from typing import Tuple
+
+from .migration import IndexDefinition, Migration
+
+MIGRATIONS: Tuple[Migration, ...] = (
+    Migration(
+        version=1,
+        name="create_trips_and_expenses",
+        steps=(
+            """
+            CREATE TABLE IF NOT EXISTS trips (
+                trip_id CHAR(36) NOT NULL,
+                start_date DATE NOT NULL,
+                end_date DATE NOT NULL,
+                is_international BOOLEAN NOT NULL DEFAULT FALSE,
+                daily_budget DECIMAL(15, 2) NOT NULL,
+                currency VARCHAR(3) NOT NULL DEFAULT 'COP',
+                PRIMARY KEY (trip_id)
+            )
+            """,
+            """
+            CREATE TABLE IF NOT EXISTS expenses (
+                expense_id CHAR(36) NOT NULL,
+                trip_id CHAR(36) NOT NULL,
+                expense_date DATE NOT NULL,
+                original_amount DECIMAL(15, 2) NOT NULL,
+                currency VARCHAR(3) NOT NULL DEFAULT 'COP',
+                converted_amount_cop DECIMAL(15, 2) NOT NULL,
+                payment_method VARCHAR(10) NOT NULL,
+                expense_type VARCHAR(20) NOT NULL,
+                PRIMARY KEY (expense_id),
+                CONSTRAINT fk_expenses_trip
+                    FOREIGN KEY (trip_id) REFERENCES trips (trip_id)
+            )
+            """,
+        ),
+    ),
+    Migration(
+        version=2,
+        name="create_trip_daily_totals",
+        steps=(
+            """
+            CREATE TABLE IF NOT EXISTS trip_daily_totals (
+                trip_id CHAR(36) NOT NULL,
+                expense_date DATE NOT NULL,
+                cash DECIMAL(15, 2) NOT NULL DEFAULT 0,
+                card DECIMAL(15, 2) NOT NULL DEFAULT 0,
+                total DECIMAL(15, 2) NOT NULL DEFAULT 0,
+                expense_count INT NOT NULL DEFAULT 0,
+                PRIMARY KEY (trip_id, expense_date)
+            )
+            """,
+            # Backfills the rollup from the expenses stored before it existed.
+            # REPLACE overwrites rows with the recomputed totals, so the step
+            # stays safe to re-run. 'Cash' is the stored PaymentMethod.CASH.
+            """
+            REPLACE INTO trip_daily_totals (trip_id, expense_date, cash, card,
+                total, expense_count)
+            SELECT trip_id, expense_date,
+                SUM(CASE WHEN payment_method = 'Cash'
+                    THEN converted_amount_cop ELSE 0 END),
+                SUM(CASE WHEN payment_method = 'Cash'
+                    THEN 0 ELSE converted_amount_cop END),
+                SUM(converted_amount_cop),
+                COUNT(*)
+            FROM expenses
+            GROUP BY trip_id, expense_date
+            """,
+        ),
+    ),
+    Migration(
+        version=3,
+        name="add_hot_query_indexes",
+        steps=(
+            # Serves the per-trip and per-day lookups and the keyset pagination
+            # order (expense_date, expense_id) without a filesort.
+            IndexDefinition(
+                table="expenses",
+                name="idx_expenses_trip_date",
+                columns=("trip_id", "expense_date", "expense_id"),
+            ),
+            # Serves the trip listing order and the active-trip range checks.
+            IndexDefinition(
+                table="trips",
+                name="idx_trips_dates",
+                columns=("start_date", "end_date"),
+            ),
+        ),
+    ),
+    Migration(
+        version=4,
+        name="create_exchange_rates",
+        steps=(
+            # Clustered on (base, target, date), so the latest rate on or before
+            # a date is a single backward index seek. The API also publishes
+            # rates for codes longer than ISO 4217's three letters.
+            """
+            CREATE TABLE IF NOT EXISTS exchange_rates (
+                base_currency VARCHAR(16) NOT NULL,
+                target_currency VARCHAR(16) NOT NULL,
+                rate_date DATE NOT NULL,
+                rate DECIMAL(24, 12) NOT NULL,
+                PRIMARY KEY (base_currency, target_currency, rate_date)
+            )
+            """,
+        ),
+    ),
+)
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of the connection pool counters.
+    Latencies are in milliseconds and cover the time spent obtaining a
+    connection, including queueing, liveness checks and max-age reconnects.
+    waits counts checkouts that had to queue, timeouts those that gave up
+    waiting and rejected those turned away because the queue was full.
+    """
+
+    pool_size: int
+    in_use: int
+    idle: int
+    waiting: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    rejected: int
+    recycled: int
+    average_checkout_ms: float
+    max_checkout_ms: float
@@ -0,0 +1,239 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Iterator, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    """
+    Timing of one executed statement. Execution covers the round trip of
+    execute(), which for buffered cursors includes reading the result set;
+    fetching covers the time spent in the fetch calls afterwards.
+    """
+
+    sql: str
+    param_count: int
+    row_count: int
+    execute_ms: float
+    fetch_ms: float
+
+    @property
+    def total_ms(self) -> float:
+        return self.execute_ms + self.fetch_ms
+
+
+class QueryCounter:
+    """
+    Accumulates the queries run on behalf of one unit of work, usually an HTTP
+    request. Worker threads running parts of the same request share it through
+    the copied context, hence the lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock: Lock = Lock()
+        self.count: int = 0
+        self.slow: int = 0
+        self.rows: int = 0
+        self.execute_ms: float = 0.0
+        self.fetch_ms: float = 0.0
+
+    @property
+    def total_ms(self) -> float:
+        return self.execute_ms + self.fetch_ms
+
+    def add(self, record: QueryRecord, slow: bool) -> None:
+        """
+        Adds a finished statement to the counters.
+            :param record: Timing of the statement.
+            :param slow: Whether the statement crossed the slow-query threshold.
+        """
+        with self._lock:
+            self.count += 1
+            self.slow += slow
+            self.rows += record.row_count
+            self.execute_ms += record.execute_ms
+            self.fetch_ms += record.fetch_ms
+
+
+_current_counter: ContextVar[Optional[QueryCounter]] = ContextVar(
+    "query_counter", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryCounter]:
+    """
+    Counts the queries run in the current context until the block exits.
+        :return: The counter, updated as statements finish.
+    """
+    counter = QueryCounter()
+    token = _current_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _current_counter.reset(token)
+
+
+class InstrumentedCursor:
+    """
+    Cursor proxy that times execute and fetch calls and reports one QueryRecord
+    per statement. A statement is reported once its result set is exhausted,
+    when the next statement is executed, or when the connection is released.
+    Anything else is delegated to the wrapped cursor.
+    """
+
+    def __init__(self, cursor, on_complete: Callable[[QueryRecord], None]) -> None:
+        self._cursor = cursor
+        self._on_complete = on_complete
+        self._sql: Optional[str] = None
+        self._param_count = 0
+        self._execute_seconds = 0.0
+        self._fetch_seconds = 0.0
+        self._rows = 0
+        self._fetched = False
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        row = self.fetchone()
+        while row is not None:
+            yield row
+            row = self.fetchone()
+
+    def execute(self, operation: str, params: Sequence = (), **kwargs):
+        self.flush()
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(operation, params, **kwargs)
+        finally:
+            self._begin(operation, len(params or ()), time.perf_counter() - started)
+
+    def executemany(self, operation: str, seq_params: Sequence[Sequence], **kwargs):
+        self.flush()
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params, **kwargs)
+        finally:
+            param_count = sum(len(params) for params in seq_params)
+            self._begin(operation, param_count, time.perf_counter() - started)
+
+    def fetchone(self):
+        row = self._timed_fetch(self._cursor.fetchone)
+        if row is None:
+            self.flush()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs) -> List:
+        rows = self._timed_fetch(self._cursor.fetchmany, *args, **kwargs)
+        self._rows += len(rows)
+        if not rows:
+            self.flush()
+        return rows
+
+    def fetchall(self) -> List:
+        rows = self._timed_fetch(self._cursor.fetchall)
+        self._rows += len(rows)
+        self.flush()
+        return rows
+
+    def close(self):
+        self.flush()
+        return self._cursor.close()
+
+    def flush(self) -> None:
+        """
+        Reports the pending statement, if any.
+        """
+        if self._sql is None:
+            return
+
+        row_count = self._rows if self._fetched else max(self._cursor.rowcount, 0)
+        record = QueryRecord(
+            sql=self._sql,
+            param_count=self._param_count,
+            row_count=row_count,
+            execute_ms=self._execute_seconds * 1000,
+            fetch_ms=self._fetch_seconds * 1000,
+        )
+        self._sql = None
+        self._on_complete(record)
+
+    def _begin(self, operation: str, param_count: int, elapsed: float) -> None:
+        self._sql = operation
+        self._param_count = param_count
+        self._execute_seconds = elapsed
+        self._fetch_seconds = 0.0
+        self._rows = 0
+        self._fetched = False
+
+    def _timed_fetch(self, fetch, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            self._fetch_seconds += time.perf_counter() - started
+            self._fetched = True
+
+
+class InstrumentedConnection:
+    """
+    Connection proxy handed out by DatabaseConnection. Its cursors report every
+    statement to the query counter of the current context and log the ones
+    slower than the threshold. Anything else is delegated to the wrapped
+    connection.
+    """
+
+    def __init__(self, connection, slow_query_threshold_ms: float) -> None:
+        """
+        Initializes the proxy.
+            :param connection: Pooled connection being wrapped.
+            :param slow_query_threshold_ms: Statements taking at least this long
+                are logged; 0 logs every statement and a negative value none.
+        """
+        self._connection = connection
+        self._slow_query_threshold_ms = slow_query_threshold_ms
+        self._cursors: List[InstrumentedCursor] = []
+
+    def __getattr__(self, name: str):
+        return getattr(self._connection, name)
+
+    def cursor(self, *args, **kwargs) -> InstrumentedCursor:
+        cursor = InstrumentedCursor(
+            self._connection.cursor(*args, **kwargs), self._record
+        )
+        self._cursors.append(cursor)
+        return cursor
+
+    def flush(self) -> None:
+        """
+        Reports the statements still pending on the cursors of this connection.
+        """
+        for cursor in self._cursors:
+            cursor.flush()
+        self._cursors.clear()
+
+    def _record(self, record: QueryRecord) -> None:
+        slow = 0 <= self._slow_query_threshold_ms <= record.total_ms
+
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.add(record, slow)
+
+        if slow:
+            logger.warning(
+                "Slow query: %.1f ms execute, %.1f ms fetch, %d params, %d rows: %s",
+                record.execute_ms,
+                record.fetch_ms,
+                record.param_count,
+                record.row_count,
+                " ".join(record.sql.split()),
+            )
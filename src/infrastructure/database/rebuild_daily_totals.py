@@ -0,0 +1,48 @@
+"""
+Command that backfills the trip_daily_totals rollup, applying any pending
+schema migration first so the table exists.
+
+Usage:
+    python -m infrastructure.database.rebuild_daily_totals [--trip-id UUID]
+"""
+
+import argparse
+import sys
+from uuid import UUID
+
+from mysql.connector import Error
+
+from infrastructure.database import DatabaseConnection
+from infrastructure.database.migrations import MigrationRunner
+from infrastructure.persistence import MySQLExpenseRepository
+
+
+def main() -> None:
+    """
+    Entry point for the rebuild command.
+    """
+    parser = argparse.ArgumentParser(
+        description="Rebuild the trip_daily_totals rollup from the expenses table."
+    )
+    parser.add_argument(
+        "--trip-id", type=UUID, default=None, help="Only rebuild this trip."
+    )
+    args = parser.parse_args()
+
+    db_connection = DatabaseConnection()
+
+    try:
+        MigrationRunner(db_connection).upgrade()
+
+        rebuilt_rows = MySQLExpenseRepository(db_connection).rebuild_daily_totals(
+            args.trip_id
+        )
+    except (ConnectionError, Error, RuntimeError) as e:
+        print(f"Failed to rebuild daily totals: {e}")
+        sys.exit(1)
+
+    print(f"Rebuilt {rebuilt_rows} daily total rows.")
+
+
+if __name__ == "__main__":
+    main()
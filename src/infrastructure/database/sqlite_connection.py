@@ -0,0 +1,191 @@
+import sqlite3
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import List, Optional
+
+from config.settings import Settings
+from infrastructure.database.query_instrumentation import \
+    InstrumentedConnection
+
+# Same tables and indexes as the MySQL migrations, in SQLite types: UUIDs and
+# dates are stored as text (ISO dates sort and compare chronologically) and
+# amounts as REAL.
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS trips (
+        trip_id TEXT NOT NULL PRIMARY KEY,
+        start_date TEXT NOT NULL,
+        end_date TEXT NOT NULL,
+        is_international INTEGER NOT NULL DEFAULT 0,
+        daily_budget REAL NOT NULL,
+        currency TEXT NOT NULL DEFAULT 'COP'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS expenses (
+        expense_id TEXT NOT NULL PRIMARY KEY,
+        trip_id TEXT NOT NULL REFERENCES trips (trip_id),
+        expense_date TEXT NOT NULL,
+        original_amount REAL NOT NULL,
+        currency TEXT NOT NULL DEFAULT 'COP',
+        converted_amount_cop REAL NOT NULL,
+        payment_method TEXT NOT NULL,
+        expense_type TEXT NOT NULL
+    )
+    """,
+    # WITHOUT ROWID clusters the rollup on its key, like the InnoDB table.
+    """
+    CREATE TABLE IF NOT EXISTS trip_daily_totals (
+        trip_id TEXT NOT NULL,
+        expense_date TEXT NOT NULL,
+        cash REAL NOT NULL DEFAULT 0,
+        card REAL NOT NULL DEFAULT 0,
+        total REAL NOT NULL DEFAULT 0,
+        expense_count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (trip_id, expense_date)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS exchange_rates (
+        base_currency TEXT NOT NULL,
+        target_currency TEXT NOT NULL,
+        rate_date TEXT NOT NULL,
+        rate REAL NOT NULL,
+        PRIMARY KEY (base_currency, target_currency, rate_date)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_expenses_trip_date
+        ON expenses (trip_id, expense_date, expense_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_trips_dates ON trips (start_date, end_date)
+    """,
+)
+
+# Applied to every new connection. WAL lets readers run alongside the single
+# writer, and synchronous=NORMAL is durable across application crashes in WAL
+# mode while only syncing on checkpoints.
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class SQLiteConnection:
+    """
+    Manages connections to an embedded SQLite database file for single-node
+    deployments. Every thread gets its own connection, opened on first use and
+    kept for the lifetime of the thread, so there is no pool to size; SQLite
+    serializes writers itself and WAL mode keeps readers from blocking them.
+    The schema is created on the first connection. Connections are handed out
+    wrapped in an InstrumentedConnection that times every statement.
+    Connections run in autocommit mode; writers open their transactions with
+    BEGIN IMMEDIATE so they queue on the busy timeout instead of failing when
+    another writer holds the lock.
+    """
+
+    # Per-connection cache of compiled statements, keyed by the SQL text.
+    # Repositories keep their SQL in constants, so each statement is prepared
+    # once per connection and reused afterwards.
+    _CACHED_STATEMENTS = 256
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Initializes the connection manager; no connection is opened yet.
+            :param path: Database file. Defaults to the SQLITE_PATH setting.
+                ":memory:" is not supported, as every thread would get a
+                separate database.
+        """
+        settings = Settings()
+        self._path = path or settings.sqlite_path
+        self._busy_timeout = settings.sqlite_busy_timeout_seconds
+        self._slow_query_threshold_ms = settings.slow_query_threshold_ms
+
+        self._local = local()
+        self._lock = Lock()
+        self._connections: List[sqlite3.Connection] = []
+        self._schema_ready = False
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @contextmanager
+    def get_connection(self):
+        """
+        Provides the connection of the calling thread. A transaction left open
+        by an error is rolled back.
+            :return: The thread's connection, wrapped in an InstrumentedConnection.
+            :raises sqlite3.Error: If the database cannot be opened.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._connect()
+
+        instrumented = InstrumentedConnection(connection, self._slow_query_threshold_ms)
+        try:
+            yield instrumented
+        except BaseException:
+            if connection.in_transaction:
+                connection.rollback()
+            raise
+        finally:
+            instrumented.flush()
+
+    def close(self) -> None:
+        """
+        Closes every connection opened so far. Threads that use the manager
+        afterwards open a new one.
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+
+        for connection in connections:
+            connection.close()
+
+        self._local = local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens and configures the connection of the calling thread and creates
+        the schema if this is the first connection.
+            :return: The new connection.
+        """
+        # check_same_thread is off so close() can run from any thread; each
+        # connection is still only used by the thread that opened it.
+        connection = sqlite3.connect(
+            self._path,
+            timeout=self._busy_timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=self._CACHED_STATEMENTS,
+        )
+        try:
+            for pragma in _PRAGMAS:
+                connection.execute(pragma)
+
+            with self._lock:
+                if not self._schema_ready:
+                    self._create_schema(connection)
+                    self._schema_ready = True
+                self._connections.append(connection)
+        except sqlite3.Error:
+            connection.close()
+            raise
+
+        self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _create_schema(connection: sqlite3.Connection) -> None:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+            connection.commit()
+        except sqlite3.Error:
+            connection.rollback()
+            raise
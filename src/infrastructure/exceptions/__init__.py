@@ -1,3 +1,4 @@
 from .conversion_error import ConversionError
+from .pool_exhausted_error import PoolExhaustedError
 
-__all__ = ["ConversionError"]
+__all__ = ["ConversionError", "PoolExhaustedError"]
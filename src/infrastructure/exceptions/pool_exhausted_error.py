@@ -0,0 +1,13 @@
+class PoolExhaustedError(Exception):
+    """
+    Exception raised when no database connection can be obtained in time,
+    either because the checkout wait queue is full or the wait timed out.
+    """
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.message = message
+        self.retry_after = retry_after
+
+    def __str__(self):
+        return f"PoolExhaustedError: {self.message}"
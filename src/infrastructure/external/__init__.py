@@ -1,3 +1,10 @@
 from .api_currency_converter import ApiCurrencyConverter
+from .http_session import create_http_session, get_shared_http_session
+from .rate_refresher import RateRefresher
 
-__all__ = ["ApiCurrencyConverter"]
+__all__ = [
+    "ApiCurrencyConverter",
+    "create_http_session",
+    "get_shared_http_session",
+    "RateRefresher",
+]
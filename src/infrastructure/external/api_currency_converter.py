@@ -1,10 +1,24 @@
-import os
+import logging
+import time
+from datetime import date
+from threading import Lock
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
-import requests
+import numpy as np
+from requests import RequestException, Session
 
 from config import Settings
+from core.domain import ExchangeRate
 from core.interfaces import CurrencyConverter
+from core.interfaces.repositories import ExchangeRateRepository
+from infrastructure.caching import TTLLRUCache
+from infrastructure.concurrency import SingleFlight
 from infrastructure.exceptions import ConversionError
+from infrastructure.external.http_session import get_shared_http_session
+from infrastructure.monitoring import (CURRENCY_CONVERTER_ERRORS,
+                                       CURRENCY_CONVERTER_SECONDS, timed)
+
+logger = logging.getLogger(__name__)
 
 
 class ApiCurrencyConverter(CurrencyConverter):
@@ -12,12 +26,148 @@ class ApiCurrencyConverter(CurrencyConverter):
     A currency converter that uses an external API to fetch exchange rates.
     This class implements the CurrencyConverter interface and provides
     functionality to convert amounts between different currencies.
+    Rate tables are cached per base currency when the rate cache is enabled.
+    Requests go through a pooled keep-alive session that retries transient
+    failures, shared by every converter unless another one is given.
+    Rate tables loaded ahead of time with refresh_rates are served from an
+    in-process snapshot, so converting from those currencies does no I/O.
+    Conversions for a date go through the historical rate store when one is
+    given: a missing date is fetched once and its whole table is stored, so
+    later conversions for that date are served locally.
+    Batches are converted with convert_many and convert_mixed, which look up
+    each rate once and multiply the amounts as a NumPy array.
+    Concurrent lookups that miss for the same table share one request.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        rate_cache: Optional[TTLLRUCache] = None,
+        session: Optional[Session] = None,
+        api_url: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic,
+        rate_repository: Optional[ExchangeRateRepository] = None,
+        history_url: Optional[str] = None,
+        today: Callable[[], date] = date.today,
+    ) -> None:
+        """
+        Initializes the converter.
+            :param rate_cache: Cache for rate tables keyed by base currency.
+                When omitted, one is created from the settings if enabled.
+            :param session: HTTP session used for the API calls. Defaults to
+                the shared session configured from the API_* settings.
+            :param api_url: Base URL of the rates API. Defaults to API_URL.
+            :param clock: Monotonic time source, injectable for testing.
+            :param rate_repository: Historical rate store used by convert_on.
+                Without one, every date missing from the caches is fetched.
+            :param history_url: URL template of past rates, with a {date}
+                placeholder. Defaults to API_HISTORY_URL.
+            :param today: Source of the current date, injectable for testing.
+        """
         super().__init__()
-        self._api_url = Settings().api_url
+        settings = Settings()
+        self._api_url = api_url if api_url is not None else settings.api_url
+        self._session = session
+        self._timeout = (
+            settings.api_connect_timeout_seconds,
+            settings.api_read_timeout_seconds,
+        )
+
+        if rate_cache is None and settings.rate_cache_enabled:
+            rate_cache = TTLLRUCache(
+                max_entries=settings.rate_cache_max_entries,
+                ttl_seconds=settings.rate_cache_ttl_seconds,
+            )
 
+        self._rate_cache: Optional[TTLLRUCache] = rate_cache
+
+        # Tables loaded by refresh_rates, keyed by base currency along with the
+        # time they were fetched. The dictionary is never modified: a refresh
+        # builds a new one and swaps the reference, so readers take no lock and
+        # never see a half-applied refresh. Tables older than the rate cache
+        # TTL are ignored, so rates never outlive it if refreshes stop.
+        self._snapshot: Dict[str, Tuple[float, Dict[str, float]]] = {}
+        self._snapshot_ttl_seconds = settings.rate_cache_ttl_seconds
+        self._refresh_lock = Lock()
+        self._clock = clock
+
+        self._rate_repository = rate_repository
+        self._history_url = (
+            history_url if history_url is not None else settings.api_history_url
+        )
+        self._max_gap_days = settings.rate_history_max_gap_days
+        self._today = today
+
+        # Lookups that miss every cache at the same time share one API call.
+        self._single_flight = SingleFlight("currency_rates")
+
+    @property
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Returns the counters of the rate cache.
+            :return: Cache statistics, or an empty dictionary if caching is disabled.
+        """
+        if self._rate_cache is None:
+            return {}
+
+        return self._rate_cache.stats
+
+    @property
+    def coalescing_stats(self) -> Dict[str, int]:
+        """
+        Returns how many rate fetches ran and how many concurrent lookups
+        waited for one of them instead.
+            :return: Dictionary with executed, coalesced and in_flight.
+        """
+        return self._single_flight.stats
+
+    @property
+    def snapshot_currencies(self) -> List[str]:
+        """
+        Returns the base currencies currently served from the snapshot.
+            :return: Sorted list of lowercase currency codes.
+        """
+        now = self._clock()
+        return sorted(
+            base_currency
+            for base_currency, (fetched_at, _) in self._snapshot.items()
+            if now - fetched_at < self._snapshot_ttl_seconds
+        )
+
+    def refresh_rates(self, currencies: Iterable[str]) -> List[str]:
+        """
+        Fetches the full rate tables of the given base currencies and publishes
+        them together in a new snapshot. A table that fails to load keeps its
+        previous version until that one expires.
+            :param currencies: Base currency codes to load.
+            :return: Sorted list of the lowercase codes that were refreshed.
+        """
+        with self._refresh_lock:
+            tables: Dict[str, Tuple[float, Dict[str, float]]] = {}
+
+            for base_currency in sorted({currency.lower() for currency in currencies}):
+                try:
+                    rates = self._fetch_rates(base_currency)
+                except (ConversionError, ValueError) as e:
+                    logger.warning(
+                        "Could not refresh %s exchange rates: %s", base_currency, e
+                    )
+                    continue
+
+                if rates:
+                    tables[base_currency] = (self._clock(), rates)
+
+            now = self._clock()
+            snapshot = {
+                base_currency: entry
+                for base_currency, entry in self._snapshot.items()
+                if now - entry[0] < self._snapshot_ttl_seconds
+            }
+            snapshot.update(tables)
+            self._snapshot = snapshot
+
+        return sorted(tables)
+
+    @timed(CURRENCY_CONVERTER_SECONDS, CURRENCY_CONVERTER_ERRORS, operation="convert")
     def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
         """
         Converts an amount from one currency to another using an external API.
@@ -27,18 +177,256 @@ class ApiCurrencyConverter(CurrencyConverter):
             :return: The converted amount in the target currency.
         """
 
-        response = requests.get(
-            f"{self._api_url}{from_currency.lower()}.json", timeout=10
+        return amount * self._get_rate(from_currency, to_currency)
+
+    @timed(
+        CURRENCY_CONVERTER_SECONDS, CURRENCY_CONVERTER_ERRORS, operation="convert_on"
+    )
+    def convert_on(
+        self, amount: float, from_currency: str, to_currency: str, on_date: date
+    ) -> float:
+        """
+        Converts an amount with the exchange rate in effect on a given date.
+        Dates from today on use the same rates as convert; past dates use the
+        rate store.
+            :param amount: The amount to convert.
+            :param from_currency: The currency code of the original amount.
+            :param to_currency: The currency code to convert to.
+            :param on_date: Date whose exchange rate is applied.
+            :return: The converted amount in the target currency.
+            :raises ConversionError: If a past date has no stored rate close
+                enough and no history URL is configured.
+        """
+        return amount * self._get_rate(from_currency, to_currency, on_date)
+
+    @timed(
+        CURRENCY_CONVERTER_SECONDS, CURRENCY_CONVERTER_ERRORS, operation="convert_many"
+    )
+    def convert_many(
+        self,
+        amounts: Sequence[float],
+        from_currency: str,
+        to_currency: str,
+        on_date: Optional[date] = None,
+    ) -> List[float]:
+        """
+        Converts several amounts in the same currency with a single rate lookup
+        and one vectorized multiplication.
+            :param amounts: The amounts to convert.
+            :param from_currency: The currency code of every amount.
+            :param to_currency: The currency code to convert to.
+            :param on_date: Date whose exchange rate is applied; the latest
+                rate when omitted.
+            :return: The converted amounts, in the order given.
+        """
+        if len(amounts) == 0:
+            return []
+
+        rate = self._get_rate(from_currency, to_currency, on_date)
+        return (np.asarray(amounts, dtype=np.float64) * rate).tolist()
+
+    @timed(
+        CURRENCY_CONVERTER_SECONDS, CURRENCY_CONVERTER_ERRORS, operation="convert_mixed"
+    )
+    def convert_mixed(
+        self,
+        amounts: Sequence[float],
+        from_currencies: Sequence[str],
+        to_currency: str,
+        on_dates: Optional[Sequence[date]] = None,
+    ) -> List[float]:
+        """
+        Converts amounts in different currencies, and optionally of different
+        dates, into one currency. Each distinct currency and date is looked up
+        once, and all amounts are multiplied by their rates in one vectorized
+        pass.
+            :param amounts: The amounts to convert.
+            :param from_currencies: The currency code of each amount.
+            :param to_currency: The currency code to convert to.
+            :param on_dates: Date whose exchange rate applies to each amount;
+                the latest rates when omitted.
+            :return: The converted amounts, in the order given.
+            :raises ValueError: If the sequences differ in length.
+        """
+        if len(from_currencies) != len(amounts) or (
+            on_dates is not None and len(on_dates) != len(amounts)
+        ):
+            raise ValueError("amounts, from_currencies and on_dates differ in length")
+
+        if len(amounts) == 0:
+            return []
+
+        dates = on_dates if on_dates is not None else [None] * len(amounts)
+        positions: Dict[Tuple[str, Optional[date]], int] = {}
+        rate_index = np.fromiter(
+            (
+                positions.setdefault(key, len(positions))
+                for key in zip(
+                    (currency.lower() for currency in from_currencies), dates
+                )
+            ),
+            dtype=np.intp,
+            count=len(amounts),
+        )
+        rates = np.array(
+            [
+                self._get_rate(from_currency, to_currency, on_date)
+                for from_currency, on_date in positions
+            ],
+            dtype=np.float64,
         )
 
+        return (np.asarray(amounts, dtype=np.float64) * rates[rate_index]).tolist()
+
+    def _get_rate(
+        self, from_currency: str, to_currency: str, on_date: Optional[date] = None
+    ) -> float:
+        """
+        Returns the rate from one currency to another. Rates for today or
+        later come from the snapshot and cache like those of convert; rates
+        for a past date come from the rate store when it has one close enough.
+            :param from_currency: The base currency code.
+            :param to_currency: The target currency code.
+            :param on_date: Date of the rate; the latest rate when omitted.
+            :return: Units of the target currency per unit of the base one.
+            :raises ValueError: If the target currency is not in the rate table.
+            :raises ConversionError: If a past rate can be neither read from the
+                store nor fetched.
+        """
+        if on_date is None or on_date >= self._today():
+            rates = self._get_rates(from_currency)
+        else:
+            if self._rate_repository is not None:
+                stored = self._rate_repository.get_rate(
+                    from_currency, to_currency, on_date
+                )
+                if (
+                    stored is not None
+                    and (on_date - stored.rate_date).days <= self._max_gap_days
+                ):
+                    return stored.rate
+
+            rates = self._get_rates_on(from_currency, on_date)
+
+        if to_currency.lower() not in rates:
+            raise ValueError(f"Currency {to_currency} not found in exchange rates")
+
+        return rates[to_currency.lower()]
+
+    def _get_rates_on(self, from_currency: str, on_date: date) -> Dict[str, float]:
+        """
+        Returns the rate table of a base currency for a past date, fetching it
+        and writing it to the rate store in one batch. Concurrent lookups of
+        the same table share one fetch.
+            :param from_currency: The base currency code.
+            :param on_date: Date of the rate table.
+            :return: Dictionary mapping target currency codes to rates.
+            :raises ConversionError: If no history URL is configured, since the
+                latest rates would convert the amount incorrectly.
+        """
+        base_currency = from_currency.lower()
+
+        if not self._history_url:
+            raise ConversionError(
+                f"No stored {base_currency.upper()} rate within "
+                f"{self._max_gap_days} days of {on_date.isoformat()} and "
+                "API_HISTORY_URL is not set"
+            )
+
+        return self._single_flight.do(
+            (base_currency, on_date),
+            lambda: self._load_rates_on(base_currency, on_date),
+        )
+
+    def _load_rates_on(self, base_currency: str, rate_date: date) -> Dict[str, float]:
+        """
+        Fetches the rate table of a base currency for a past date from the
+        history URL and writes it to the rate store.
+            :param base_currency: The lowercase base currency code.
+            :param rate_date: Date of the rate table.
+            :return: Dictionary mapping target currency codes to rates.
+        """
+        rates = self._fetch_rates(base_currency, rate_date)
+
+        if self._rate_repository is not None and rates:
+            self._rate_repository.save_many(
+                [
+                    ExchangeRate(rate_date, base_currency, target_currency, rate)
+                    for target_currency, rate in rates.items()
+                ]
+            )
+
+        return rates
+
+    def _get_rates(self, from_currency: str) -> Dict[str, float]:
+        """
+        Returns the rate table for a base currency, from the snapshot or the
+        cache when possible. Concurrent misses for the same base currency share
+        one fetch.
+            :param from_currency: The base currency code.
+            :return: Dictionary mapping target currency codes to rates.
+        """
+        base_currency = from_currency.lower()
+
+        entry = self._snapshot.get(base_currency)
+        if entry is not None and self._clock() - entry[0] < self._snapshot_ttl_seconds:
+            return entry[1]
+
+        if self._rate_cache is not None:
+            cached_rates = self._rate_cache.get(base_currency)
+            if cached_rates is not None:
+                return cached_rates
+
+        return self._single_flight.do(
+            base_currency, lambda: self._load_rates(base_currency)
+        )
+
+    def _load_rates(self, base_currency: str) -> Dict[str, float]:
+        """
+        Fetches the latest rate table for a base currency and caches it.
+            :param base_currency: The lowercase base currency code.
+            :return: Dictionary mapping target currency codes to rates.
+        """
+        rates = self._fetch_rates(base_currency)
+
+        if self._rate_cache is not None and rates:
+            self._rate_cache.set(base_currency, rates)
+
+        return rates
+
+    @timed(
+        CURRENCY_CONVERTER_SECONDS, CURRENCY_CONVERTER_ERRORS, operation="fetch_rates"
+    )
+    def _fetch_rates(
+        self, base_currency: str, on_date: Optional[date] = None
+    ) -> Dict[str, float]:
+        """
+        Fetches the rate table for a base currency from the external API.
+            :param base_currency: The lowercase base currency code.
+            :param on_date: Date of the rates to fetch from the history URL.
+                The latest rates are fetched when omitted.
+            :return: Dictionary mapping target currency codes to rates.
+            :raises ConversionError: If the API cannot be reached or does not
+                answer with status 200 once the retries are spent.
+        """
+        session = self._session or get_shared_http_session()
+        api_url = (
+            self._api_url
+            if on_date is None
+            else self._history_url.format(date=on_date.isoformat())
+        )
+
+        try:
+            response = session.get(
+                f"{api_url}{base_currency}.json", timeout=self._timeout
+            )
+        except RequestException as e:
+            raise ConversionError(f"Error fetching exchange rates: {e}") from e
+
         if response.status_code != 200:
             raise ConversionError(
                 f"Error fetching exchange rates: {response.status_code}"
             )
 
         data = response.json()
-        if to_currency.lower() not in data.get(f"{from_currency.lower()}", {}):
-            raise ValueError(f"Currency {to_currency} not found in exchange rates")
-
-        conversion_rate = data[from_currency.lower()][to_currency.lower()]
-        return amount * conversion_rate
+        return data.get(base_currency, {})
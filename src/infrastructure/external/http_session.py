@@ -0,0 +1,83 @@
+from threading import Lock
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import Settings
+
+# Statuses worth retrying: the upstream or a proxy in front of it is failing
+# or overloaded, and a later attempt may succeed.
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = Lock()
+
+
+def create_http_session(
+    max_retries: int,
+    backoff_seconds: float,
+    pool_maxsize: int,
+    backoff_jitter_seconds: Optional[float] = None,
+) -> requests.Session:
+    """
+    Creates a session that keeps connections alive and reuses them across
+    requests to the same host.
+    Idempotent requests are retried on connection errors, read timeouts and
+    5xx answers. The first retry goes out at once; each later one waits twice
+    as long as the one before, starting at 2 * backoff_seconds, plus a random
+    jitter so clients that failed together do not retry in lockstep. A
+    Retry-After header from the server takes precedence. Once the retries are
+    spent on a 5xx answer, that answer is returned to the caller.
+        :param max_retries: Retries after the first attempt; 0 disables them.
+        :param backoff_seconds: Base of the exponential backoff.
+        :param pool_maxsize: Connections kept open per host. Requests beyond it
+            wait for a free connection instead of opening extra ones.
+        :param backoff_jitter_seconds: Upper bound of the random delay added to
+            each backoff. Defaults to backoff_seconds.
+        :return: The configured session.
+    """
+    retry = Retry(
+        total=max_retries,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        backoff_factor=backoff_seconds,
+        backoff_jitter=(
+            backoff_seconds
+            if backoff_jitter_seconds is None
+            else backoff_jitter_seconds
+        ),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_http_session() -> requests.Session:
+    """
+    Returns the process-wide session configured from the API_* settings,
+    creating it on first use.
+        :return: The shared session.
+    """
+    global _shared_session
+
+    with _shared_session_lock:
+        if _shared_session is None:
+            settings = Settings()
+            _shared_session = create_http_session(
+                max_retries=settings.api_max_retries,
+                backoff_seconds=settings.api_retry_backoff_seconds,
+                pool_maxsize=settings.api_pool_maxsize,
+            )
+
+        return _shared_session
@@ -0,0 +1,101 @@
+import logging
+from datetime import date
+from threading import Event, Thread
+from typing import Callable, List, Optional
+
+from core.interfaces.repositories import TripRepository
+from infrastructure.external.api_currency_converter import ApiCurrencyConverter
+
+logger = logging.getLogger(__name__)
+
+
+class RateRefresher:
+    """
+    Keeps the converter's rate snapshot loaded with the tables of every
+    foreign currency used by an active trip. start() loads them on a daemon
+    thread, first at once and then every interval, so conversions on the
+    request path are served from memory.
+    """
+
+    def __init__(
+        self,
+        converter: ApiCurrencyConverter,
+        trip_repository: TripRepository,
+        interval_seconds: float,
+        today: Callable[[], date] = date.today,
+        base_currency: str = "COP",
+    ) -> None:
+        """
+        Initializes the refresher; nothing is fetched until start() or refresh().
+            :param converter: Converter whose snapshot is refreshed.
+            :param trip_repository: Source of the currencies of active trips.
+            :param interval_seconds: Seconds between refreshes.
+            :param today: Source of the current date, injectable for testing.
+            :param base_currency: Currency converted to, which needs no table.
+            :raises ValueError: If interval_seconds is not positive.
+        """
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be greater than zero")
+
+        self._converter = converter
+        self._trip_repository = trip_repository
+        self._interval_seconds = interval_seconds
+        self._today = today
+        self._base_currency = base_currency.upper()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def refresh(self) -> List[str]:
+        """
+        Loads the rate tables of the foreign currencies of the trips active today.
+            :return: Sorted list of the lowercase codes that were refreshed.
+            :raises RuntimeError: If the active currencies cannot be read.
+        """
+        currencies = [
+            currency
+            for currency in self._trip_repository.get_active_currencies(self._today())
+            if currency.upper() != self._base_currency
+        ]
+        refreshed = self._converter.refresh_rates(currencies)
+
+        logger.info(
+            "Refreshed exchange rates for %d of %d active currencies",
+            len(refreshed),
+            len(currencies),
+        )
+        return refreshed
+
+    def start(self) -> None:
+        """
+        Starts the background thread, which refreshes at once and then every
+        interval, so the caller never waits on the rates API. A failed refresh
+        is logged and retried on the next interval.
+        """
+        if self._thread is not None:
+            return
+
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name="rate-refresher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background thread, waiting for a refresh in progress.
+            :param timeout: Maximum seconds to wait for the thread to finish.
+        """
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        self._refresh_safely()
+        while not self._stopped.wait(self._interval_seconds):
+            self._refresh_safely()
+
+    def _refresh_safely(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("Exchange rate refresh failed")
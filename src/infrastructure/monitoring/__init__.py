@@ -0,0 +1,25 @@
+from .instrumentation import (CURRENCY_CONVERTER_ERRORS,
+                              CURRENCY_CONVERTER_SECONDS, HTTP_REQUEST_SECONDS,
+                              HTTP_REQUESTS, REGISTRY, REPOSITORY_ERRORS,
+                              REPOSITORY_SECONDS, SINGLE_FLIGHT_CALLS,
+                              PoolMetricsCollector, instrument_repository,
+                              timed)
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+__all__ = [
+    "Counter",
+    "CURRENCY_CONVERTER_ERRORS",
+    "CURRENCY_CONVERTER_SECONDS",
+    "Gauge",
+    "Histogram",
+    "HTTP_REQUEST_SECONDS",
+    "HTTP_REQUESTS",
+    "instrument_repository",
+    "MetricsRegistry",
+    "PoolMetricsCollector",
+    "REGISTRY",
+    "REPOSITORY_ERRORS",
+    "REPOSITORY_SECONDS",
+    "SINGLE_FLIGHT_CALLS",
+    "timed",
+]
@@ -0,0 +1,169 @@
+import inspect
+import time
+from functools import wraps
+from typing import Callable, List, Optional, TypeVar
+
+from infrastructure.monitoring.metrics import (Counter, Histogram,
+                                               MetricsRegistry, format_sample)
+
+T = TypeVar("T")
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total",
+    "HTTP requests handled, by method, route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency in seconds, by method and route template.",
+    ("method", "route"),
+)
+REPOSITORY_SECONDS = REGISTRY.histogram(
+    "repository_operation_duration_seconds",
+    "Repository method latency in seconds.",
+    ("repository", "operation"),
+)
+REPOSITORY_ERRORS = REGISTRY.counter(
+    "repository_operation_errors_total",
+    "Repository method calls that raised, by exception type.",
+    ("repository", "operation", "error"),
+)
+CURRENCY_CONVERTER_SECONDS = REGISTRY.histogram(
+    "currency_converter_duration_seconds",
+    "Currency converter call latency in seconds.",
+    ("operation",),
+)
+CURRENCY_CONVERTER_ERRORS = REGISTRY.counter(
+    "currency_converter_errors_total",
+    "Currency converter calls that raised, by exception type.",
+    ("operation", "error"),
+)
+SINGLE_FLIGHT_CALLS = REGISTRY.counter(
+    "single_flight_calls_total",
+    "Calls through a single-flight group, by outcome: executed ran the call, "
+    "coalesced waited for an identical call already in flight.",
+    ("group", "outcome"),
+)
+
+
+def timed(
+    histogram: Histogram, errors: Optional[Counter] = None, **labels: str
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator that records the latency of every call in a histogram, and the
+    calls that raise in an error counter labelled with the exception type.
+    Generator functions are timed until they are exhausted or closed.
+        :param histogram: Histogram receiving the latencies.
+        :param errors: Counter of failed calls, with an extra "error" label.
+        :param labels: Label values shared by every call.
+        :return: The decorator.
+    """
+
+    def record_error(error: BaseException) -> None:
+        if errors is not None:
+            errors.inc(error=type(error).__name__, **labels)
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if inspect.isgeneratorfunction(func):
+
+            @wraps(func)
+            def generator_wrapper(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    return (yield from func(*args, **kwargs))
+                except Exception as e:
+                    record_error(e)
+                    raise
+                finally:
+                    histogram.observe(time.perf_counter() - started, **labels)
+
+            return generator_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                record_error(e)
+                raise
+            finally:
+                histogram.observe(time.perf_counter() - started, **labels)
+
+        return wrapper
+
+    return decorator
+
+
+def instrument_repository(cls: type) -> type:
+    """
+    Class decorator that times every public method defined on a repository
+    class, labelled with the class and method names.
+        :param cls: Repository class.
+        :return: The same class with its public methods wrapped.
+    """
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.isfunction(member):
+            continue
+
+        decorated = timed(
+            REPOSITORY_SECONDS,
+            REPOSITORY_ERRORS,
+            repository=cls.__name__,
+            operation=name,
+        )(member)
+        setattr(cls, name, decorated)
+
+    return cls
+
+
+class PoolMetricsCollector:
+    """
+    Collector that exposes the connection pool counters at scrape time, read
+    from a single PoolStats snapshot so the figures are consistent.
+    """
+
+    _GAUGES = (
+        ("db_pool_size", "Connections in the pool.", "pool_size"),
+        ("db_pool_in_use", "Connections checked out.", "in_use"),
+        ("db_pool_idle", "Connections available for checkout.", "idle"),
+        ("db_pool_waiting", "Checkouts queued for a connection.", "waiting"),
+    )
+    _COUNTERS = (
+        ("db_pool_checkouts_total", "Connections checked out.", "checkouts"),
+        ("db_pool_waits_total", "Checkouts that had to queue.", "waits"),
+        ("db_pool_timeouts_total", "Checkouts that timed out.", "timeouts"),
+        ("db_pool_rejected_total", "Checkouts rejected, queue full.", "rejected"),
+        ("db_pool_recycled_total", "Connections reconnected for age.", "recycled"),
+    )
+
+    def __init__(self, db_connection) -> None:
+        """
+        Initializes the collector.
+            :param db_connection: DatabaseConnection whose pool is reported.
+        """
+        self._db_connection = db_connection
+
+    def expose(self) -> List[str]:
+        stats = self._db_connection.get_pool_stats()
+        lines = []
+
+        for metric_type, metrics in (
+            ("gauge", self._GAUGES),
+            ("counter", self._COUNTERS),
+        ):
+            for name, documentation, field in metrics:
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {metric_type}")
+                lines.append(format_sample(name, {}, getattr(stats, field)))
+
+        lines.append("# HELP db_pool_checkout_max_seconds Slowest checkout so far.")
+        lines.append("# TYPE db_pool_checkout_max_seconds gauge")
+        lines.append(
+            format_sample(
+                "db_pool_checkout_max_seconds", {}, stats.max_checkout_ms / 1000
+            )
+        )
+        return lines
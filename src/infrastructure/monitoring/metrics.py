@@ -0,0 +1,324 @@
+from bisect import bisect_left
+from threading import Lock
+from typing import Dict, Iterable, List, Protocol, Sequence, Tuple
+
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Collector(Protocol):
+    """Anything the registry can render in the Prometheus text format."""
+
+    def expose(self) -> List[str]: ...
+
+
+def format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    """
+    Formats one sample line of the Prometheus text exposition format.
+        :param name: Sample name.
+        :param labels: Label names mapped to their values.
+        :param value: Sample value.
+        :return: The formatted line.
+    """
+    if labels:
+        pairs = ",".join(
+            f'{key}="{_escape(str(label))}"' for key, label in labels.items()
+        )
+        name = f"{name}{{{pairs}}}"
+
+    return f"{name} {_format_value(value)}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """
+    Base class of the labelled metrics. Children are keyed by the tuple of
+    label values, in the order of the label names given at creation.
+    """
+
+    _type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._lock: Lock = Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        """
+        Orders the label values by label name.
+            :param labels: Label names mapped to their values.
+            :return: Tuple of label values.
+            :raises ValueError: If the label names do not match the metric's.
+        """
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, "
+                f"got {tuple(labels)}"
+            )
+
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"Metric {self.name} has no label {e}") from e
+
+    def _header(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self._type}",
+        ]
+
+    def _labels(self, key: Tuple[str, ...]) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter."""
+
+    _type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        """
+        Increments the counter.
+            :param amount: Non-negative increment.
+            :param labels: Label values of the child to increment.
+            :raises ValueError: If amount is negative or the labels do not match.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """
+        Returns the current value of a child.
+            :param labels: Label values of the child.
+            :return: The counter value, 0 if never incremented.
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+
+        return self._header() + [
+            format_sample(self.name, self._labels(key), value) for key, value in values
+        ]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    _type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        """
+        Sets the gauge.
+            :param value: New value.
+            :param labels: Label values of the child to set.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels: str) -> float:
+        """
+        Returns the current value of a child.
+            :param labels: Label values of the child.
+            :return: The gauge value, 0 if never set.
+        """
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+
+        return self._header() + [
+            format_sample(self.name, self._labels(key), value) for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    """
+    Distribution of observed values over fixed upper bounds. Bucket counts are
+    kept per bucket and made cumulative only when exposed, so an observation
+    costs one binary search and three additions.
+    """
+
+    _type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram buckets must be strictly increasing")
+
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        # Per child: bucket counts (the last one is +Inf), sum, count.
+        self._children: Dict[Tuple[str, ...], List] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Records an observation.
+            :param value: Observed value, in seconds for latencies.
+            :param labels: Label values of the child to record into.
+        """
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+
+            child[0][index] += 1
+            child[1] += value
+            child[2] += 1
+
+    def count(self, **labels: str) -> int:
+        """
+        Returns the number of observations of a child.
+            :param labels: Label values of the child.
+            :return: The observation count, 0 if nothing was observed.
+        """
+        with self._lock:
+            child = self._children.get(self._key(labels))
+            return child[2] if child else 0
+
+    def expose(self) -> List[str]:
+        with self._lock:
+            children = sorted(
+                (key, (list(counts), total, count))
+                for key, (counts, total, count) in self._children.items()
+            )
+
+        lines = self._header()
+        bounds = self.buckets + (float("inf"),)
+
+        for key, (counts, total, count) in children:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, bucket_count in zip(bounds, counts):
+                cumulative += bucket_count
+                lines.append(
+                    format_sample(
+                        f"{self.name}_bucket",
+                        {**labels, "le": _format_value(bound)},
+                        cumulative,
+                    )
+                )
+            lines.append(format_sample(f"{self.name}_sum", labels, total))
+            lines.append(format_sample(f"{self.name}_count", labels, count))
+
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Collection of metrics rendered together in the Prometheus text format.
+    Besides metrics, it accepts collectors that build their samples at scrape
+    time from state kept elsewhere, such as the connection pool counters.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._collectors: Dict[str, Collector] = {}
+        self._lock: Lock = Lock()
+
+    def register(self, name: str, collector: Collector) -> Collector:
+        """
+        Registers a metric or collector.
+            :param name: Unique name, the metric name for metrics.
+            :param collector: Object exposing its samples.
+            :return: The registered collector.
+            :raises ValueError: If the name is already registered.
+        """
+        with self._lock:
+            if name in self._collectors:
+                raise ValueError(f"Collector {name} is already registered")
+            self._collectors[name] = collector
+
+        return collector
+
+    def unregister(self, name: str) -> None:
+        """
+        Removes a metric or collector, if registered.
+            :param name: Name it was registered under.
+        """
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Creates and registers a counter."""
+        return self.register(name, Counter(name, documentation, labelnames))
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Creates and registers a gauge."""
+        return self.register(name, Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Creates and registers a histogram."""
+        return self.register(name, Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Renders every registered metric and collector.
+            :return: The exposition text, ending with a newline.
+        """
+        with self._lock:
+            collectors: Iterable[Collector] = list(self._collectors.values())
+
+        lines = [line for collector in collectors for line in collector.expose()]
+        return "\n".join(lines) + "\n"
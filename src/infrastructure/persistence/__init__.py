@@ -1,4 +1,29 @@
+from .cached_trip_repository import CachedTripRepository
+from .in_memory_exchange_rate_repository import InMemoryExchangeRateRepository
+from .in_memory_expense_repository import InMemoryExpenseRepository
+from .in_memory_trip_repository import InMemoryTripRepository
+from .mysql_exchange_rate_repository import MySQLExchangeRateRepository
 from .mysql_expense_repository import MySQLExpenseRepository
 from .mysql_trip_repository import MySQLTripRepository
+from .repository_factory import (REPOSITORY_BACKENDS,
+                                 create_exchange_rate_repository,
+                                 create_repositories)
+from .sqlite_exchange_rate_repository import SQLiteExchangeRateRepository
+from .sqlite_expense_repository import SQLiteExpenseRepository
+from .sqlite_trip_repository import SQLiteTripRepository
 
-__all__ = ["MySQLExpenseRepository", "MySQLTripRepository"]
+__all__ = [
+    "CachedTripRepository",
+    "create_exchange_rate_repository",
+    "create_repositories",
+    "InMemoryExchangeRateRepository",
+    "InMemoryExpenseRepository",
+    "InMemoryTripRepository",
+    "MySQLExchangeRateRepository",
+    "MySQLExpenseRepository",
+    "MySQLTripRepository",
+    "REPOSITORY_BACKENDS",
+    "SQLiteExchangeRateRepository",
+    "SQLiteExpenseRepository",
+    "SQLiteTripRepository",
+]
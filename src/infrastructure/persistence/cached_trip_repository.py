@@ -0,0 +1,134 @@
+from datetime import date
+from threading import Lock
+from typing import Dict, List
+from uuid import UUID
+from weakref import WeakValueDictionary
+
+from core.domain import Trip
+from core.interfaces.repositories import TripRepository
+from infrastructure.caching import TTLLRUCache
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class CachedTripRepository(TripRepository):
+    """
+    Read-through caching decorator for a TripRepository.
+    Keeps recently used trips in a bounded LRU cache with a TTL. Every miss is
+    reloaded from the wrapped repository; an identity map then canonicalizes the
+    reloaded trip, so an unchanged trip still referenced elsewhere is served as
+    the same instance. Trips are never mutated: a changed trip replaces the
+    live instance in the map. Writes go to the wrapped repository and
+    invalidate the cached trip.
+    """
+
+    def __init__(self, trip_repository: TripRepository, cache: TTLLRUCache) -> None:
+        """
+        Initializes the decorator.
+            :param trip_repository: Repository that owns the trip data.
+            :param cache: Bounded cache for trips keyed by trip ID.
+        """
+        self._trip_repository: TripRepository = trip_repository
+        self._cache: TTLLRUCache = cache
+        self._identity_map: "WeakValueDictionary[UUID, Trip]" = WeakValueDictionary()
+        self._identity_lock: Lock = Lock()
+        self._identity_hits: int = 0
+
+    def save(self, trip: Trip) -> None:
+        """
+        Saves a trip through the wrapped repository and invalidates its cache entry.
+            :param trip: The trip object to be saved.
+        """
+        self._trip_repository.save(trip)
+        self.invalidate(trip.trip_id)
+
+    def get_by_id(self, trip_id: UUID) -> Trip:
+        """
+        Retrieves a trip from the cache or reloads it from the wrapped repository.
+            :param trip_id: Unique identifier for the trip.
+            :return: Trip object corresponding to the given trip_id.
+        """
+        trip = self._cache.get(trip_id)
+        if trip is not None:
+            return trip
+
+        trip = self._canonicalize(self._trip_repository.get_by_id(trip_id))
+        self._cache.set(trip_id, trip)
+        return trip
+
+    def _canonicalize(self, reloaded: Trip) -> Trip:
+        """
+        Maps a freshly loaded trip onto the live instance for its ID when both
+        hold the same state; otherwise the reloaded trip becomes the live one.
+            :param reloaded: Trip just read from the wrapped repository.
+            :return: The canonical Trip instance for the reloaded trip ID.
+        """
+        with self._identity_lock:
+            trip = self._identity_map.get(reloaded.trip_id)
+            if trip is not None and self._same_state(trip, reloaded):
+                self._identity_hits += 1
+                return trip
+
+            self._identity_map[reloaded.trip_id] = reloaded
+            return reloaded
+
+    @staticmethod
+    def _same_state(trip: Trip, other: Trip) -> bool:
+        """
+        Compares every stored field of two trips.
+            :param trip: First trip.
+            :param other: Second trip.
+            :return: True if all the fields are equal.
+        """
+        return all(
+            getattr(trip, slot) == getattr(other, slot)
+            for slot in Trip.__slots__
+            if slot != "__weakref__"
+        )
+
+    def get_all(self) -> List[Trip]:
+        """
+        Retrieves all trips from the wrapped repository.
+            :return: A list of all Trip objects.
+        """
+        return self._trip_repository.get_all()
+
+    def get_dashboard_totals(self, reference_date: date) -> Dict[str, int]:
+        """
+        Aggregates trip statistics through the wrapped repository.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Dictionary with total_trips, active_trips and total_days.
+        """
+        return self._trip_repository.get_dashboard_totals(reference_date)
+
+    def get_active_currencies(self, reference_date: date) -> List[str]:
+        """
+        Lists the currencies of the active trips through the wrapped repository.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Sorted list of currency codes.
+        """
+        return self._trip_repository.get_active_currencies(reference_date)
+
+    def invalidate(self, trip_id: UUID) -> None:
+        """
+        Drops a trip from the cache and the identity map.
+            :param trip_id: Unique identifier for the trip.
+        """
+        self._cache.invalidate(trip_id)
+        with self._identity_lock:
+            self._identity_map.pop(trip_id, None)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """
+        Returns the cache counters, including how many reloads were mapped onto
+        a live instance by the identity map.
+            :return: Dictionary with cache statistics and hit rates.
+        """
+        stats = dict(self._cache.stats)
+
+        with self._identity_lock:
+            stats["identity_map_hits"] = self._identity_hits
+            stats["identity_map_size"] = len(self._identity_map)
+
+        return stats
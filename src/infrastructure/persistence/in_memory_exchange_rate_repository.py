@@ -0,0 +1,67 @@
+from bisect import bisect_left, bisect_right
+from datetime import date
+from threading import RLock
+from typing import Dict, List, Optional, Tuple
+
+from core.domain import ExchangeRate
+from core.interfaces.repositories import ExchangeRateRepository
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class InMemoryExchangeRateRepository(ExchangeRateRepository):
+    """
+    In-process implementation of ExchangeRateRepository for tests, demos and
+    load testing. Each currency pair keeps its dates sorted in a list next to
+    the matching rates, so a lookup is a binary search. Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock: RLock = RLock()
+        # (base_currency, target_currency) -> (sorted dates, rates by position)
+        self._series: Dict[Tuple[str, str], Tuple[List[date], List[float]]] = {}
+
+    def save_many(self, rates: List[ExchangeRate]) -> None:
+        """
+        Saves several rates, replacing any stored for the same pair and date.
+            :param rates: ExchangeRate objects to be saved.
+        """
+        with self._lock:
+            for rate in rates:
+                dates, values = self._series.setdefault(
+                    (rate.base_currency, rate.target_currency), ([], [])
+                )
+                position = bisect_left(dates, rate.rate_date)
+
+                if position < len(dates) and dates[position] == rate.rate_date:
+                    values[position] = rate.rate
+                else:
+                    dates.insert(position, rate.rate_date)
+                    values.insert(position, rate.rate)
+
+    def get_rate(
+        self, base_currency: str, target_currency: str, on_date: date
+    ) -> Optional[ExchangeRate]:
+        """
+        Retrieves the most recent rate published on or before a date.
+            :param base_currency: Currency code converted from.
+            :param target_currency: Currency code converted into.
+            :param on_date: Date the rate is needed for.
+            :return: The rate, or None if none was stored up to that date.
+        """
+        with self._lock:
+            series = self._series.get((base_currency.upper(), target_currency.upper()))
+            if series is None:
+                return None
+
+            dates, values = series
+            position = bisect_right(dates, on_date)
+            if position == 0:
+                return None
+
+            return ExchangeRate(
+                dates[position - 1],
+                base_currency,
+                target_currency,
+                values[position - 1],
+            )
@@ -0,0 +1,299 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from datetime import date
+from itertools import chain
+from threading import RLock
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from application.dto import ExpenseColumns
+from core.domain import Expense
+from core.enums import ExpenseType, PaymentMethod
+from core.interfaces.repositories import ExpenseRepository
+from infrastructure.monitoring import instrument_repository
+
+
+def _expense_sort_key(expense: Expense) -> str:
+    """
+    Orders expenses of the same date like the MySQL ORDER BY expense_id,
+    which compares the CHAR(36) form of the UUID.
+    """
+    return str(expense.expense_id)
+
+
+class _TripExpenses:
+    """
+    Secondary index of the expenses of one trip: the distinct dates in sorted
+    order, one bucket per date sorted by expense ID, and the daily rollup
+    (cash, card, total, count) kept up to date on every save.
+    """
+
+    __slots__ = ("dates", "buckets", "daily_totals")
+
+    def __init__(self) -> None:
+        self.dates: List[date] = []
+        self.buckets: Dict[date, List[Expense]] = {}
+        self.daily_totals: Dict[date, List[float]] = {}
+
+    def add(self, expense: Expense) -> None:
+        expense_date = expense.expense_date
+        bucket = self.buckets.get(expense_date)
+
+        if bucket is None:
+            insort(self.dates, expense_date)
+            bucket = self.buckets[expense_date] = []
+            self.daily_totals[expense_date] = [0.0, 0.0, 0.0, 0]
+
+        insort(bucket, expense, key=_expense_sort_key)
+
+        rollup = self.daily_totals[expense_date]
+        amount = expense.converted_amount_cop
+        rollup[0 if expense.payment_method == PaymentMethod.CASH else 1] += amount
+        rollup[2] += amount
+        rollup[3] += 1
+
+    def ordered(self) -> List[Expense]:
+        return list(chain.from_iterable(self.buckets[day] for day in self.dates))
+
+
+@instrument_repository
+class InMemoryExpenseRepository(ExpenseRepository):
+    """
+    In-process implementation of ExpenseRepository for tests, demos and load
+    testing. Expenses are indexed by trip and then by date, so lookups by trip
+    and date are a dictionary hit, keyset pages start with a binary search and
+    totals come from a rollup instead of a scan, mirroring the MySQL indexes
+    and the trip_daily_totals table.
+    Thread-safe. Returned Expense objects are the stored ones and must be
+    treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self._lock: RLock = RLock()
+        self._trips: Dict[UUID, _TripExpenses] = defaultdict(_TripExpenses)
+        self._expense_ids: Set[UUID] = set()
+        self._total_amount: float = 0.0
+
+    def save(self, expense: Expense) -> None:
+        """
+        Saves an expense and adds it to the daily rollup.
+            :param expense: Expense object to be saved.
+            :raises RuntimeError: If an expense with the same ID already exists.
+        """
+        self.save_many([expense])
+
+    def save_many(self, expenses: List[Expense]) -> None:
+        """
+        Saves several expenses at once; either all of them are stored or none.
+            :param expenses: Expense objects to be saved.
+            :raises RuntimeError: If any expense ID is already stored or repeated.
+        """
+        with self._lock:
+            new_ids = {expense.expense_id for expense in expenses}
+            if len(new_ids) != len(expenses) or not new_ids.isdisjoint(
+                self._expense_ids
+            ):
+                raise RuntimeError("Error saving expenses: duplicate expense ID")
+
+            for expense in expenses:
+                self._trips[expense.trip_id].add(expense)
+                self._total_amount += expense.converted_amount_cop
+
+            self._expense_ids |= new_ids
+
+    def get_by_trip_and_date(self, trip_id: UUID, expense_date: date) -> List[Expense]:
+        """
+        Retrieves the expenses of a trip on a specific date.
+            :param trip_id: Unique identifier for the trip.
+            :param expense_date: Date of the expenses.
+            :return: List of Expense objects ordered by expense ID.
+        """
+        with self._lock:
+            trip_expenses = self._trips.get(trip_id)
+            if trip_expenses is None:
+                return []
+
+            return list(trip_expenses.buckets.get(expense_date, ()))
+
+    def get_by_trip_id(self, trip_id: UUID) -> List[Expense]:
+        """
+        Retrieves all expenses for a specific trip.
+            :param trip_id: Unique identifier for the trip.
+            :return: List of Expense objects ordered by date and expense ID.
+        """
+        with self._lock:
+            trip_expenses = self._trips.get(trip_id)
+            return trip_expenses.ordered() if trip_expenses else []
+
+    def iter_by_trip_id(
+        self, trip_id: UUID, batch_size: int = 1000
+    ) -> Iterator[Expense]:
+        """
+        Streams all expenses for a specific trip in keyset pages, so the lock is
+        only held while each page is read.
+            :param trip_id: Unique identifier for the trip.
+            :param batch_size: Number of expenses read at a time.
+            :return: Iterator of Expense objects ordered by date and expense ID.
+        """
+        after = None
+        while True:
+            page = self.get_page(trip_id, batch_size, after)
+            yield from page
+
+            if len(page) < batch_size:
+                return
+
+            last_expense = page[-1]
+            after = (last_expense.expense_date, last_expense.expense_id)
+
+    def get_page(
+        self,
+        trip_id: UUID,
+        limit: int,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> List[Expense]:
+        """
+        Retrieves a page of expenses with keyset pagination on
+        (expense_date, expense_id). The start position is found by binary search
+        over the dates and then within the date's bucket.
+            :param trip_id: Unique identifier for the trip.
+            :param limit: Maximum number of expenses to return.
+            :param after: (expense_date, expense_id) of the last expense already seen.
+            :return: List of Expense objects following the given position.
+        """
+        with self._lock:
+            trip_expenses = self._trips.get(trip_id)
+            if trip_expenses is None:
+                return []
+
+            dates = trip_expenses.dates
+            date_index, start = 0, 0
+
+            if after is not None:
+                after_date, after_id = after
+                date_index = bisect_left(dates, after_date)
+
+                if date_index < len(dates) and dates[date_index] == after_date:
+                    start = bisect_right(
+                        trip_expenses.buckets[after_date],
+                        str(after_id),
+                        key=_expense_sort_key,
+                    )
+
+            page: List[Expense] = []
+            while date_index < len(dates) and len(page) < limit:
+                bucket = trip_expenses.buckets[dates[date_index]]
+                page.extend(bucket[start : start + limit - len(page)])
+                date_index += 1
+                start = 0
+
+            return page
+
+    def get_columns(self, trip_id: UUID, batch_size: int = 10000) -> ExpenseColumns:
+        """
+        Loads the report columns of every expense of a trip.
+            :param trip_id: Unique identifier for the trip.
+            :param batch_size: Number of expenses encoded at a time.
+            :return: The expenses of the trip as columns.
+        """
+        expenses = self.get_by_trip_id(trip_id)
+
+        return ExpenseColumns.from_batches(
+            [
+                (
+                    expense.expense_date,
+                    expense.expense_type.value,
+                    expense.payment_method.value,
+                    expense.converted_amount_cop,
+                )
+                for expense in expenses[start : start + batch_size]
+            ]
+            for start in range(0, len(expenses), batch_size)
+        )
+
+    def get_daily_total(self, trip_id: UUID, expense_date: date) -> float:
+        """
+        Retrieves the total spent on a trip on a given date from the rollup.
+            :param trip_id: Unique identifier for the trip.
+            :param expense_date: Date of the expenses.
+            :return: Total amount in COP for that trip and date.
+        """
+        with self._lock:
+            trip_expenses = self._trips.get(trip_id)
+            if trip_expenses is None:
+                return 0.0
+
+            rollup = trip_expenses.daily_totals.get(expense_date)
+            return rollup[2] if rollup else 0.0
+
+    def get_daily_totals(self, trip_id: UUID) -> Dict[date, Dict[str, float]]:
+        """
+        Retrieves the spend of a trip per date from the rollup.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with dates as keys and cash, card and total as values.
+        """
+        with self._lock:
+            trip_expenses = self._trips.get(trip_id)
+            if trip_expenses is None:
+                return {}
+
+            return {
+                expense_date: dict(
+                    zip(
+                        ("cash", "card", "total"),
+                        trip_expenses.daily_totals[expense_date],
+                    )
+                )
+                for expense_date in trip_expenses.dates
+            }
+
+    def get_type_totals(self, trip_id: UUID) -> Dict[ExpenseType, Dict[str, float]]:
+        """
+        Retrieves the spend of a trip per expense type, grouped in the same order
+        as the MySQL query.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with expense types as keys and cash, card and total
+                as values.
+        """
+        grouped: Dict[Tuple[str, str], float] = defaultdict(float)
+        for expense in self.get_by_trip_id(trip_id):
+            key = (expense.expense_type.value, expense.payment_method.value)
+            grouped[key] += expense.converted_amount_cop
+
+        type_totals: Dict[ExpenseType, Dict[str, float]] = {}
+        for (expense_type, payment_method), amount in sorted(grouped.items()):
+            entry = type_totals.setdefault(
+                ExpenseType(expense_type), {"cash": 0.0, "card": 0.0, "total": 0.0}
+            )
+
+            if payment_method == PaymentMethod.CASH.value:
+                entry["cash"] += amount
+            else:
+                entry["card"] += amount
+
+            entry["total"] += amount
+
+        return type_totals
+
+    def get_trip_totals(self, trip_id: UUID) -> Dict[str, float]:
+        """
+        Retrieves the overall spend and number of expenses of a trip from the rollup.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with total (amount in COP) and count.
+        """
+        with self._lock:
+            trip_expenses = self._trips.get(trip_id)
+            rollups = trip_expenses.daily_totals.values() if trip_expenses else ()
+
+            return {
+                "total": float(sum(rollup[2] for rollup in rollups)),
+                "count": int(sum(rollup[3] for rollup in rollups)),
+            }
+
+    def get_total_amount(self) -> float:
+        """
+        Retrieves the sum of the converted amounts of every stored expense.
+            :return: Total amount in COP across all trips.
+        """
+        with self._lock:
+            return self._total_amount
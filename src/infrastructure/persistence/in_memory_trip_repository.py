@@ -0,0 +1,99 @@
+from bisect import insort
+from datetime import date
+from threading import RLock
+from typing import Dict, List
+from uuid import UUID
+
+from core.domain import Trip
+from core.exceptions import TripNotFoundError
+from core.interfaces.repositories import TripRepository
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class InMemoryTripRepository(TripRepository):
+    """
+    In-process implementation of TripRepository for tests, demos and load
+    testing. Trips are indexed by ID and kept in a list sorted by start date,
+    so get_all does not sort on every call. Thread-safe; stored Trip objects
+    are shared with callers, as trips are immutable.
+    """
+
+    def __init__(self) -> None:
+        self._lock: RLock = RLock()
+        self._trips: Dict[UUID, Trip] = {}
+        self._by_start_date: List[Trip] = []
+
+    def save(self, trip: Trip) -> None:
+        """
+        Saves a trip.
+            :param trip: Trip object to be saved.
+            :raises RuntimeError: If a trip with the same ID already exists.
+        """
+        with self._lock:
+            if trip.trip_id in self._trips:
+                raise RuntimeError(
+                    f"Error saving trip {trip.trip_id}: duplicate trip ID"
+                )
+
+            self._trips[trip.trip_id] = trip
+            insort(self._by_start_date, trip, key=lambda stored: stored.start_date)
+
+    def get_by_id(self, trip_id: UUID) -> Trip:
+        """
+        Retrieves a trip by its unique identifier.
+            :param trip_id: Unique identifier for the trip.
+            :return: Trip object corresponding to the given trip_id.
+            :raises TripNotFoundError: If no trip has that ID.
+        """
+        with self._lock:
+            trip = self._trips.get(trip_id)
+
+        if trip is None:
+            raise TripNotFoundError(trip_id)
+
+        return trip
+
+    def get_all(self) -> List[Trip]:
+        """
+        Retrieves all trips, most recent start date first.
+            :return: List of all Trip objects.
+        """
+        with self._lock:
+            return self._by_start_date[::-1]
+
+    def get_dashboard_totals(self, reference_date: date) -> Dict[str, int]:
+        """
+        Aggregates trip counters for the dashboard in a single pass.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Dictionary with total_trips, active_trips and total_days.
+        """
+        with self._lock:
+            trips = list(self._trips.values())
+
+        return {
+            "total_trips": len(trips),
+            "active_trips": sum(
+                trip.start_date <= reference_date <= trip.end_date for trip in trips
+            ),
+            "total_days": sum(
+                (trip.end_date - trip.start_date).days + 1 for trip in trips
+            ),
+        }
+
+    def get_active_currencies(self, reference_date: date) -> List[str]:
+        """
+        Lists the distinct currencies of the trips active on a date.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Sorted list of currency codes.
+        """
+        with self._lock:
+            trips = list(self._trips.values())
+
+        return sorted(
+            {
+                trip.currency
+                for trip in trips
+                if trip.start_date <= reference_date <= trip.end_date
+            }
+        )
@@ -0,0 +1,90 @@
+from datetime import date
+from typing import List, Optional
+
+from mysql.connector import Error
+
+from core.domain import ExchangeRate
+from core.interfaces.repositories import ExchangeRateRepository
+from infrastructure.database import DatabaseConnection
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class MySQLExchangeRateRepository(ExchangeRateRepository):
+    """
+    MySQL implementation of ExchangeRateRepository.
+    Lookups are answered by the (base_currency, target_currency, rate_date)
+    primary key, reading it backwards from the requested date.
+    """
+
+    _UPSERT_QUERY = """
+        INSERT INTO exchange_rates (base_currency, target_currency, rate_date, rate)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE rate = VALUES(rate)
+    """
+    _SELECT_LATEST_QUERY = """
+        SELECT rate_date, rate FROM exchange_rates
+        WHERE base_currency = %s AND target_currency = %s AND rate_date <= %s
+        ORDER BY rate_date DESC
+        LIMIT 1
+    """
+
+    def __init__(self, db_connection: DatabaseConnection) -> None:
+        self._db_connection = db_connection
+
+    def save_many(self, rates: List[ExchangeRate]) -> None:
+        """
+        Saves several rates with a batched upsert inside one transaction.
+            :param rates: ExchangeRate objects to be saved.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        if not rates:
+            return
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                connection.start_transaction()
+                cursor = connection.cursor()
+                cursor.executemany(
+                    self._UPSERT_QUERY,
+                    [
+                        (
+                            rate.base_currency,
+                            rate.target_currency,
+                            rate.rate_date,
+                            rate.rate,
+                        )
+                        for rate in rates
+                    ],
+                )
+                connection.commit()
+        except Error as e:
+            raise RuntimeError(f"Error saving exchange rates: {e}") from e
+
+    def get_rate(
+        self, base_currency: str, target_currency: str, on_date: date
+    ) -> Optional[ExchangeRate]:
+        """
+        Retrieves the most recent rate published on or before a date.
+            :param base_currency: Currency code converted from.
+            :param target_currency: Currency code converted into.
+            :param on_date: Date the rate is needed for.
+            :return: The rate, or None if none was stored up to that date.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    self._SELECT_LATEST_QUERY,
+                    (base_currency.upper(), target_currency.upper(), on_date),
+                )
+                result = cursor.fetchone()
+        except Error as e:
+            raise RuntimeError(f"Error retrieving exchange rate: {e}") from e
+
+        if not result:
+            return None
+
+        rate_date, rate = result
+        return ExchangeRate(rate_date, base_currency, target_currency, float(rate))
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import date
+from typing import Dict, List
 from uuid import UUID
 
 from mysql.connector import Error
@@ -7,14 +8,28 @@ from core.domain import Trip
 from core.exceptions import TripNotFoundError
 from core.interfaces.repositories import TripRepository
 from infrastructure.database import DatabaseConnection
+from infrastructure.monitoring import instrument_repository
 
 
+@instrument_repository
 class MySQLTripRepository(TripRepository):
     """
     MySQL implementation of TripRepository.
     Handles persistence operations for Trip entities.
     """
 
+    # Column order of every SELECT that is mapped to a Trip; rows are read as
+    # plain tuples and unpacked positionally in _map_to_trip.
+    _COLUMNS = (
+        "trip_id",
+        "start_date",
+        "end_date",
+        "is_international",
+        "daily_budget",
+        "currency",
+    )
+    _SELECT_COLUMNS = ", ".join(_COLUMNS)
+
     def __init__(self, db_connection: DatabaseConnection) -> None:
         self._db_connection = db_connection
 
@@ -56,25 +71,18 @@ class MySQLTripRepository(TripRepository):
             :return: Trip object corresponding to the given trip_id.
         """
 
-        query = "SELECT * FROM trips WHERE trip_id = %s"
+        query = f"SELECT {self._SELECT_COLUMNS} FROM trips WHERE trip_id = %s"
 
         try:
             with self._db_connection.get_connection() as connection:
-                cursor = connection.cursor(dictionary=True)
+                cursor = connection.cursor()
                 cursor.execute(query, (str(trip_id),))
                 result = cursor.fetchone()
 
                 if not result:
                     raise TripNotFoundError(trip_id)
 
-                return Trip(
-                    trip_id=UUID(result["trip_id"]),
-                    start_date=result["start_date"],
-                    end_date=result["end_date"],
-                    is_international=result["is_international"],
-                    daily_budget=float(result["daily_budget"]),
-                    currency=result["currency"],
-                )
+                return self._map_to_trip(result)
         except Error as e:
             raise RuntimeError(f"Error retrieving trip by ID {trip_id}: {e}") from e
 
@@ -85,24 +93,80 @@ class MySQLTripRepository(TripRepository):
         Returns:
             List of all Trip objects.
         """
-        query = "SELECT * FROM trips ORDER BY start_date DESC"
+        query = f"SELECT {self._SELECT_COLUMNS} FROM trips ORDER BY start_date DESC"
 
         try:
             with self._db_connection.get_connection() as connection:
-                cursor = connection.cursor(dictionary=True)
+                cursor = connection.cursor()
                 cursor.execute(query)
                 results = cursor.fetchall()
 
-                return [
-                    Trip(
-                        trip_id=UUID(row["trip_id"]),
-                        start_date=row["start_date"],
-                        end_date=row["end_date"],
-                        is_international=row["is_international"],
-                        daily_budget=float(row["daily_budget"]),
-                        currency=row["currency"],
-                    )
-                    for row in results
-                ]
+                return [self._map_to_trip(row) for row in results]
         except Error as e:
             raise RuntimeError(f"Error retrieving trips: {e}") from e
+
+    def get_dashboard_totals(self, reference_date: date) -> Dict[str, int]:
+        """
+        Aggregates trip counters for the dashboard with a single query.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Dictionary with total_trips, active_trips and total_days.
+        """
+        query = """
+            SELECT
+                COUNT(*) AS total_trips,
+                COALESCE(SUM(start_date <= %s AND end_date >= %s), 0) AS active_trips,
+                COALESCE(SUM(DATEDIFF(end_date, start_date) + 1), 0) AS total_days
+            FROM trips
+        """
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, (reference_date, reference_date))
+                total_trips, active_trips, total_days = cursor.fetchone() or (0, 0, 0)
+
+                return {
+                    "total_trips": int(total_trips or 0),
+                    "active_trips": int(active_trips or 0),
+                    "total_days": int(total_days or 0),
+                }
+        except Error as e:
+            raise RuntimeError(f"Error aggregating trips: {e}") from e
+
+    def get_active_currencies(self, reference_date: date) -> List[str]:
+        """
+        Lists the distinct currencies of the trips active on a date.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Sorted list of currency codes.
+        """
+        query = """
+            SELECT DISTINCT currency FROM trips
+            WHERE start_date <= %s AND end_date >= %s
+            ORDER BY currency
+        """
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, (reference_date, reference_date))
+
+                return [currency for (currency,) in cursor.fetchall()]
+        except Error as e:
+            raise RuntimeError(f"Error retrieving active currencies: {e}") from e
+
+    def _map_to_trip(self, row: tuple) -> Trip:
+        """
+        Maps a database row to a Trip object.
+            :param row: Tuple with the values of _COLUMNS, in that order.
+            :return: Trip object populated with data from the row.
+        """
+        trip_id, start_date, end_date, is_international, daily_budget, currency = row
+
+        return Trip(
+            trip_id=UUID(trip_id),
+            start_date=start_date,
+            end_date=end_date,
+            is_international=is_international,
+            daily_budget=float(daily_budget),
+            currency=currency,
+        )
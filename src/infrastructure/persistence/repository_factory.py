@@ -0,0 +1,90 @@
+from typing import Callable, Tuple
+
+from core.interfaces.repositories import (ExchangeRateRepository,
+                                          ExpenseRepository, TripRepository)
+from infrastructure.database import DatabaseConnection, SQLiteConnection
+from infrastructure.persistence.in_memory_exchange_rate_repository import \
+    InMemoryExchangeRateRepository
+from infrastructure.persistence.in_memory_expense_repository import \
+    InMemoryExpenseRepository
+from infrastructure.persistence.in_memory_trip_repository import \
+    InMemoryTripRepository
+from infrastructure.persistence.mysql_exchange_rate_repository import \
+    MySQLExchangeRateRepository
+from infrastructure.persistence.mysql_expense_repository import \
+    MySQLExpenseRepository
+from infrastructure.persistence.mysql_trip_repository import \
+    MySQLTripRepository
+from infrastructure.persistence.sqlite_exchange_rate_repository import \
+    SQLiteExchangeRateRepository
+from infrastructure.persistence.sqlite_expense_repository import \
+    SQLiteExpenseRepository
+from infrastructure.persistence.sqlite_trip_repository import \
+    SQLiteTripRepository
+
+REPOSITORY_BACKENDS = ("mysql", "sqlite", "memory")
+
+
+def create_repositories(
+    backend: str,
+    db_connection_factory: Callable[[], DatabaseConnection] = DatabaseConnection,
+    sqlite_connection_factory: Callable[[], SQLiteConnection] = SQLiteConnection,
+) -> Tuple[TripRepository, ExpenseRepository]:
+    """
+    Creates the trip and expense repositories of a storage backend.
+        :param backend: "mysql", "sqlite" or "memory".
+        :param db_connection_factory: Provides the MySQL connection; only
+            called by the mysql backend.
+        :param sqlite_connection_factory: Provides the SQLite connection; only
+            called by the sqlite backend.
+        :return: Tuple of trip repository and expense repository.
+        :raises ValueError: If the backend is unknown.
+    """
+    if backend == "mysql":
+        db_connection = db_connection_factory()
+        return MySQLTripRepository(db_connection), MySQLExpenseRepository(db_connection)
+
+    if backend == "sqlite":
+        sqlite_connection = sqlite_connection_factory()
+        return (
+            SQLiteTripRepository(sqlite_connection),
+            SQLiteExpenseRepository(sqlite_connection),
+        )
+
+    if backend == "memory":
+        return InMemoryTripRepository(), InMemoryExpenseRepository()
+
+    raise ValueError(
+        f"Unknown repository backend '{backend}', "
+        f"expected one of {', '.join(REPOSITORY_BACKENDS)}"
+    )
+
+
+def create_exchange_rate_repository(
+    backend: str,
+    db_connection_factory: Callable[[], DatabaseConnection] = DatabaseConnection,
+    sqlite_connection_factory: Callable[[], SQLiteConnection] = SQLiteConnection,
+) -> ExchangeRateRepository:
+    """
+    Creates the historical exchange-rate store of a storage backend.
+        :param backend: "mysql", "sqlite" or "memory".
+        :param db_connection_factory: Provides the MySQL connection; only
+            called by the mysql backend.
+        :param sqlite_connection_factory: Provides the SQLite connection; only
+            called by the sqlite backend.
+        :return: The exchange-rate repository.
+        :raises ValueError: If the backend is unknown.
+    """
+    if backend == "mysql":
+        return MySQLExchangeRateRepository(db_connection_factory())
+
+    if backend == "sqlite":
+        return SQLiteExchangeRateRepository(sqlite_connection_factory())
+
+    if backend == "memory":
+        return InMemoryExchangeRateRepository()
+
+    raise ValueError(
+        f"Unknown repository backend '{backend}', "
+        f"expected one of {', '.join(REPOSITORY_BACKENDS)}"
+    )
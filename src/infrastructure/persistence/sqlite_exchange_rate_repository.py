@@ -0,0 +1,96 @@
+from datetime import date
+from sqlite3 import Error
+from typing import List, Optional
+
+from core.domain import ExchangeRate
+from core.interfaces.repositories import ExchangeRateRepository
+from infrastructure.database import SQLiteConnection
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class SQLiteExchangeRateRepository(ExchangeRateRepository):
+    """
+    SQLite implementation of ExchangeRateRepository. The table is clustered on
+    (base_currency, target_currency, rate_date), so a lookup is one backward
+    seek in the key; dates are stored as ISO text.
+    """
+
+    _UPSERT_QUERY = """
+        INSERT INTO exchange_rates (base_currency, target_currency, rate_date, rate)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (base_currency, target_currency, rate_date) DO UPDATE
+        SET rate = excluded.rate
+    """
+    _SELECT_LATEST_QUERY = """
+        SELECT rate_date, rate FROM exchange_rates
+        WHERE base_currency = ? AND target_currency = ? AND rate_date <= ?
+        ORDER BY rate_date DESC
+        LIMIT 1
+    """
+
+    def __init__(self, db_connection: SQLiteConnection) -> None:
+        self._db_connection = db_connection
+
+    def save_many(self, rates: List[ExchangeRate]) -> None:
+        """
+        Saves several rates with a batched upsert inside one transaction.
+            :param rates: ExchangeRate objects to be saved.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        if not rates:
+            return
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    self._UPSERT_QUERY,
+                    [
+                        (
+                            rate.base_currency,
+                            rate.target_currency,
+                            rate.rate_date.isoformat(),
+                            rate.rate,
+                        )
+                        for rate in rates
+                    ],
+                )
+                connection.commit()
+        except Error as e:
+            raise RuntimeError(f"Error saving exchange rates: {e}") from e
+
+    def get_rate(
+        self, base_currency: str, target_currency: str, on_date: date
+    ) -> Optional[ExchangeRate]:
+        """
+        Retrieves the most recent rate published on or before a date.
+            :param base_currency: Currency code converted from.
+            :param target_currency: Currency code converted into.
+            :param on_date: Date the rate is needed for.
+            :return: The rate, or None if none was stored up to that date.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    self._SELECT_LATEST_QUERY,
+                    (
+                        base_currency.upper(),
+                        target_currency.upper(),
+                        on_date.isoformat(),
+                    ),
+                )
+                result = cursor.fetchone()
+        except Error as e:
+            raise RuntimeError(f"Error retrieving exchange rate: {e}") from e
+
+        if not result:
+            return None
+
+        rate_date, rate = result
+        return ExchangeRate(
+            date.fromisoformat(rate_date), base_currency, target_currency, rate
+        )
@@ -0,0 +1,473 @@
+from collections import defaultdict
+from datetime import date
+from sqlite3 import Error
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from application.dto import ExpenseColumns
+from core.domain import Expense
+from core.enums import ExpenseType, PaymentMethod
+from core.interfaces.repositories import ExpenseRepository
+from infrastructure.database import SQLiteConnection
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class SQLiteExpenseRepository(ExpenseRepository):
+    """
+    SQLite implementation of ExpenseRepository for single-node deployments.
+    Keeps the trip_daily_totals rollup in sync with the expenses table like
+    the MySQL repository. Writes are batched: an insert of many expenses and
+    its rollup upserts run as two executemany calls inside one transaction.
+    Every statement is a class constant, so SQLite's per-connection statement
+    cache prepares it only once.
+    """
+
+    # Column order of every SELECT that is mapped to an Expense; rows are read as
+    # plain tuples and unpacked positionally in _map_to_expense.
+    _COLUMNS = (
+        "expense_id",
+        "trip_id",
+        "expense_date",
+        "original_amount",
+        "currency",
+        "converted_amount_cop",
+        "payment_method",
+        "expense_type",
+    )
+    _SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+    _PAYMENT_METHODS = {method.value: method for method in PaymentMethod}
+    _EXPENSE_TYPES = {expense_type.value: expense_type for expense_type in ExpenseType}
+
+    _INSERT_QUERY = """
+        INSERT INTO expenses (expense_id, trip_id, expense_date, original_amount,
+            currency, converted_amount_cop, payment_method, expense_type)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    _UPSERT_DAILY_TOTAL_QUERY = """
+        INSERT INTO trip_daily_totals (trip_id, expense_date, cash, card, total,
+            expense_count)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (trip_id, expense_date) DO UPDATE SET
+            cash = cash + excluded.cash,
+            card = card + excluded.card,
+            total = total + excluded.total,
+            expense_count = expense_count + excluded.expense_count
+    """
+
+    _SELECT_BY_TRIP_AND_DATE_QUERY = f"""
+        SELECT {_SELECT_COLUMNS} FROM expenses
+        WHERE trip_id = ? AND expense_date = ?
+        ORDER BY expense_id
+    """
+
+    _SELECT_BY_TRIP_QUERY = f"""
+        SELECT {_SELECT_COLUMNS} FROM expenses
+        WHERE trip_id = ?
+        ORDER BY expense_date, expense_id
+    """
+
+    _FIRST_PAGE_QUERY = f"""
+        SELECT {_SELECT_COLUMNS} FROM expenses
+        WHERE trip_id = ?
+        ORDER BY expense_date, expense_id
+        LIMIT ?
+    """
+
+    # Row values let the index seek straight to the (date, id) position.
+    _NEXT_PAGE_QUERY = f"""
+        SELECT {_SELECT_COLUMNS} FROM expenses
+        WHERE trip_id = ? AND (expense_date, expense_id) > (?, ?)
+        ORDER BY expense_date, expense_id
+        LIMIT ?
+    """
+
+    _SELECT_COLUMNS_QUERY = """
+        SELECT expense_date, expense_type, payment_method, converted_amount_cop
+        FROM expenses
+        WHERE trip_id = ?
+    """
+
+    _DAILY_TOTAL_QUERY = """
+        SELECT total FROM trip_daily_totals
+        WHERE trip_id = ? AND expense_date = ?
+    """
+
+    _DAILY_TOTALS_QUERY = """
+        SELECT expense_date, cash, card, total FROM trip_daily_totals
+        WHERE trip_id = ?
+        ORDER BY expense_date
+    """
+
+    _TYPE_TOTALS_QUERY = """
+        SELECT expense_type, payment_method, SUM(converted_amount_cop)
+        FROM expenses
+        WHERE trip_id = ?
+        GROUP BY expense_type, payment_method
+        ORDER BY expense_type, payment_method
+    """
+
+    _TRIP_TOTALS_QUERY = """
+        SELECT COALESCE(SUM(total), 0), COALESCE(SUM(expense_count), 0)
+        FROM trip_daily_totals
+        WHERE trip_id = ?
+    """
+
+    _TOTAL_AMOUNT_QUERY = "SELECT COALESCE(SUM(total), 0) FROM trip_daily_totals"
+
+    def __init__(self, db_connection: SQLiteConnection) -> None:
+        self._db_connection = db_connection
+
+    def save(self, expense: Expense) -> None:
+        """
+        Saves an expense to the database.
+            :param expense: Expense object to be saved.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        self.save_many([expense])
+
+    def save_many(self, expenses: List[Expense]) -> None:
+        """
+        Saves several expenses with a batched insert inside one transaction.
+            :param expenses: Expense objects to be saved.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        if not expenses:
+            return
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.executemany(
+                    self._INSERT_QUERY,
+                    [self._to_params(expense) for expense in expenses],
+                )
+                cursor.executemany(
+                    self._UPSERT_DAILY_TOTAL_QUERY,
+                    self._to_daily_total_params(expenses),
+                )
+                connection.commit()
+        except Error as e:
+            raise RuntimeError(f"Error saving expenses: {e}") from e
+
+    def get_by_trip_and_date(self, trip_id: UUID, expense_date: date) -> List[Expense]:
+        """
+        Retrieves all expenses for a specific trip on a given date.
+            :param trip_id: Unique identifier for the trip.
+            :param expense_date: Date of the expenses to retrieve.
+            :return: List of Expense objects ordered by expense ID.
+        """
+        return self._fetch_expenses(
+            self._SELECT_BY_TRIP_AND_DATE_QUERY,
+            (str(trip_id), expense_date.isoformat()),
+        )
+
+    def get_by_trip_id(self, trip_id: UUID) -> List[Expense]:
+        """
+        Retrieves all expenses for a specific trip.
+            :param trip_id: Unique identifier for the trip.
+            :return: List of Expense objects ordered by date and expense ID.
+        """
+        return self._fetch_expenses(self._SELECT_BY_TRIP_QUERY, (str(trip_id),))
+
+    def iter_by_trip_id(
+        self, trip_id: UUID, batch_size: int = 1000
+    ) -> Iterator[Expense]:
+        """
+        Streams all expenses for a specific trip in keyset pages. Each page is
+        read with the connection of the thread consuming the iterator, so it
+        may be advanced from different threads, and no read transaction is
+        held open between pages.
+            :param trip_id: Unique identifier for the trip.
+            :param batch_size: Number of expenses read at a time.
+            :return: Iterator of Expense objects ordered by date and expense ID.
+        """
+        after = None
+        while True:
+            page = self.get_page(trip_id, batch_size, after)
+            yield from page
+
+            if len(page) < batch_size:
+                return
+
+            last_expense = page[-1]
+            after = (last_expense.expense_date, last_expense.expense_id)
+
+    def get_page(
+        self,
+        trip_id: UUID,
+        limit: int,
+        after: Optional[Tuple[date, UUID]] = None,
+    ) -> List[Expense]:
+        """
+        Retrieves a page of expenses with keyset pagination on
+        (expense_date, expense_id), so deep pages cost the same as the first one.
+            :param trip_id: Unique identifier for the trip.
+            :param limit: Maximum number of expenses to return.
+            :param after: (expense_date, expense_id) of the last expense already seen.
+            :return: List of Expense objects following the given position.
+        """
+        if after is None:
+            return self._fetch_expenses(self._FIRST_PAGE_QUERY, (str(trip_id), limit))
+
+        after_date, after_id = after
+        return self._fetch_expenses(
+            self._NEXT_PAGE_QUERY,
+            (str(trip_id), after_date.isoformat(), str(after_id), limit),
+        )
+
+    def get_columns(self, trip_id: UUID, batch_size: int = 10000) -> ExpenseColumns:
+        """
+        Loads the report columns of every expense of a trip, encoding one
+        fetched batch of tuples at a time; ISO date strings are parsed by NumPy.
+            :param trip_id: Unique identifier for the trip.
+            :param batch_size: Number of rows fetched at a time.
+            :return: The expenses of the trip as columns.
+        """
+
+        def fetch_batches(cursor) -> Iterator[List[Tuple]]:
+            rows = cursor.fetchmany(batch_size)
+            while rows:
+                yield rows
+                rows = cursor.fetchmany(batch_size)
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._SELECT_COLUMNS_QUERY, (str(trip_id),))
+                return ExpenseColumns.from_batches(fetch_batches(cursor))
+        except Error as e:
+            raise RuntimeError(f"Error loading expense columns: {e}") from e
+
+    def get_daily_total(self, trip_id: UUID, expense_date: date) -> float:
+        """
+        Retrieves the total spent on a trip on a given date from the rollup.
+            :param trip_id: Unique identifier for the trip.
+            :param expense_date: Date of the expenses.
+            :return: Total amount in COP for that trip and date.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    self._DAILY_TOTAL_QUERY, (str(trip_id), expense_date.isoformat())
+                )
+                result = cursor.fetchone()
+
+                return float(result[0]) if result else 0.0
+        except Error as e:
+            raise RuntimeError(f"Error retrieving daily total: {e}") from e
+
+    def get_daily_totals(self, trip_id: UUID) -> Dict[date, Dict[str, float]]:
+        """
+        Retrieves the spend of a trip per date from the rollup.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with dates as keys and cash, card and total as values.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._DAILY_TOTALS_QUERY, (str(trip_id),))
+
+                return {
+                    date.fromisoformat(expense_date): {
+                        "cash": float(cash),
+                        "card": float(card),
+                        "total": float(total),
+                    }
+                    for expense_date, cash, card, total in cursor.fetchall()
+                }
+        except Error as e:
+            raise RuntimeError(f"Error retrieving daily totals: {e}") from e
+
+    def get_type_totals(self, trip_id: UUID) -> Dict[ExpenseType, Dict[str, float]]:
+        """
+        Retrieves the spend of a trip per expense type with a grouped query.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with expense types as keys and cash, card and total
+                as values.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._TYPE_TOTALS_QUERY, (str(trip_id),))
+
+                type_totals: Dict[ExpenseType, Dict[str, float]] = {}
+                for expense_type, payment_method, amount in cursor.fetchall():
+                    entry = type_totals.setdefault(
+                        self._EXPENSE_TYPES[expense_type],
+                        {"cash": 0.0, "card": 0.0, "total": 0.0},
+                    )
+
+                    if payment_method == PaymentMethod.CASH.value:
+                        entry["cash"] += float(amount)
+                    else:
+                        entry["card"] += float(amount)
+
+                    entry["total"] += float(amount)
+
+                return type_totals
+        except Error as e:
+            raise RuntimeError(f"Error retrieving expense type totals: {e}") from e
+
+    def get_trip_totals(self, trip_id: UUID) -> Dict[str, float]:
+        """
+        Retrieves the overall spend and number of expenses of a trip from the rollup.
+            :param trip_id: Unique identifier for the trip.
+            :return: Dictionary with total (amount in COP) and count.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._TRIP_TOTALS_QUERY, (str(trip_id),))
+                total, count = cursor.fetchone()
+
+                return {"total": float(total), "count": int(count)}
+        except Error as e:
+            raise RuntimeError(f"Error retrieving trip totals: {e}") from e
+
+    def rebuild_daily_totals(self, trip_id: Optional[UUID] = None) -> int:
+        """
+        Recomputes the trip_daily_totals rollup from the expenses table inside
+        one write transaction, so concurrent writes cannot be counted twice.
+            :param trip_id: Trip to rebuild. Rebuilds every trip when omitted.
+            :return: Number of rollup rows written.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        trip_filter = "WHERE trip_id = ?" if trip_id else ""
+        trip_params = (str(trip_id),) if trip_id else ()
+
+        delete_query = f"DELETE FROM trip_daily_totals {trip_filter}"
+        insert_query = f"""
+            INSERT INTO trip_daily_totals (trip_id, expense_date, cash, card, total,
+                expense_count)
+            SELECT trip_id, expense_date,
+                SUM(CASE WHEN payment_method = ? THEN converted_amount_cop ELSE 0 END),
+                SUM(CASE WHEN payment_method = ? THEN 0 ELSE converted_amount_cop END),
+                SUM(converted_amount_cop),
+                COUNT(*)
+            FROM expenses
+            {trip_filter}
+            GROUP BY trip_id, expense_date
+        """
+        cash = PaymentMethod.CASH.value
+
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute(delete_query, trip_params)
+                cursor.execute(insert_query, (cash, cash) + trip_params)
+                rebuilt_rows = cursor.rowcount
+                connection.commit()
+
+                return rebuilt_rows
+        except Error as e:
+            raise RuntimeError(f"Error rebuilding daily totals: {e}") from e
+
+    def get_total_amount(self) -> float:
+        """
+        Retrieves the sum of the converted amounts of every stored expense.
+            :return: Total amount in COP across all trips.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._TOTAL_AMOUNT_QUERY)
+                (total,) = cursor.fetchone()
+
+                return float(total)
+        except Error as e:
+            raise RuntimeError(f"Error aggregating expenses: {e}") from e
+
+    def _fetch_expenses(self, query: str, params: tuple) -> List[Expense]:
+        """
+        Runs a SELECT of _COLUMNS and maps every row to an Expense.
+            :param query: SELECT statement returning _COLUMNS.
+            :param params: Parameters of the statement.
+            :return: List of Expense objects in the order of the query.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params)
+
+                return [self._map_to_expense(row) for row in cursor.fetchall()]
+        except Error as e:
+            raise RuntimeError(f"Error retrieving expenses: {e}") from e
+
+    def _to_params(self, expense: Expense) -> tuple:
+        """
+        Maps an Expense object to the parameters of the insert statement.
+            :param expense: Expense object to be mapped.
+            :return: Tuple of column values in insert order.
+        """
+        return (
+            str(expense.expense_id),
+            str(expense.trip_id),
+            expense.expense_date.isoformat(),
+            expense.original_amount,
+            expense.currency,
+            expense.converted_amount_cop,
+            expense.payment_method.value,
+            expense.expense_type.value,
+        )
+
+    def _to_daily_total_params(self, expenses: List[Expense]) -> List[tuple]:
+        """
+        Aggregates expenses into per-day deltas for the rollup upsert.
+            :param expenses: Expense objects being saved.
+            :return: One parameter tuple per distinct trip and date.
+        """
+        deltas: Dict[Tuple[UUID, date], List[float]] = defaultdict(
+            lambda: [0.0, 0.0, 0.0, 0]
+        )
+
+        for expense in expenses:
+            delta = deltas[(expense.trip_id, expense.expense_date)]
+            amount = expense.converted_amount_cop
+
+            if expense.payment_method == PaymentMethod.CASH:
+                delta[0] += amount
+            else:
+                delta[1] += amount
+
+            delta[2] += amount
+            delta[3] += 1
+
+        return [
+            (str(trip_id), expense_date.isoformat(), *delta)
+            for (trip_id, expense_date), delta in deltas.items()
+        ]
+
+    def _map_to_expense(self, row: tuple) -> Expense:
+        """
+        Maps a database row to an Expense object.
+            :param row: Tuple with the values of _COLUMNS, in that order.
+            :return: Expense object populated with data from the row.
+        """
+        (
+            expense_id,
+            trip_id,
+            expense_date,
+            original_amount,
+            currency,
+            converted_amount_cop,
+            payment_method,
+            expense_type,
+        ) = row
+
+        return Expense(
+            expense_id=UUID(expense_id),
+            trip_id=UUID(trip_id),
+            expense_date=date.fromisoformat(expense_date),
+            original_amount=float(original_amount),
+            currency=currency,
+            converted_amount_cop=float(converted_amount_cop),
+            payment_method=self._PAYMENT_METHODS[payment_method],
+            expense_type=self._EXPENSE_TYPES[expense_type],
+        )
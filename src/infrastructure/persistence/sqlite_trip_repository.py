@@ -0,0 +1,166 @@
+from datetime import date
+from sqlite3 import Error
+from typing import Dict, List
+from uuid import UUID
+
+from core.domain import Trip
+from core.exceptions import TripNotFoundError
+from core.interfaces.repositories import TripRepository
+from infrastructure.database import SQLiteConnection
+from infrastructure.monitoring import instrument_repository
+
+
+@instrument_repository
+class SQLiteTripRepository(TripRepository):
+    """
+    SQLite implementation of TripRepository for single-node deployments.
+    Dates are stored as ISO text, so they are bound with isoformat() and parsed
+    back in _map_to_trip.
+    """
+
+    # Column order of every SELECT that is mapped to a Trip; rows are read as
+    # plain tuples and unpacked positionally in _map_to_trip.
+    _COLUMNS = (
+        "trip_id",
+        "start_date",
+        "end_date",
+        "is_international",
+        "daily_budget",
+        "currency",
+    )
+    _SELECT_COLUMNS = ", ".join(_COLUMNS)
+
+    _INSERT_QUERY = """
+        INSERT INTO trips (trip_id, start_date, end_date, is_international,
+            daily_budget, currency)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    _SELECT_BY_ID_QUERY = f"SELECT {_SELECT_COLUMNS} FROM trips WHERE trip_id = ?"
+    _SELECT_ALL_QUERY = f"SELECT {_SELECT_COLUMNS} FROM trips ORDER BY start_date DESC"
+    _DASHBOARD_QUERY = """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(start_date <= ?1 AND end_date >= ?1), 0),
+            COALESCE(SUM(CAST(julianday(end_date) - julianday(start_date) AS INTEGER)
+                + 1), 0)
+        FROM trips
+    """
+    _ACTIVE_CURRENCIES_QUERY = """
+        SELECT DISTINCT currency FROM trips
+        WHERE start_date <= ?1 AND end_date >= ?1
+        ORDER BY currency
+    """
+
+    def __init__(self, db_connection: SQLiteConnection) -> None:
+        self._db_connection = db_connection
+
+    def save(self, trip: Trip) -> None:
+        """
+        Saves a trip to the database.
+            :param trip: Trip object to be saved.
+            :raises RuntimeError: If there is an error during the database operation.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    self._INSERT_QUERY,
+                    (
+                        str(trip.trip_id),
+                        trip.start_date.isoformat(),
+                        trip.end_date.isoformat(),
+                        trip.is_international,
+                        trip.daily_budget,
+                        trip.currency,
+                    ),
+                )
+        except Error as e:
+            raise RuntimeError(f"Error saving trip {trip.trip_id}: {e}") from e
+
+    def get_by_id(self, trip_id: UUID) -> Trip:
+        """
+        Retrieves a trip by its unique identifier.
+            :param trip_id: Unique identifier for the trip.
+            :return: Trip object corresponding to the given trip_id.
+            :raises TripNotFoundError: If no trip has that ID.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._SELECT_BY_ID_QUERY, (str(trip_id),))
+                result = cursor.fetchone()
+        except Error as e:
+            raise RuntimeError(f"Error retrieving trip by ID {trip_id}: {e}") from e
+
+        if not result:
+            raise TripNotFoundError(trip_id)
+
+        return self._map_to_trip(result)
+
+    def get_all(self) -> List[Trip]:
+        """
+        Retrieves all trips, most recent start date first.
+            :return: List of all Trip objects.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._SELECT_ALL_QUERY)
+
+                return [self._map_to_trip(row) for row in cursor.fetchall()]
+        except Error as e:
+            raise RuntimeError(f"Error retrieving trips: {e}") from e
+
+    def get_dashboard_totals(self, reference_date: date) -> Dict[str, int]:
+        """
+        Aggregates trip counters for the dashboard with a single query.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Dictionary with total_trips, active_trips and total_days.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(self._DASHBOARD_QUERY, (reference_date.isoformat(),))
+                total_trips, active_trips, total_days = cursor.fetchone()
+
+                return {
+                    "total_trips": int(total_trips),
+                    "active_trips": int(active_trips),
+                    "total_days": int(total_days),
+                }
+        except Error as e:
+            raise RuntimeError(f"Error aggregating trips: {e}") from e
+
+    def get_active_currencies(self, reference_date: date) -> List[str]:
+        """
+        Lists the distinct currencies of the trips active on a date.
+            :param reference_date: Date used to decide whether a trip is active.
+            :return: Sorted list of currency codes.
+        """
+        try:
+            with self._db_connection.get_connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(
+                    self._ACTIVE_CURRENCIES_QUERY, (reference_date.isoformat(),)
+                )
+
+                return [currency for (currency,) in cursor.fetchall()]
+        except Error as e:
+            raise RuntimeError(f"Error retrieving active currencies: {e}") from e
+
+    def _map_to_trip(self, row: tuple) -> Trip:
+        """
+        Maps a database row to a Trip object.
+            :param row: Tuple with the values of _COLUMNS, in that order.
+            :return: Trip object populated with data from the row.
+        """
+        trip_id, start_date, end_date, is_international, daily_budget, currency = row
+
+        return Trip(
+            trip_id=UUID(trip_id),
+            start_date=date.fromisoformat(start_date),
+            end_date=date.fromisoformat(end_date),
+            is_international=bool(is_international),
+            daily_budget=float(daily_budget),
+            currency=currency,
+        )
@@ -0,0 +1,11 @@
+from .synthetic_data import (COP_RATES, EXPENSE_TYPE_WEIGHTS,
+                             MEDIAN_AMOUNT_COP, SeedReport,
+                             SyntheticDataGenerator)
+
+__all__ = [
+    "COP_RATES",
+    "EXPENSE_TYPE_WEIGHTS",
+    "MEDIAN_AMOUNT_COP",
+    "SeedReport",
+    "SyntheticDataGenerator",
+]
@@ -0,0 +1,133 @@
+"""
+Command that writes a seeded synthetic dataset into the configured repository
+backend, for load and scale testing. The same seed and arguments always write
+the same rows, IDs included, so run it against an empty database.
+
+Usage:
+    python -m infrastructure.seeding --trips 1000 --expenses 1000000 [--seed 42]
+        [--backend mysql|sqlite] [--batch-size 5000]
+        [--start-date YYYY-MM-DD] [--end-date YYYY-MM-DD]
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+
+from mysql.connector import Error
+
+from config import Settings
+from infrastructure.database import DatabaseConnection
+from infrastructure.database.migrations import MigrationRunner
+from infrastructure.persistence import create_repositories
+
+from .synthetic_data import SyntheticDataGenerator
+
+# The memory backend is left out: nothing would outlive the command.
+_BACKENDS = ("mysql", "sqlite")
+
+
+def main() -> None:
+    """
+    Entry point for the seeding command.
+    """
+    settings = Settings()
+    today = date.today()
+
+    parser = argparse.ArgumentParser(
+        description="Write a seeded synthetic dataset to the configured backend."
+    )
+    parser.add_argument("--trips", type=int, default=1000, help="Number of trips.")
+    parser.add_argument(
+        "--expenses", type=int, default=100_000, help="Number of expenses."
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument(
+        "--backend",
+        choices=_BACKENDS,
+        default=settings.repository_backend,
+        help="Repository backend (default REPOSITORY_BACKEND).",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=5000, help="Expenses per bulk insert."
+    )
+    parser.add_argument(
+        "--start-date",
+        type=date.fromisoformat,
+        default=today - timedelta(days=730),
+        help="Earliest trip start date (default two years ago).",
+    )
+    parser.add_argument(
+        "--end-date",
+        type=date.fromisoformat,
+        default=today,
+        help="Latest trip start date (default today).",
+    )
+    parser.add_argument(
+        "--international-share",
+        type=float,
+        default=0.3,
+        help="Fraction of international trips.",
+    )
+    args = parser.parse_args()
+
+    if args.backend not in _BACKENDS:
+        parser.error(f"--backend must be one of {', '.join(_BACKENDS)}")
+    if args.trips < 1 and args.expenses > 0:
+        parser.error("--trips must be at least 1 to hold the expenses")
+
+    try:
+        generator = SyntheticDataGenerator(
+            args.seed, args.start_date, args.end_date, args.international_share
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    # Trip start dates depend on the window, so print it to reproduce the run.
+    print(
+        f"Seed {args.seed}: {args.trips:,} trips starting between "
+        f"{args.start_date} and {args.end_date}, {args.expenses:,} expenses "
+        f"into {args.backend}."
+    )
+
+    last_report = 0.0
+
+    def report_progress(written: int, elapsed: float) -> None:
+        nonlocal last_report
+        now = time.monotonic()
+        if now - last_report < 1 and written < args.expenses:
+            return
+
+        last_report = now
+        print(
+            f"\r{written:,} / {args.expenses:,} expenses "
+            f"({written / args.expenses:.0%}), {written / elapsed:,.0f} rows/s",
+            end="",
+            flush=True,
+        )
+
+    try:
+        if args.backend == "mysql":
+            MigrationRunner(DatabaseConnection()).upgrade()
+
+        trip_repository, expense_repository = create_repositories(args.backend)
+        report = generator.populate(
+            trip_repository,
+            expense_repository,
+            args.trips,
+            args.expenses,
+            args.batch_size,
+            report_progress,
+        )
+    except (ConnectionError, Error, RuntimeError) as e:
+        print(f"\nSeeding failed: {e}")
+        sys.exit(1)
+
+    print(
+        f"\nWrote {report.trips:,} trips and {report.expenses:,} expenses in "
+        f"{report.seconds:.1f}s ({report.rows_per_second:,.0f} rows/s)."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+import math
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from itertools import accumulate, islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from core.domain import Expense, Trip
+from core.enums import ExpenseType, PaymentMethod
+from core.interfaces.repositories import ExpenseRepository, TripRepository
+
+# Share of expenses of each type.
+EXPENSE_TYPE_WEIGHTS: Dict[ExpenseType, float] = {
+    ExpenseType.FOOD: 0.35,
+    ExpenseType.TRANSPORTATION: 0.20,
+    ExpenseType.ACCOMMODATION: 0.12,
+    ExpenseType.SHOPPING: 0.13,
+    ExpenseType.ENTERTAINMENT: 0.10,
+    ExpenseType.OTHER: 0.10,
+}
+
+# Median amount of each expense type, in COP. Amounts follow a log-normal
+# distribution around it, so most expenses are small and a few are large.
+MEDIAN_AMOUNT_COP: Dict[ExpenseType, float] = {
+    ExpenseType.FOOD: 35_000,
+    ExpenseType.TRANSPORTATION: 50_000,
+    ExpenseType.ACCOMMODATION: 220_000,
+    ExpenseType.SHOPPING: 110_000,
+    ExpenseType.ENTERTAINMENT: 70_000,
+    ExpenseType.OTHER: 40_000,
+}
+
+# Currencies of international trips with approximate COP rates. The rates
+# only make amounts plausible; nothing is fetched from the exchange-rate API.
+COP_RATES: Dict[str, float] = {
+    "USD": 4_000.0,
+    "EUR": 4_350.0,
+    "GBP": 5_100.0,
+    "MXN": 230.0,
+    "BRL": 780.0,
+}
+
+_AMOUNT_SIGMA = 0.6
+
+
+@dataclass(frozen=True)
+class SeedReport:
+    """
+    Outcome of a SyntheticDataGenerator.populate run.
+    """
+
+    trips: int
+    expenses: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return (self.trips + self.expenses) / self.seconds if self.seconds else 0.0
+
+
+class SyntheticDataGenerator:
+    """
+    Generates reproducible trips and expenses for load and scale testing.
+    Every value, IDs included, comes from a random generator seeded with the
+    given seed, so the same seed and arguments always give the same dataset.
+    Trips start inside the given date window and last from one day to four
+    weeks; expenses are spread over the trips in proportion to their length
+    and drawn from the type, payment method and amount distributions above.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        window_start: date,
+        window_end: date,
+        international_share: float = 0.3,
+        card_share: float = 0.6,
+        expense_type_weights: Optional[Dict[ExpenseType, float]] = None,
+    ) -> None:
+        """
+        Initializes the generator.
+            :param seed: Seed of the random generator.
+            :param window_start: Earliest trip start date.
+            :param window_end: Latest trip start date.
+            :param international_share: Fraction of trips that are international.
+            :param card_share: Fraction of expenses paid by card.
+            :param expense_type_weights: Relative weight of each expense type.
+                Defaults to EXPENSE_TYPE_WEIGHTS.
+            :raises ValueError: If the window is empty or a share is not
+                between 0 and 1.
+        """
+        if window_end < window_start:
+            raise ValueError("window_end must not be earlier than window_start")
+        if not (0 <= international_share <= 1 and 0 <= card_share <= 1):
+            raise ValueError("international_share and card_share must be in [0, 1]")
+
+        weights = expense_type_weights or EXPENSE_TYPE_WEIGHTS
+        self._random = random.Random(seed)
+        self._window_start = window_start
+        self._window_days = (window_end - window_start).days + 1
+        self._international_share = international_share
+        self._card_share = card_share
+        self._expense_types: List[ExpenseType] = list(weights)
+        self._cumulative_weights: List[float] = list(
+            accumulate(weights[expense_type] for expense_type in self._expense_types)
+        )
+        self._currencies: List[str] = sorted(COP_RATES)
+
+    def trips(self, count: int) -> List[Trip]:
+        """
+        Generates trips.
+            :param count: Number of trips.
+            :return: The trips, in generation order.
+        """
+        return [self._trip() for _ in range(count)]
+
+    def expenses(self, trips: Sequence[Trip], count: int) -> Iterator[Expense]:
+        """
+        Lazily generates expenses for the given trips, trip after trip, so any
+        target size can be streamed in batches.
+            :param trips: Trips the expenses belong to.
+            :param count: Total number of expenses.
+            :return: Iterator of exactly count expenses.
+        """
+        if not trips:
+            return
+
+        for trip, trip_count in zip(trips, self._split(trips, count)):
+            for _ in range(trip_count):
+                yield self._expense(trip)
+
+    def populate(
+        self,
+        trip_repository: TripRepository,
+        expense_repository: ExpenseRepository,
+        trip_count: int,
+        expense_count: int,
+        batch_size: int = 5000,
+        on_progress: Optional[Callable[[int, float], None]] = None,
+    ) -> SeedReport:
+        """
+        Generates a dataset and writes it to the repositories, the trips one by
+        one and the expenses with save_many in batches.
+            :param trip_repository: Repository the trips are saved to.
+            :param expense_repository: Repository the expenses are saved to.
+            :param trip_count: Number of trips.
+            :param expense_count: Number of expenses.
+            :param batch_size: Expenses written per save_many call.
+            :param on_progress: Called after every batch with the number of
+                expenses written so far and the seconds elapsed.
+            :return: Counts and duration of the run.
+            :raises RuntimeError: If a repository fails, e.g. because the
+                dataset was already written with the same seed.
+        """
+        started = time.perf_counter()
+
+        trips = self.trips(trip_count)
+        for trip in trips:
+            trip_repository.save(trip)
+
+        written = 0
+        expenses = self.expenses(trips, expense_count)
+        batch = list(islice(expenses, batch_size))
+        while batch:
+            expense_repository.save_many(batch)
+            written += len(batch)
+
+            if on_progress is not None:
+                on_progress(written, time.perf_counter() - started)
+
+            batch = list(islice(expenses, batch_size))
+
+        return SeedReport(len(trips), written, time.perf_counter() - started)
+
+    def _trip(self) -> Trip:
+        rng = self._random
+        start_date = self._window_start + timedelta(
+            days=rng.randrange(self._window_days)
+        )
+        duration = rng.randint(7, 28) if rng.random() < 0.3 else rng.randint(1, 10)
+        is_international = rng.random() < self._international_share
+
+        if is_international:
+            currency = rng.choice(self._currencies)
+            daily_budget = round(rng.uniform(80, 400))
+        else:
+            currency = "COP"
+            daily_budget = round(rng.uniform(150_000, 600_000), -3)
+
+        return Trip(
+            self._uuid(),
+            start_date,
+            start_date + timedelta(days=duration - 1),
+            is_international,
+            float(daily_budget),
+            currency,
+        )
+
+    def _expense(self, trip: Trip) -> Expense:
+        rng = self._random
+        duration = (trip.end_date - trip.start_date).days + 1
+        expense_type = rng.choices(
+            self._expense_types, cum_weights=self._cumulative_weights
+        )[0]
+        amount_cop = rng.lognormvariate(
+            math.log(MEDIAN_AMOUNT_COP[expense_type]), _AMOUNT_SIGMA
+        )
+
+        if trip.is_international:
+            rate = COP_RATES[trip.currency]
+            original_amount = max(round(amount_cop / rate, 2), 0.01)
+            converted_amount_cop = round(original_amount * rate, 2)
+        else:
+            original_amount = converted_amount_cop = max(round(amount_cop, -2), 100.0)
+
+        return Expense(
+            self._uuid(),
+            trip.trip_id,
+            trip.start_date + timedelta(days=rng.randrange(duration)),
+            original_amount,
+            trip.currency,
+            converted_amount_cop,
+            (
+                PaymentMethod.CARD
+                if rng.random() < self._card_share
+                else PaymentMethod.CASH
+            ),
+            expense_type,
+        )
+
+    def _split(self, trips: Sequence[Trip], count: int) -> List[int]:
+        """
+        Splits count over the trips in proportion to their number of days; the
+        remainder goes to the first trips.
+        """
+        durations = [(trip.end_date - trip.start_date).days + 1 for trip in trips]
+        total_days = sum(durations)
+        shares = [count * days // total_days for days in durations]
+
+        for index in range(count - sum(shares)):
+            shares[index % len(shares)] += 1
+
+        return shares
+
+    def _uuid(self) -> UUID:
+        return UUID(int=self._random.getrandbits(128), version=4)
@@ -1,10 +1,11 @@
 import sys
 
+from config import Settings
 from core.services import ExpenseManager, ReportService, TripService
 from infrastructure.database import DatabaseConnection
 from infrastructure.external import ApiCurrencyConverter
-from infrastructure.persistence import (MySQLExpenseRepository,
-                                        MySQLTripRepository)
+from infrastructure.persistence import (create_exchange_rate_repository,
+                                        create_repositories)
 from presentation.console import ConsoleInterface
 
 
@@ -13,11 +14,15 @@ def main():
     Main entry point for the application.
     """
     try:
-        db_connection = DatabaseConnection()
-
-        trip_repository = MySQLTripRepository(db_connection)
-        expense_repository = MySQLExpenseRepository(db_connection)
-        currency_converter = ApiCurrencyConverter()
+        backend = Settings().repository_backend
+        trip_repository, expense_repository = create_repositories(
+            backend, DatabaseConnection
+        )
+        currency_converter = ApiCurrencyConverter(
+            rate_repository=create_exchange_rate_repository(
+                backend, DatabaseConnection
+            )
+        )
 
         trip_service = TripService(trip_repository)
         expense_manager = ExpenseManager(
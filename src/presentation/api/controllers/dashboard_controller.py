@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException, status
 
 from core.services import ReportService, TripService
+from infrastructure.concurrency import BoundedExecutor
+from infrastructure.exceptions import PoolExhaustedError
 from presentation.api.dependencies import DependencyContainer
+from presentation.api.errors import service_unavailable
 from presentation.api.models import (DashboardStatsResponse, TripListResponse,
                                      TripResponse)
 
@@ -15,15 +18,20 @@ class DashboardController:
     """
 
     def __init__(
-        self, trip_service: TripService, report_service: ReportService
+        self,
+        trip_service: TripService,
+        report_service: ReportService,
+        executor: BoundedExecutor,
     ) -> None:
         """
         Initialize the DashboardController with dependencies.
             :param trip_service: Service to manage trips.
             :param report_service: Service to manage reports.
+            :param executor: Executor that runs the blocking service calls.
         """
         self._trip_service: TripService = trip_service
         self._report_service: ReportService = report_service
+        self._executor: BoundedExecutor = executor
 
     async def get_dashboard_stats(self) -> DashboardStatsResponse:
         """
@@ -31,28 +39,18 @@ class DashboardController:
             :return: Dictionary containing dashboard statistics.
         """
         try:
-            all_trips = self._trip_service.get_all_trips()
-            active_trips = [trip for trip in all_trips if trip.is_active()]
-
-            total_expenses = 0
-            total_days = 0
-
-            for trip in all_trips:
-                try:
-                    summary = self._report_service.get_trip_summary(trip.trip_id)
-                    total_expenses += summary["total_expenses"]
-                    total_days += summary["trip_days"]
-                except Exception as e:
-                    raise e
-
-            avg_daily_expense = total_expenses / total_days if total_days > 0 else 0
+            summary = await self._executor.run(
+                self._report_service.get_dashboard_summary
+            )
 
             return DashboardStatsResponse(
-                total_trips=len(all_trips),
-                active_trips=len(active_trips),
-                total_expenses=total_expenses,
-                avg_daily_expense=avg_daily_expense,
+                total_trips=summary["total_trips"],
+                active_trips=summary["active_trips"],
+                total_expenses=summary["total_expenses"],
+                avg_daily_expense=summary["average_daily_expense"],
             )
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -65,7 +63,7 @@ class DashboardController:
             :return: TripListResponse containing active trips.
         """
         try:
-            trips = self._trip_service.get_active_trips()
+            trips = await self._executor.run(self._trip_service.get_active_trips)
             trip_responses = [
                 TripResponse(
                     trip_id=trip.trip_id,
@@ -79,6 +77,8 @@ class DashboardController:
                 for trip in trips
             ]
             return TripListResponse(trips=trip_responses, total=len(trip_responses))
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -91,6 +91,7 @@ router = APIRouter(prefix="/dashboard", tags=["dashboard"])
 dashboard_controller = DashboardController(
     trip_service=DependencyContainer().get_trip_service(),
     report_service=DependencyContainer().get_report_service(),
+    executor=DependencyContainer().executor,
 )
 
 router.add_api_route(
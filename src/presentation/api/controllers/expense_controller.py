@@ -1,14 +1,25 @@
-from typing import List
+from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from application.dto import ExpenseDTO
-from core.exceptions import InactiveTripError, TripNotFoundError
+from core.exceptions import (InactiveTripError, InvalidCursorError,
+                             TripNotFoundError)
 from core.services import ExpenseManager
+from infrastructure.concurrency import BoundedExecutor
+from infrastructure.exceptions import PoolExhaustedError
 from presentation.api.dependencies import DependencyContainer
-from presentation.api.models import (ExpenseCreateRequest,
-                                     ExpenseCreateResponse, ExpenseResponse)
+from presentation.api.errors import service_unavailable
+from presentation.api.exporters import ExpenseExporter
+from presentation.api.models import (DailyDifferenceResponse,
+                                     ExpenseBatchCreateRequest,
+                                     ExpenseBatchCreateResponse,
+                                     ExpenseCreateRequest,
+                                     ExpenseCreateResponse,
+                                     ExpenseListResponse, ExpenseResponse,
+                                     ExportFormat)
 
 
 class ExpenseController:
@@ -16,11 +27,21 @@ class ExpenseController:
     Controller for managing expense-related endpoints.
     Provides methods to create and retrieve expenses for trips.
         - create_expense: Creates a new expense with the provided details.
-        - get_all_expenses: Retrieves all expenses for a specific trip.
+        - create_expenses: Creates several expenses in a single batch.
+        - get_all_expenses: Retrieves a page of expenses for a specific trip.
+        - export_expenses: Streams every expense of a trip as NDJSON or CSV.
     """
 
-    def __init__(self, expense_service: ExpenseManager) -> None:
+    def __init__(
+        self, expense_service: ExpenseManager, executor: BoundedExecutor
+    ) -> None:
+        """
+        Initialize the ExpenseController with dependencies.
+            :param expense_service: Service to manage expenses.
+            :param executor: Executor that runs the blocking service calls.
+        """
         self._expense_service: ExpenseManager = expense_service
+        self._executor: BoundedExecutor = executor
 
     async def create_expense(
         self, expense_data: ExpenseCreateRequest
@@ -40,19 +61,14 @@ class ExpenseController:
                 payment_method=expense_data.payment_method,
             )
 
-            daily_difference = self._expense_service.register_expense(expense_dto)
-
-            if daily_difference < 0:
-                status_message = "over_budget"
-            elif daily_difference == 0:
-                status_message = "exact_budget"
-            else:
-                status_message = "within_budget"
+            daily_difference = await self._executor.run(
+                self._expense_service.register_expense, expense_dto
+            )
 
             return ExpenseCreateResponse(
                 message="Expense created successfully",
                 daily_difference=daily_difference,
-                status=status_message,
+                status=self._budget_status(daily_difference),
             )
         except InactiveTripError as e:
             raise HTTPException(
@@ -63,48 +79,201 @@ class ExpenseController:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error registering expense: {str(e)}",
             ) from e
 
-    async def get_all_expenses(self, trip_id: UUID) -> List[ExpenseResponse]:
+    async def create_expenses(
+        self, batch_data: ExpenseBatchCreateRequest
+    ) -> ExpenseBatchCreateResponse:
         """
-        Get all expenses for a specific trip.
-            :param trip_id: UUID of the trip to retrieve expenses for.
-            :return: List of ExpenseResponse containing all expenses for the trip.
-            :raises HTTPException: If the trip is not found or an error occurs.
+        Create several expenses in a single batch.
+            :param batch_data: ExpenseBatchCreateRequest containing the expenses.
+            :return: ExpenseBatchCreateResponse with the daily budget difference
+                of every affected trip and date.
+            :raises HTTPException: If any trip is inactive or not found.
         """
         try:
-            expenses = self._expense_service.get_expenses_by_trip_id(trip_id)
-
-            return [
-                ExpenseResponse(
-                    trip_id=expense.trip_id,
-                    expense_id=expense.expense_id,
-                    expense_date=expense.expense_date,
-                    amount=expense.original_amount,
-                    converted_amount=expense.converted_amount_cop,
-                    payment_method=expense.payment_method,
-                    expense_type=expense.expense_type,
+            expense_dtos = [
+                ExpenseDTO(
+                    trip_id=expense_data.trip_id,
+                    expense_date=expense_data.expense_date,
+                    amount=expense_data.amount,
+                    expense_type=expense_data.expense_type,
+                    payment_method=expense_data.payment_method,
+                )
+                for expense_data in batch_data.expenses
+            ]
+
+            differences = await self._executor.run(
+                self._expense_service.register_expenses, expense_dtos
+            )
+            difference_responses = [
+                DailyDifferenceResponse(
+                    trip_id=trip_id,
+                    expense_date=expense_date,
+                    daily_difference=difference,
+                    status=self._budget_status(difference),
                 )
-                for expense in expenses
+                for (trip_id, expense_date), difference in differences.items()
             ]
+
+            return ExpenseBatchCreateResponse(
+                message="Expenses created successfully",
+                created_count=len(expense_dtos),
+                daily_differences=difference_responses,
+            )
+        except InactiveTripError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Cannot add expenses to an inactive trip",
+            ) from e
+        except TripNotFoundError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
+            ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error registering expenses: {str(e)}",
+            ) from e
+
+    async def get_all_expenses(
+        self,
+        trip_id: UUID,
+        limit: int = Query(default=100, ge=1, le=1000),
+        cursor: Optional[str] = Query(default=None),
+    ) -> ExpenseListResponse:
+        """
+        Get a page of expenses for a specific trip, ordered by date.
+            :param trip_id: UUID of the trip to retrieve expenses for.
+            :param limit: Maximum number of expenses in the page.
+            :param cursor: Cursor returned with the previous page, if any.
+            :return: ExpenseListResponse with the page, the next cursor and trip totals.
+            :raises HTTPException: If the cursor is invalid, the trip is not found
+                or an error occurs.
+        """
+        try:
+            page = await self._executor.run(
+                self._expense_service.get_expenses_page, trip_id, limit, cursor
+            )
+
+            return ExpenseListResponse(
+                expenses=[
+                    ExpenseResponse(
+                        trip_id=expense.trip_id,
+                        expense_id=expense.expense_id,
+                        expense_date=expense.expense_date,
+                        amount=expense.original_amount,
+                        converted_amount=expense.converted_amount_cop,
+                        payment_method=expense.payment_method,
+                        expense_type=expense.expense_type,
+                    )
+                    for expense in page.expenses
+                ],
+                total_amount=page.total_amount,
+                total_count=page.total_count,
+                next_cursor=page.next_cursor,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)
+            ) from e
         except TripNotFoundError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error retrieving expenses: {str(e)}",
             ) from e
 
+    async def export_expenses(
+        self,
+        trip_id: UUID,
+        format_name: str = Query(
+            default=ExportFormat.NDJSON.value,
+            alias="format",
+            description="ndjson or csv",
+        ),
+    ) -> StreamingResponse:
+        """
+        Stream every expense of a trip in the requested format.
+        The first page is read before the response starts, so pool and
+        database errors still answer 503 or 500; later pages are read in
+        keyset pages as the client consumes the response.
+            :param trip_id: UUID of the trip to export.
+            :param format_name: ndjson or csv.
+            :return: StreamingResponse with the serialized expenses.
+            :raises HTTPException: If the format is not supported, the trip is not
+                found or an error occurs.
+        """
+        try:
+            export_format = ExportFormat(format_name)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported export format: {format_name}",
+            ) from e
+
+        try:
+            expenses = await self._executor.run(
+                self._expense_service.iter_expenses_by_trip_id, trip_id
+            )
+        except TripNotFoundError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
+            ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error exporting expenses: {str(e)}",
+            ) from e
+
+        exporter = ExpenseExporter()
+        if export_format == ExportFormat.CSV:
+            content, media_type = exporter.to_csv(expenses), "text/csv"
+        else:
+            content, media_type = exporter.to_ndjson(expenses), "application/x-ndjson"
+
+        filename = f"expenses-{trip_id}.{export_format.value}"
+        return StreamingResponse(
+            content,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    @staticmethod
+    def _budget_status(daily_difference: float) -> str:
+        """
+        Classifies a daily budget difference.
+            :param daily_difference: Daily budget minus the day's expenses.
+            :return: over_budget, exact_budget or within_budget.
+        """
+        if daily_difference < 0:
+            return "over_budget"
+
+        if daily_difference == 0:
+            return "exact_budget"
+
+        return "within_budget"
+
 
 router = APIRouter(prefix="/expenses", tags=["expenses"])
 expense_controller = ExpenseController(
-    expense_service=DependencyContainer().get_expense_manager()
+    expense_service=DependencyContainer().get_expense_manager(),
+    executor=DependencyContainer().executor,
 )
 
 router.add_api_route(
@@ -117,11 +286,30 @@ router.add_api_route(
     description="Create a new expense for a trip",
 )
 
+router.add_api_route(
+    "/batch",
+    expense_controller.create_expenses,
+    methods=["POST"],
+    response_model=ExpenseBatchCreateResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Create Expenses in Batch",
+    description="Create several expenses, possibly for different trips, at once",
+)
+
+router.add_api_route(
+    "/{trip_id}/export",
+    expense_controller.export_expenses,
+    methods=["GET"],
+    response_class=StreamingResponse,
+    summary="Export Expenses",
+    description="Stream every expense of a trip as NDJSON or CSV",
+)
+
 router.add_api_route(
     "/{trip_id}",
     expense_controller.get_all_expenses,
     methods=["GET"],
-    response_model=List[ExpenseResponse],
-    summary="Get All Expenses",
-    description="Retrieve all expenses for a specific trip",
+    response_model=ExpenseListResponse,
+    summary="Get Expenses",
+    description="Retrieve a page of expenses for a specific trip, ordered by date",
 )
@@ -4,7 +4,10 @@ from fastapi import APIRouter, HTTPException, status
 
 from core.exceptions import TripNotFoundError
 from core.services import ReportService
+from infrastructure.concurrency import BoundedExecutor
+from infrastructure.exceptions import PoolExhaustedError
 from presentation.api.dependencies import DependencyContainer
+from presentation.api.errors import service_unavailable
 from presentation.api.models import ReportDaily, ReportSummary, ReportType
 
 
@@ -15,12 +18,16 @@ class ReportController:
         - get_trip_report: Generates a report for a specific trip.
     """
 
-    def __init__(self, report_service: ReportService) -> None:
+    def __init__(
+        self, report_service: ReportService, executor: BoundedExecutor
+    ) -> None:
         """
         Initialize the ReportController with dependencies.
             :param report_service: Service to manage reports.
+            :param executor: Executor that runs the blocking service calls.
         """
         self._report_service: ReportService = report_service
+        self._executor: BoundedExecutor = executor
 
     async def get_daily_report(self, trip_id: UUID) -> ReportDaily:
         """
@@ -30,7 +37,9 @@ class ReportController:
             :raises HTTPException: If the trip is not found or an error generating the report.
         """
         try:
-            report = self._report_service.generate_daily_expense_report(trip_id)
+            report = await self._executor.run(
+                self._report_service.generate_daily_expense_report, trip_id
+            )
 
             serialized_report = {str(date): entry for date, entry in report.items()}
             return ReportDaily.model_validate(serialized_report)
@@ -39,6 +48,8 @@ class ReportController:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -53,7 +64,9 @@ class ReportController:
             :raises HTTPException: If the trip is not found or an error generating the report.
         """
         try:
-            report = self._report_service.generate_expense_type_report(trip_id)
+            report = await self._executor.run(
+                self._report_service.generate_expense_type_report, trip_id
+            )
             serialized_report = {
                 str(expense_type): entry for expense_type, entry in report.items()
             }
@@ -63,6 +76,8 @@ class ReportController:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -77,13 +92,17 @@ class ReportController:
             :raises HTTPException: If the trip is not found or an error generating the report.
         """
         try:
-            summary = self._report_service.get_trip_summary(trip_id)
+            summary = await self._executor.run(
+                self._report_service.get_trip_summary, trip_id
+            )
             return ReportSummary.model_validate(summary)
 
         except TripNotFoundError as e:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Trip not found"
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -93,7 +112,8 @@ class ReportController:
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 report_controller = ReportController(
-    report_service=DependencyContainer().get_report_service()
+    report_service=DependencyContainer().get_report_service(),
+    executor=DependencyContainer().executor,
 )
 
 router.add_api_route(
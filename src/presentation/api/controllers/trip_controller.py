@@ -3,7 +3,10 @@ from uuid import UUID
 from fastapi import APIRouter, HTTPException, status
 
 from core.services import TripService
+from infrastructure.concurrency import BoundedExecutor
+from infrastructure.exceptions import PoolExhaustedError
 from presentation.api.dependencies import DependencyContainer
+from presentation.api.errors import service_unavailable
 from presentation.api.models.trip_models import (TripCreateRequest,
                                                  TripListResponse,
                                                  TripResponse)
@@ -19,8 +22,14 @@ class TripController:
             a trip by its unique identifier.
     """
 
-    def __init__(self, trip_service: TripService) -> None:
+    def __init__(self, trip_service: TripService, executor: BoundedExecutor) -> None:
+        """
+        Initialize the TripController with dependencies.
+            :param trip_service: Service to manage trips.
+            :param executor: Executor that runs the blocking service calls.
+        """
         self._trip_service: TripService = trip_service
+        self._executor: BoundedExecutor = executor
 
     async def create_trip(self, trip_data: TripCreateRequest) -> TripResponse:
         """
@@ -30,7 +39,8 @@ class TripController:
             :raises HTTPException: If the trip data is invalid.
         """
         try:
-            trip = self._trip_service.create_trip(
+            trip = await self._executor.run(
+                self._trip_service.create_trip,
                 start_date=trip_data.start_date,
                 end_date=trip_data.end_date,
                 is_international=trip_data.is_international,
@@ -52,6 +62,8 @@ class TripController:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e),
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
 
     async def get_all_trips(self, active_only: bool = False) -> TripListResponse:
         """
@@ -61,9 +73,9 @@ class TripController:
         """
         try:
             if active_only:
-                trips = self._trip_service.get_active_trips()
+                trips = await self._executor.run(self._trip_service.get_active_trips)
             else:
-                trips = self._trip_service.get_all_trips()
+                trips = await self._executor.run(self._trip_service.get_all_trips)
 
             trip_responses = [
                 TripResponse(
@@ -79,6 +91,8 @@ class TripController:
             ]
 
             return TripListResponse(trips=trip_responses, total=len(trip_responses))
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -93,7 +107,7 @@ class TripController:
             :raises HTTPException: If the trip is not found.
         """
         try:
-            trip = self._trip_service.get_trip_by_id(trip_id)
+            trip = await self._executor.run(self._trip_service.get_trip_by_id, trip_id)
 
             return TripResponse(
                 trip_id=trip.trip_id,
@@ -109,11 +123,16 @@ class TripController:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=str(e),
             ) from e
+        except PoolExhaustedError as e:
+            raise service_unavailable(e) from e
 
 
 router = APIRouter(prefix="/trips", tags=["trips"])
 
-trip_controller = TripController(trip_service=DependencyContainer().get_trip_service())
+trip_controller = TripController(
+    trip_service=DependencyContainer().get_trip_service(),
+    executor=DependencyContainer().executor,
+)
 
 router.add_api_route(
     "/",
@@ -5,11 +5,18 @@ Contenedor de dependencias mejorado siguiendo principios de IoC.
 from functools import lru_cache
 from threading import Lock
 
-from core.services import ExpenseManager, ReportService, TripService
+from config import Settings
+from core.interfaces.repositories import (ExchangeRateRepository,
+                                          ExpenseRepository, TripRepository)
+from core.services import (ColumnarReportService, ExpenseManager,
+                           ReportService, TripService)
+from infrastructure.caching import TTLLRUCache
+from infrastructure.concurrency import BoundedExecutor
 from infrastructure.database import DatabaseConnection
-from infrastructure.external import ApiCurrencyConverter
-from infrastructure.persistence import (MySQLExpenseRepository,
-                                        MySQLTripRepository)
+from infrastructure.external import ApiCurrencyConverter, RateRefresher
+from infrastructure.persistence import (CachedTripRepository,
+                                        create_exchange_rate_repository,
+                                        create_repositories)
 
 
 class SingletonMeta(type):
@@ -33,7 +40,10 @@ class DependencyContainer(metaclass=SingletonMeta):
         self._db_connection = None
         self._trip_repository = None
         self._expense_repository = None
+        self._exchange_rate_repository = None
         self._currency_converter = None
+        self._rate_refresher = None
+        self._executor = None
 
     @property
     def db_connection(self) -> DatabaseConnection:
@@ -43,26 +53,92 @@ class DependencyContainer(metaclass=SingletonMeta):
         return self._db_connection
 
     @property
-    def trip_repository(self) -> MySQLTripRepository:
-        """Proporciona una instancia del repositorio de viajes."""
+    def trip_repository(self) -> TripRepository:
+        """
+        Proporciona una instancia del repositorio de viajes,
+        envuelta en la caché de viajes si está habilitada.
+        """
         if self._trip_repository is None:
-            self._trip_repository = MySQLTripRepository(self.db_connection)
+            self._create_repositories()
         return self._trip_repository
 
     @property
-    def expense_repository(self) -> MySQLExpenseRepository:
+    def expense_repository(self) -> ExpenseRepository:
         """Proporciona una instancia del repositorio de gastos."""
         if self._expense_repository is None:
-            self._expense_repository = MySQLExpenseRepository(self.db_connection)
+            self._create_repositories()
         return self._expense_repository
 
+    def _create_repositories(self) -> None:
+        """
+        Crea los repositorios del backend configurado en REPOSITORY_BACKEND.
+        El backend en memoria no usa la caché de viajes.
+        """
+        settings = Settings()
+        trip_repository, expense_repository = create_repositories(
+            settings.repository_backend, lambda: self.db_connection
+        )
+
+        if settings.trip_cache_enabled and settings.repository_backend != "memory":
+            trip_repository = CachedTripRepository(
+                trip_repository,
+                TTLLRUCache(
+                    max_entries=settings.trip_cache_max_entries,
+                    ttl_seconds=settings.trip_cache_ttl_seconds,
+                ),
+            )
+
+        self._trip_repository = trip_repository
+        self._expense_repository = expense_repository
+
+    @property
+    def exchange_rate_repository(self) -> ExchangeRateRepository:
+        """
+        Proporciona el almacén histórico de tasas de cambio del backend
+        configurado en REPOSITORY_BACKEND.
+        """
+        if self._exchange_rate_repository is None:
+            self._exchange_rate_repository = create_exchange_rate_repository(
+                Settings().repository_backend, lambda: self.db_connection
+            )
+        return self._exchange_rate_repository
+
     @property
     def currency_converter(self) -> ApiCurrencyConverter:
-        """Proporciona una instancia del convertidor de divisas."""
+        """
+        Proporciona una instancia del convertidor de divisas, que convierte
+        por fecha con el almacén histórico de tasas.
+        """
         if self._currency_converter is None:
-            self._currency_converter = ApiCurrencyConverter()
+            self._currency_converter = ApiCurrencyConverter(
+                rate_repository=self.exchange_rate_repository
+            )
         return self._currency_converter
 
+    @property
+    def rate_refresher(self) -> RateRefresher:
+        """
+        Proporciona el refrescador de tasas de cambio, que mantiene cargadas
+        en el convertidor las tablas de las monedas de los viajes activos.
+        """
+        if self._rate_refresher is None:
+            self._rate_refresher = RateRefresher(
+                self.currency_converter,
+                self.trip_repository,
+                Settings().rate_refresh_interval_seconds,
+            )
+        return self._rate_refresher
+
+    @property
+    def executor(self) -> BoundedExecutor:
+        """Proporciona el ejecutor para las operaciones bloqueantes."""
+        if self._executor is None:
+            settings = Settings()
+            self._executor = BoundedExecutor(
+                settings.executor_max_workers, settings.executor_max_pending
+            )
+        return self._executor
+
     @lru_cache()
     def get_container(self) -> "DependencyContainer":
         """Proporciona una instancia del contenedor de dependencias."""
@@ -81,8 +157,16 @@ class DependencyContainer(metaclass=SingletonMeta):
         )
 
     def get_report_service(self) -> ReportService:
-        """Inyección de dependencia para ReportService."""
-        return ReportService(
+        """
+        Inyección de dependencia para ReportService,
+        usando el motor columnar si REPORT_ENGINE es "columnar".
+        """
+        if Settings().report_engine == "columnar":
+            report_service_class = ColumnarReportService
+        else:
+            report_service_class = ReportService
+
+        return report_service_class(
             expense_repository=self.expense_repository,
             trip_repository=self.trip_repository,
         )
@@ -0,0 +1,16 @@
+from fastapi import HTTPException, status
+
+from infrastructure.exceptions import PoolExhaustedError
+
+
+def service_unavailable(error: PoolExhaustedError) -> HTTPException:
+    """
+    Builds the response used to shed load when no database connection is available.
+        :param error: The pool exhaustion raised by the connection checkout.
+        :return: HTTPException with status 503 and a Retry-After header.
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="The service is busy, please retry later",
+        headers={"Retry-After": str(error.retry_after)},
+    )
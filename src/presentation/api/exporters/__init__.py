@@ -0,0 +1,3 @@
+from .expense_exporter import ExpenseExporter
+
+__all__ = ["ExpenseExporter"]
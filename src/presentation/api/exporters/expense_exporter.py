@@ -0,0 +1,92 @@
+import csv
+import io
+import json
+from typing import Iterable, Iterator, List
+
+from core.domain import Expense
+
+
+class ExpenseExporter:
+    """
+    Serializes a stream of expenses into export formats chunk by chunk,
+    so the whole export never needs to be held in memory.
+        - to_ndjson: One JSON object per line.
+        - to_csv: Comma-separated values with a header row.
+    """
+
+    COLUMNS: List[str] = [
+        "expense_id",
+        "trip_id",
+        "expense_date",
+        "amount",
+        "currency",
+        "converted_amount",
+        "payment_method",
+        "expense_type",
+    ]
+
+    def __init__(self, rows_per_chunk: int = 500) -> None:
+        """
+        Initializes the exporter.
+            :param rows_per_chunk: Number of rows written per yielded chunk.
+        """
+        self._rows_per_chunk: int = rows_per_chunk
+
+    def to_ndjson(self, expenses: Iterable[Expense]) -> Iterator[str]:
+        """
+        Serializes expenses as newline-delimited JSON.
+            :param expenses: Expenses to serialize.
+            :return: Iterator of text chunks.
+        """
+        lines: List[str] = []
+
+        for expense in expenses:
+            lines.append(json.dumps(dict(zip(self.COLUMNS, self._to_row(expense)))))
+
+            if len(lines) >= self._rows_per_chunk:
+                yield "\n".join(lines) + "\n"
+                lines = []
+
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    def to_csv(self, expenses: Iterable[Expense]) -> Iterator[str]:
+        """
+        Serializes expenses as CSV with a header row.
+            :param expenses: Expenses to serialize.
+            :return: Iterator of text chunks.
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.COLUMNS)
+        pending_rows = 0
+
+        for expense in expenses:
+            writer.writerow(self._to_row(expense))
+            pending_rows += 1
+
+            if pending_rows >= self._rows_per_chunk:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+                pending_rows = 0
+
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    def _to_row(self, expense: Expense) -> list:
+        """
+        Maps an expense to the exported column values.
+            :param expense: Expense to map.
+            :return: List of values in COLUMNS order.
+        """
+        return [
+            str(expense.expense_id),
+            str(expense.trip_id),
+            expense.expense_date.isoformat(),
+            expense.original_amount,
+            expense.currency,
+            expense.converted_amount_cop,
+            expense.payment_method.value,
+            expense.expense_type.value,
+        ]
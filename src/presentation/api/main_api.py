@@ -4,11 +4,15 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from config import Settings
 from infrastructure.database import DatabaseConnection
+from infrastructure.monitoring import REGISTRY, PoolMetricsCollector
 from presentation.api.controllers import (dashboard_router, expense_router,
                                           report_router, trip_router)
+from presentation.api.dependencies import DependencyContainer
+from presentation.api.middleware import MetricsMiddleware, QueryCountMiddleware
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,14 +27,23 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Travel Expense Tracker API...")
 
     try:
-        DatabaseConnection()
+        db_connection = DatabaseConnection()
+        if settings.repository_backend == "mysql" and settings.db_pool_warmup:
+            opened = db_connection.warm_up()
+            logger.info(f"Connection pool warmed up with {opened} connections")
     except Exception as e:
         logger.error(f"Failed to connect to the database: {e}")
         raise e
 
+    if settings.rate_refresh_enabled:
+        DependencyContainer().rate_refresher.start()
+
     yield
 
     logger.info("Shutting down Travel Expense Tracker API...")
+    if settings.rate_refresh_enabled:
+        DependencyContainer().rate_refresher.stop(timeout=5)
+    DependencyContainer().executor.shutdown()
 
 
 app = FastAPI(
@@ -53,6 +66,14 @@ app.add_middleware(
     allow_headers=settings.cors_allow_headers,
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    if settings.repository_backend == "mysql":
+        REGISTRY.register("db_pool", PoolMetricsCollector(DatabaseConnection()))
+
+if settings.debug:
+    app.add_middleware(QueryCountMiddleware)
+
 
 routers = {
     "dashboard": dashboard_router,
@@ -76,6 +97,15 @@ async def health_check():
     }
 
 
+# Metrics endpoint
+if settings.metrics_enabled:
+
+    @app.get("/metrics", tags=["health"], include_in_schema=False)
+    async def metrics():
+        """Metrics endpoint in the Prometheus text exposition format."""
+        return PlainTextResponse(REGISTRY.render(), media_type=REGISTRY.CONTENT_TYPE)
+
+
 # Root endpoint
 @app.get("/", tags=["root"])
 async def root():
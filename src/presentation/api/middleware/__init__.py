@@ -0,0 +1,4 @@
+from .metrics_middleware import MetricsMiddleware
+from .query_count_middleware import QueryCountMiddleware
+
+__all__ = ["MetricsMiddleware", "QueryCountMiddleware"]
@@ -0,0 +1,43 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.monitoring import HTTP_REQUEST_SECONDS, HTTP_REQUESTS
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware that counts requests and records their latency per route
+    template, such as /api/v1/trips/{trip_id}, so path parameters do not
+    create one series per ID. Requests that match no route share a single
+    "unmatched" label.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            # The router stores the matched route in the shared scope.
+            route = scope.get("route")
+            template = getattr(route, "path", "unmatched")
+            method = scope["method"]
+
+            HTTP_REQUEST_SECONDS.observe(elapsed, method=method, route=template)
+            HTTP_REQUESTS.inc(method=method, route=template, status=str(status_code))
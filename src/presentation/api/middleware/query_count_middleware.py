@@ -0,0 +1,34 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infrastructure.database import track_queries
+
+
+class QueryCountMiddleware:
+    """
+    ASGI middleware that counts the SQL statements run while handling a request
+    and reports them in the X-Query-Count and X-Query-Time-Ms response headers.
+    Comparing the query time with the request latency tells whether a slow
+    endpoint is spending its time in SQL or in row mapping and serialization.
+    Statements run after the response has started, such as those of streamed
+    exports, are not included.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as counter:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append("X-Query-Count", str(counter.count))
+                    headers.append("X-Query-Time-Ms", f"{counter.total_ms:.1f}")
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -1,6 +1,9 @@
 from .dashboard_models import DashboardStatsResponse
-from .expense_models import (ExpenseCreateRequest, ExpenseCreateResponse,
-                             ExpenseListResponse, ExpenseResponse)
+from .expense_models import (DailyDifferenceResponse,
+                             ExpenseBatchCreateRequest,
+                             ExpenseBatchCreateResponse, ExpenseCreateRequest,
+                             ExpenseCreateResponse, ExpenseListResponse,
+                             ExpenseResponse, ExportFormat)
 from .report_models import ReportDaily, ReportSummary, ReportType
 from .trip_models import (TripCreateRequest, TripListResponse, TripResponse,
                           TripUpdateRequest)
@@ -14,6 +17,10 @@ __all__ = [
     "ExpenseListResponse",
     "ExpenseResponse",
     "ExpenseCreateResponse",
+    "ExpenseBatchCreateRequest",
+    "ExpenseBatchCreateResponse",
+    "DailyDifferenceResponse",
+    "ExportFormat",
     "DashboardStatsResponse",
     "ReportDaily",
     "ReportType",
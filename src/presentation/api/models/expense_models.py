@@ -4,7 +4,8 @@ Modelos de request/response para Expense endpoints.
 
 from dataclasses import dataclass
 from datetime import date
-from typing import List
+from enum import Enum
+from typing import List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -55,8 +56,43 @@ class ExpenseCreateResponse(BaseModel):
 
 
 class ExpenseListResponse(BaseModel):
-    """Model for returning a list of Expenses."""
+    """Model for returning a page of Expenses with the totals of the trip."""
 
     expenses: List[ExpenseResponse]
     total_amount: float
     total_count: int
+    next_cursor: Optional[str] = Field(
+        default=None, description="Cursor of the next page, null on the last page"
+    )
+
+
+class ExpenseBatchCreateRequest(BaseModel):
+    """Model for creating several Expenses in one request."""
+
+    expenses: List[ExpenseCreateRequest] = Field(
+        ..., min_length=1, max_length=1000, description="Expenses to register"
+    )
+
+
+class DailyDifferenceResponse(BaseModel):
+    """Model for returning the daily budget difference of a trip on a date."""
+
+    trip_id: UUID
+    expense_date: date
+    daily_difference: float
+    status: str
+
+
+class ExpenseBatchCreateResponse(BaseModel):
+    """Model for returning the result of creating several Expenses."""
+
+    message: str
+    created_count: int
+    daily_differences: List[DailyDifferenceResponse]
+
+
+class ExportFormat(str, Enum):
+    """Formats supported by the expense export endpoint."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
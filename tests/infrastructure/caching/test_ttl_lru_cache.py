@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from infrastructure.caching import TTLLRUCache
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLLRUCache(TestCase):
+    """Test case for TTLLRUCache class."""
+
+    def __init__(self, methodName: str = "runTest") -> None:
+        """
+        Initializes the test case with a small cache driven by a fake clock.
+        """
+
+        super().__init__(methodName)
+        self.clock = FakeClock()
+        self.cache = TTLLRUCache(max_entries=2, ttl_seconds=60, clock=self.clock)
+
+    def test_hit_and_miss_counters(self):
+        """
+        Tests that lookups are counted as hits or misses.
+        """
+
+        self.cache.set("usd", {"cop": 4000})
+
+        self.assertEqual(self.cache.get("usd"), {"cop": 4000})
+        self.assertIsNone(self.cache.get("eur"))
+        self.assertEqual(self.cache.stats["hits"], 1)
+        self.assertEqual(self.cache.stats["misses"], 1)
+        self.assertEqual(self.cache.stats["hit_rate"], 0.5)
+
+    def test_entries_expire_after_ttl(self):
+        """
+        Tests that an entry is no longer served once its TTL has elapsed.
+        """
+
+        self.cache.set("usd", {"cop": 4000})
+        self.clock.now = 61
+
+        self.assertIsNone(self.cache.get("usd"))
+        self.assertEqual(self.cache.stats["size"], 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """
+        Tests that the least recently used entry is evicted when the cache is full.
+        """
+
+        self.cache.set("usd", {"cop": 4000})
+        self.cache.set("eur", {"cop": 4500})
+        self.cache.get("usd")
+        self.cache.set("gbp", {"cop": 5200})
+
+        self.assertIsNone(self.cache.get("eur"))
+        self.assertIsNotNone(self.cache.get("usd"))
+        self.assertEqual(self.cache.stats["evictions"], 1)
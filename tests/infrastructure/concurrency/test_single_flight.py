@@ -0,0 +1,95 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import TestCase
+
+from infrastructure.concurrency import SingleFlight
+from infrastructure.monitoring import SINGLE_FLIGHT_CALLS
+
+
+def wait_until(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.001)
+
+
+class TestSingleFlight(TestCase):
+    """Test case for the threaded SingleFlight group."""
+
+    def setUp(self) -> None:
+        """
+        Creates a group and a callable that blocks until released.
+        """
+
+        self.group = SingleFlight("test")
+        self.release = Event()
+        self.calls = 0
+
+    def _fetch(self) -> str:
+        self.calls += 1
+        self.release.wait(5)
+        return "rates"
+
+    def test_concurrent_calls_share_one_execution(self):
+        """
+        Tests that calls for a key in flight wait for it and get its result,
+        and that they are counted as coalesced.
+        """
+
+        coalesced_before = SINGLE_FLIGHT_CALLS.value(group="test", outcome="coalesced")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(self.group.do, "usd", self._fetch) for _ in range(8)
+            ]
+            wait_until(lambda: self.group.stats["coalesced"] == 7)
+            self.release.set()
+            results = [future.result(5) for future in futures]
+
+        self.assertEqual(results, ["rates"] * 8)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(
+            self.group.stats, {"executed": 1, "coalesced": 7, "in_flight": 0}
+        )
+        self.assertEqual(
+            SINGLE_FLIGHT_CALLS.value(group="test", outcome="coalesced"),
+            coalesced_before + 7,
+        )
+
+    def test_different_keys_and_later_calls_run_again(self):
+        """
+        Tests that other keys run on their own and that nothing is cached once
+        a call finishes.
+        """
+
+        self.release.set()
+
+        self.group.do("usd", self._fetch)
+        self.group.do("eur", self._fetch)
+        self.group.do("usd", self._fetch)
+
+        self.assertEqual(self.calls, 3)
+
+    def test_error_is_raised_in_every_waiting_caller(self):
+        """
+        Tests that an exception raised by the running call reaches the callers
+        waiting for it.
+        """
+
+        def fail() -> str:
+            self.release.wait(5)
+            raise ConnectionError("down")
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(self.group.do, "usd", fail) for _ in range(3)]
+            wait_until(lambda: self.group.stats["coalesced"] == 2)
+            self.release.set()
+
+            for future in futures:
+                with self.assertRaises(ConnectionError):
+                    future.result(5)
+
+        self.assertEqual(self.group.stats["in_flight"], 0)
+
@@ -0,0 +1,205 @@
+import os
+import time
+from itertools import count
+from threading import Thread
+from types import SimpleNamespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from mysql.connector import PoolError
+
+from infrastructure.database import DatabaseConnection
+from infrastructure.exceptions import PoolExhaustedError
+
+CONNECTION_IDS = count(1)
+
+
+class FakePooledConnection:
+    """Pooled connection double that returns itself to its pool on close."""
+
+    def __init__(self, pool: "FakePool") -> None:
+        self._pool = pool
+        self.connection_id = next(CONNECTION_IDS)
+        self.reconnects = 0
+
+    def reconnect(self) -> None:
+        self.connection_id = next(CONNECTION_IDS)
+        self.reconnects += 1
+
+    def is_connected(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self._pool.idle.append(self)
+
+
+class FakePool:
+    """MySQLConnectionPool double that raises PoolError when exhausted."""
+
+    instances = 0
+
+    def __init__(self, pool_size: int, **kwargs) -> None:
+        FakePool.instances += 1
+        self.kwargs = kwargs
+        self.idle = []
+        self.idle.extend(FakePooledConnection(self) for _ in range(pool_size))
+
+    def get_connection(self) -> FakePooledConnection:
+        if not self.idle:
+            raise PoolError("Failed getting connection; pool exhausted")
+        return self.idle.pop(0)
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic max-age tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDatabaseConnectionPool(TestCase):
+    """Test case for the pool handling of DatabaseConnection."""
+
+    def setUp(self) -> None:
+        """
+        Builds a fresh DatabaseConnection over a fake pool with two connections.
+        """
+
+        self.clock = FakeClock()
+        patches = [
+            patch.dict(
+                os.environ,
+                {
+                    "DB_POOL_SIZE": "2",
+                    "DB_POOL_RESET_SESSION": "false",
+                    "DB_POOL_MAX_AGE_SECONDS": "60",
+                    "DB_POOL_CHECKOUT_TIMEOUT_SECONDS": "0.5",
+                    "DB_POOL_MAX_WAITERS": "2",
+                },
+            ),
+            patch(
+                "infrastructure.database.connection.pooling.MySQLConnectionPool",
+                FakePool,
+            ),
+            patch(
+                "infrastructure.database.connection.time",
+                SimpleNamespace(monotonic=self.clock),
+            ),
+            patch.object(DatabaseConnection, "_instance", None),
+        ]
+        for active in patches:
+            active.start()
+            self.addCleanup(active.stop)
+
+        FakePool.instances = 0
+        self.db_connection = DatabaseConnection()
+
+    def test_pool_is_configured_from_settings(self):
+        """
+        Tests that warm-up creates the pool once with the configured options.
+        """
+
+        self.assertEqual(self.db_connection.warm_up(), 2)
+        self.db_connection.warm_up()
+
+        self.assertEqual(FakePool.instances, 1)
+        self.assertFalse(
+            self.db_connection._connection_pool.kwargs["pool_reset_session"]
+        )
+
+    def _start_waiter(self, acquired: list, name: str) -> Thread:
+        """
+        Starts a thread that checks out a connection, records name and releases it,
+        returning once the thread is queued. A checkout that times out records nothing.
+        """
+
+        def check_out() -> None:
+            try:
+                with self.db_connection.get_connection():
+                    acquired.append(name)
+            except PoolExhaustedError:
+                pass
+
+        queued = self.db_connection.get_pool_stats().waiting
+        thread = Thread(target=check_out)
+        thread.start()
+        while self.db_connection.get_pool_stats().waiting == queued:
+            time.sleep(0.001)
+        return thread
+
+    def test_stats_track_usage(self):
+        """
+        Tests the in-use, idle and checkout counters.
+        """
+
+        with self.db_connection.get_connection():
+            with self.db_connection.get_connection():
+                stats = self.db_connection.get_pool_stats()
+                self.assertEqual((stats.in_use, stats.idle), (2, 0))
+
+        stats = self.db_connection.get_pool_stats()
+        self.assertEqual((stats.in_use, stats.idle), (0, 2))
+        self.assertEqual(stats.checkouts, 2)
+        self.assertEqual(stats.waits, 0)
+
+    def test_waiters_are_served_in_arrival_order(self):
+        """
+        Tests that queued checkouts get released connections first come, first served.
+        """
+
+        acquired = []
+        with self.db_connection.get_connection():
+            with self.db_connection.get_connection():
+                first = self._start_waiter(acquired, "first")
+                second = self._start_waiter(acquired, "second")
+
+            # A single released connection is passed from waiter to waiter.
+            first.join()
+            second.join()
+
+        self.assertEqual(acquired, ["first", "second"])
+        self.assertEqual(self.db_connection.get_pool_stats().waits, 2)
+
+    def test_full_queue_is_rejected_and_wait_times_out(self):
+        """
+        Tests that checkouts beyond the queue bound fail at once and queued ones
+        fail after the checkout timeout.
+        """
+
+        acquired = []
+        with self.db_connection.get_connection():
+            with self.db_connection.get_connection():
+                waiters = [self._start_waiter(acquired, name) for name in "ab"]
+
+                with self.assertRaises(PoolExhaustedError) as rejected:
+                    with self.db_connection.get_connection():
+                        pass
+
+                for waiter in waiters:
+                    waiter.join()
+
+        stats = self.db_connection.get_pool_stats()
+        self.assertEqual(rejected.exception.retry_after, 1)
+        self.assertEqual(acquired, [])
+        self.assertEqual((stats.rejected, stats.timeouts, stats.waiting), (1, 2, 0))
+        self.assertEqual((stats.in_use, stats.idle), (0, 2))
+
+    def test_expired_connection_is_reconnected(self):
+        """
+        Tests that a connection older than the max-age is reopened on checkout.
+        """
+
+        with self.db_connection.get_connection() as connection:
+            first_id = connection.connection_id
+
+        self.clock.now = 61.0
+        self.db_connection._connection_pool.idle.reverse()
+
+        with self.db_connection.get_connection() as connection:
+            self.assertEqual(connection.reconnects, 1)
+            self.assertNotEqual(connection.connection_id, first_id)
+
+        self.assertEqual(self.db_connection.get_pool_stats().recycled, 1)
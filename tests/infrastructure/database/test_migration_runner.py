@@ -0,0 +1,180 @@
+import sqlite3
+from contextlib import contextmanager
+from unittest import TestCase
+
+from infrastructure.database.migrations import (MIGRATIONS, IndexDefinition,
+                                                Migration, MigrationRunner)
+
+
+class RecordingCursor:
+    """Cursor double that records statements and answers the runner's lookups."""
+
+    def __init__(self, database: "RecordingDatabaseConnection") -> None:
+        self._database = database
+        self._result: list = []
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        statement = " ".join(query.split())
+        self._database.executed.append(statement)
+
+        if statement.startswith("SELECT version"):
+            self._result = [(version,) for version in self._database.applied]
+        elif "information_schema.statistics" in statement:
+            self._result = [(int(params[1] in self._database.indexes),)]
+        elif statement.startswith("INSERT INTO schema_migrations"):
+            self._database.applied.append(params[0])
+
+    def fetchall(self) -> list:
+        return self._result
+
+    def fetchone(self) -> tuple:
+        return self._result[0]
+
+
+class RecordingDatabaseConnection:
+    """DatabaseConnection double holding applied versions and existing indexes."""
+
+    def __init__(self, applied: list, indexes: set) -> None:
+        self.applied = applied
+        self.indexes = indexes
+        self.executed: list = []
+
+    @contextmanager
+    def get_connection(self):
+        yield self
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self)
+
+    def commit(self) -> None:
+        pass
+
+
+class SQLiteCursor:
+    """Cursor adapter that runs MySQL-style %s queries on SQLite."""
+
+    def __init__(self, cursor: sqlite3.Cursor) -> None:
+        self._cursor = cursor
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        self._cursor.execute(query.replace("%s", "?"), params)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+
+class SQLiteDatabaseConnection:
+    """DatabaseConnection double on an in-memory SQLite database."""
+
+    def __init__(self) -> None:
+        self.connection = sqlite3.connect(":memory:")
+
+    @contextmanager
+    def get_connection(self):
+        yield self
+
+    def cursor(self) -> SQLiteCursor:
+        return SQLiteCursor(self.connection.cursor())
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+
+class TestMigrationRunner(TestCase):
+    """Test case for MigrationRunner class."""
+
+    MIGRATIONS = (
+        Migration(1, "create_things", ("CREATE TABLE IF NOT EXISTS things (id INT)",)),
+        Migration(
+            2,
+            "index_things",
+            (
+                IndexDefinition("things", "idx_things_id", ("id",)),
+                IndexDefinition("things", "idx_things_name", ("name", "id")),
+            ),
+        ),
+    )
+
+    def test_upgrade_applies_only_pending_versions(self):
+        """
+        Tests that applied versions are skipped and new ones are recorded.
+        """
+
+        db_connection = RecordingDatabaseConnection(applied=[1], indexes=set())
+        runner = MigrationRunner(db_connection, self.MIGRATIONS)
+
+        applied = runner.upgrade()
+
+        self.assertEqual([migration.version for migration in applied], [2])
+        self.assertEqual(db_connection.applied, [1, 2])
+        self.assertNotIn(
+            "CREATE TABLE IF NOT EXISTS things (id INT)", db_connection.executed
+        )
+        self.assertEqual(runner.pending(), [])
+
+    def test_existing_index_is_not_recreated(self):
+        """
+        Tests that an index created by hand is detected and left alone.
+        """
+
+        db_connection = RecordingDatabaseConnection(
+            applied=[], indexes={"idx_things_id"}
+        )
+
+        MigrationRunner(db_connection, self.MIGRATIONS).upgrade(target=2)
+
+        self.assertNotIn(
+            "CREATE INDEX idx_things_id ON things (id)", db_connection.executed
+        )
+        self.assertIn(
+            "CREATE INDEX idx_things_name ON things (name, id)", db_connection.executed
+        )
+
+    def test_target_stops_upgrade(self):
+        """
+        Tests that upgrading to a target version leaves later ones pending.
+        """
+
+        db_connection = RecordingDatabaseConnection(applied=[], indexes=set())
+        runner = MigrationRunner(db_connection, self.MIGRATIONS)
+
+        runner.upgrade(target=1)
+
+        self.assertEqual(db_connection.applied, [1])
+        self.assertEqual([migration.version for migration in runner.pending()], [2])
+
+    def test_daily_totals_migration_backfills_existing_expenses(self):
+        """
+        Tests that creating the daily totals rollup fills it from the expenses
+        stored before the upgrade, and that re-running the backfill does not
+        count them twice.
+        """
+
+        db_connection = SQLiteDatabaseConnection()
+        runner = MigrationRunner(db_connection, MIGRATIONS)
+        runner.upgrade(target=1)
+
+        db_connection.connection.executemany(
+            "INSERT INTO expenses VALUES (?, 't1', ?, ?, 'USD', ?, ?, 'Food')",
+            [
+                ("e1", "2026-03-01", 1, 4000, "Cash"),
+                ("e2", "2026-03-01", 2, 8000, "Card"),
+                ("e3", "2026-03-02", 3, 12000, "Cash"),
+            ],
+        )
+        runner.upgrade(target=2)
+        backfill = MIGRATIONS[1].steps[-1]
+        db_connection.connection.execute(backfill)
+
+        rows = db_connection.connection.execute(
+            "SELECT expense_date, cash, card, total, expense_count "
+            "FROM trip_daily_totals ORDER BY expense_date"
+        ).fetchall()
+
+        self.assertEqual(
+            rows,
+            [
+                ("2026-03-01", 4000, 8000, 12000, 2),
+                ("2026-03-02", 12000, 0, 12000, 1),
+            ],
+        )
@@ -0,0 +1,92 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from infrastructure.database import InstrumentedConnection, track_queries
+
+
+class TestQueryInstrumentation(TestCase):
+    """Test case for the instrumented connection and cursors."""
+
+    def setUp(self) -> None:
+        """
+        Wraps a mock connection whose cursor returns two rows in two batches.
+        """
+
+        self.raw_cursor = MagicMock()
+        self.raw_cursor.fetchmany.side_effect = [[(1,), (2,)], []]
+        self.raw_cursor.fetchall.return_value = [(1,), (2,), (3,)]
+        self.raw_cursor.rowcount = 4
+
+        raw_connection = MagicMock()
+        raw_connection.cursor.return_value = self.raw_cursor
+        self.connection = InstrumentedConnection(raw_connection, 100)
+
+    def test_statements_are_counted_per_context(self):
+        """
+        Tests that each statement is reported once with its row and parameter
+        counts, whether it ends by exhausting its rows or by the next execute.
+        """
+
+        with track_queries() as counter:
+            cursor = self.connection.cursor(buffered=False)
+            cursor.execute("SELECT id FROM expenses WHERE trip_id = %s", ("t",))
+            while cursor.fetchmany(2):
+                pass
+            cursor.execute("SELECT id FROM trips")
+            cursor.fetchall()
+
+        self.assertEqual(counter.count, 2)
+        self.assertEqual(counter.rows, 5)
+        self.assertEqual(counter.slow, 0)
+
+    def test_pending_statements_are_flushed_on_release(self):
+        """
+        Tests that writes, which fetch nothing, are reported with the affected
+        row count when the connection is flushed.
+        """
+
+        with track_queries() as counter:
+            cursor = self.connection.cursor()
+            cursor.executemany(
+                "INSERT INTO trips (trip_id, currency) VALUES (%s, %s)",
+                [("a", "COP"), ("b", "USD")],
+            )
+            self.assertEqual(counter.count, 0)
+            self.connection.flush()
+
+        self.assertEqual(counter.count, 1)
+        self.assertEqual(counter.rows, 4)
+
+    def test_slow_statements_are_logged(self):
+        """
+        Tests that statements over the threshold are logged with their SQL text
+        but not their parameter values.
+        """
+
+        raw_connection = MagicMock()
+        raw_connection.cursor.return_value.rowcount = -1
+        connection = InstrumentedConnection(raw_connection, 0)
+
+        with track_queries() as counter:
+            with self.assertLogs(
+                "infrastructure.database.query_instrumentation", "WARNING"
+            ) as logs:
+                cursor = connection.cursor()
+                cursor.execute("SELECT *\n  FROM trips WHERE trip_id = %s", ("secret",))
+                cursor.close()
+
+        self.assertEqual(counter.slow, 1)
+        self.assertIn("1 params", logs.output[0])
+        self.assertIn("SELECT * FROM trips WHERE trip_id = %s", logs.output[0])
+        self.assertNotIn("secret", logs.output[0])
+
+    def test_queries_outside_a_tracked_context_are_not_counted(self):
+        """
+        Tests that statements run without an active counter are still executed.
+        """
+
+        cursor = self.connection.cursor()
+        cursor.execute("SELECT id FROM trips")
+
+        self.assertEqual(cursor.fetchall(), [(1,), (2,), (3,)])
+        self.raw_cursor.execute.assert_called_once_with("SELECT id FROM trips", ())
@@ -0,0 +1,243 @@
+import os
+from contextlib import contextmanager
+from datetime import date, timedelta
+from unittest import TestCase, skipUnless
+from uuid import uuid4
+
+import mysql.connector
+from mysql.connector import Error
+
+from core.domain import ExchangeRate, Expense, Trip
+from core.enums import ExpenseType, PaymentMethod
+from infrastructure.database.migrations import MigrationRunner
+from infrastructure.persistence import (MySQLExchangeRateRepository,
+                                        MySQLExpenseRepository,
+                                        MySQLTripRepository)
+
+# Scratch MySQL/MariaDB database for the plan check. Its tables are dropped
+# and recreated, so never point it at a database holding real data.
+TEST_DB = {
+    "host": os.getenv("TEST_DB_HOST", "127.0.0.1"),
+    "port": int(os.getenv("TEST_DB_PORT", "3306")),
+    "user": os.getenv("TEST_DB_USER", "root"),
+    "password": os.getenv("TEST_DB_PASSWORD", ""),
+    "database": os.getenv("TEST_DB_NAME", ""),
+}
+
+# Repository methods that read a whole table by design. Trips active on a date
+# started on or before it, which is most of the table.
+FULL_READS = {
+    "get_active_currencies",
+    "get_all",
+    "get_dashboard_totals",
+    "get_total_amount",
+    "rebuild_all_daily_totals",
+}
+
+
+def database_available() -> bool:
+    if not TEST_DB["database"]:
+        return False
+    try:
+        mysql.connector.connect(**TEST_DB).close()
+        return True
+    except Error:
+        return False
+
+
+class ExplainingCursor:
+    """Cursor wrapper that records the EXPLAIN plan of every read before running it."""
+
+    def __init__(self, cursor, connection, plans: list) -> None:
+        self._cursor = cursor
+        self._connection = connection
+        self._plans = plans
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        statement = " ".join(query.split())
+        keyword = statement.split(" ", 1)[0].upper()
+
+        if keyword in ("SELECT", "UPDATE", "DELETE") or (
+            keyword == "INSERT" and " SELECT " in statement.upper()
+        ):
+            explain_cursor = self._connection.cursor(dictionary=True, buffered=True)
+            explain_cursor.execute(f"EXPLAIN {statement}", params)
+            self._plans.append((statement, explain_cursor.fetchall()))
+            explain_cursor.close()
+
+        self._cursor.execute(query, params)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+
+class ExplainingConnection:
+    """Connection wrapper that hands out explaining cursors."""
+
+    def __init__(self, connection, plans: list) -> None:
+        self._connection = connection
+        self._plans = plans
+
+    def cursor(self, **kwargs) -> ExplainingCursor:
+        return ExplainingCursor(
+            self._connection.cursor(**kwargs), self._connection, self._plans
+        )
+
+    def __getattr__(self, name: str):
+        return getattr(self._connection, name)
+
+
+class StandInDatabaseConnection:
+    """DatabaseConnection double connected to the scratch database."""
+
+    def __init__(self) -> None:
+        self.plans: list = []
+
+    @contextmanager
+    def get_connection(self):
+        connection = mysql.connector.connect(**TEST_DB, autocommit=True)
+        try:
+            yield ExplainingConnection(connection, self.plans)
+        finally:
+            connection.close()
+
+
+@skipUnless(database_available(), "set TEST_DB_NAME to a reachable scratch database")
+class TestQueryPlans(TestCase):
+    """Fails when a repository query needs a full table scan on the migrated schema."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Recreates the schema through the migrations and seeds enough rows
+        for the optimizer to prefer the indexes.
+        """
+
+        cls.db_connection = StandInDatabaseConnection()
+        with cls.db_connection.get_connection() as connection:
+            cursor = connection.cursor()
+            for table in (
+                "exchange_rates",
+                "trip_daily_totals",
+                "expenses",
+                "trips",
+                "schema_migrations",
+            ):
+                cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+        MigrationRunner(cls.db_connection).upgrade()
+
+        cls.trip_repository = MySQLTripRepository(cls.db_connection)
+        cls.expense_repository = MySQLExpenseRepository(cls.db_connection)
+        cls.exchange_rate_repository = MySQLExchangeRateRepository(cls.db_connection)
+
+        start = date(2025, 1, 1)
+        cls.trips = [
+            Trip(
+                uuid4(),
+                start + timedelta(days=index),
+                start + timedelta(days=index + 9),
+                False,
+                1e5,
+            )
+            for index in range(50)
+        ]
+        for trip in cls.trips:
+            cls.trip_repository.save(trip)
+            cls.expense_repository.save_many(
+                [
+                    Expense(
+                        uuid4(),
+                        trip.trip_id,
+                        trip.start_date + timedelta(days=index % 10),
+                        1000.0,
+                        "COP",
+                        1000.0,
+                        list(PaymentMethod)[index % 2],
+                        list(ExpenseType)[index % len(ExpenseType)],
+                    )
+                    for index in range(200)
+                ]
+            )
+
+        cls.exchange_rate_repository.save_many(
+            [
+                ExchangeRate(start + timedelta(days=index), base, "COP", 4000.0)
+                for base in ("USD", "EUR", "GBP")
+                for index in range(200)
+            ]
+        )
+
+        with cls.db_connection.get_connection() as connection:
+            cursor = connection.cursor()
+            for table in ("trips", "expenses", "trip_daily_totals", "exchange_rates"):
+                cursor.execute(f"ANALYZE TABLE {table}")
+                cursor.fetchall()
+
+    def _repository_calls(self):
+        trip = self.trips[0]
+        first_page = self.expense_repository.get_page(trip.trip_id, 10)
+        after = (first_page[-1].expense_date, first_page[-1].expense_id)
+
+        return {
+            "get_by_id": lambda: self.trip_repository.get_by_id(trip.trip_id),
+            "get_all": self.trip_repository.get_all,
+            "get_dashboard_totals": lambda: self.trip_repository.get_dashboard_totals(
+                trip.start_date
+            ),
+            "get_active_currencies": lambda: self.trip_repository.get_active_currencies(
+                trip.start_date
+            ),
+            "get_by_trip_id": lambda: self.expense_repository.get_by_trip_id(
+                trip.trip_id
+            ),
+            "iter_by_trip_id": lambda: list(
+                self.expense_repository.iter_by_trip_id(trip.trip_id)
+            ),
+            "get_by_trip_and_date": lambda: self.expense_repository.get_by_trip_and_date(
+                trip.trip_id, trip.start_date
+            ),
+            "get_page": lambda: self.expense_repository.get_page(trip.trip_id, 10),
+            "get_page_after": lambda: self.expense_repository.get_page(
+                trip.trip_id, 10, after
+            ),
+            "get_columns": lambda: self.expense_repository.get_columns(trip.trip_id),
+            "get_daily_total": lambda: self.expense_repository.get_daily_total(
+                trip.trip_id, trip.start_date
+            ),
+            "get_daily_totals": lambda: self.expense_repository.get_daily_totals(
+                trip.trip_id
+            ),
+            "get_type_totals": lambda: self.expense_repository.get_type_totals(
+                trip.trip_id
+            ),
+            "get_trip_totals": lambda: self.expense_repository.get_trip_totals(
+                trip.trip_id
+            ),
+            "get_total_amount": self.expense_repository.get_total_amount,
+            "rebuild_daily_totals": lambda: self.expense_repository.rebuild_daily_totals(
+                trip.trip_id
+            ),
+            "rebuild_all_daily_totals": self.expense_repository.rebuild_daily_totals,
+            "get_rate": lambda: self.exchange_rate_repository.get_rate(
+                "EUR", "COP", trip.start_date
+            ),
+        }
+
+    def test_repository_queries_use_indexes(self):
+        """
+        Tests that no repository query outside FULL_READS scans a whole table.
+        """
+
+        for name, call in self._repository_calls().items():
+            with self.subTest(method=name):
+                self.db_connection.plans.clear()
+                call()
+
+                self.assertTrue(self.db_connection.plans)
+                if name in FULL_READS:
+                    continue
+
+                for statement, plan in self.db_connection.plans:
+                    full_scans = [row["table"] for row in plan if row["type"] == "ALL"]
+                    self.assertEqual(full_scans, [], statement)
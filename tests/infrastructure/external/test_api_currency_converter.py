@@ -1,3 +1,6 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
@@ -16,7 +19,7 @@ class TestApiCurrencyConverter(TestCase):
         super().__init__(methodName)
         self.converter = ApiCurrencyConverter()
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_conversion_success(self, mock_get):
         """
         Tests the conversion of an amount from one currency to another.
@@ -31,7 +34,7 @@ class TestApiCurrencyConverter(TestCase):
 
         self.assertEqual(result, 4000000)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_conversion_error(self, mock_get):
         """
         Tests the conversion when the API returns an error status code.
@@ -45,7 +48,7 @@ class TestApiCurrencyConverter(TestCase):
         with self.assertRaises(ConversionError):
             self.converter.convert(100, "TEST", "COP")
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_conversion_same_currency(self, mock_get):
         """
         Tests the conversion when the source and target currencies are the same.
@@ -60,7 +63,7 @@ class TestApiCurrencyConverter(TestCase):
 
         self.assertEqual(result, 100)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_conversion_http_error(self, mock_get):
         """
         Tests the conversion when the API returns a 500 Internal Server Error.
@@ -73,3 +76,106 @@ class TestApiCurrencyConverter(TestCase):
 
         with self.assertRaises(ConversionError):
             self.converter.convert(100, "USD", "COP")
+
+    @patch("requests.Session.get")
+    def test_rate_table_is_cached(self, mock_get):
+        """
+        Tests that repeated conversions from the same base currency
+        fetch the rate table only once.
+        """
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"usd": {"cop": 4000, "eur": 0.9}}
+        mock_get.return_value = mock_response
+
+        self.converter.convert(100, "USD", "COP")
+        result = self.converter.convert(10, "USD", "EUR")
+
+        self.assertEqual(result, 9)
+        mock_get.assert_called_once()
+        self.assertEqual(self.converter.cache_stats["hits"], 1)
+
+    @patch("requests.Session.get")
+    def test_convert_many_fetches_once(self, mock_get):
+        """
+        Tests that a batch in one currency fetches the rate table once and
+        converts every amount in order.
+        """
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"usd": {"cop": 4000}}
+        mock_get.return_value = mock_response
+
+        result = self.converter.convert_many([1, 2.5, 10], "USD", "COP")
+
+        self.assertEqual(result, [4000, 10000, 40000])
+        mock_get.assert_called_once()
+        self.assertEqual(self.converter.convert_many([], "USD", "COP"), [])
+
+    @patch("requests.Session.get")
+    def test_convert_mixed_fetches_each_currency_once(self, mock_get):
+        """
+        Tests that a mixed-currency batch fetches one rate table per distinct
+        currency and keeps the amounts in order.
+        """
+
+        tables = {
+            "usd": {"usd": {"cop": 4000}},
+            "eur": {"eur": {"cop": 4500}},
+        }
+
+        def respond(url, timeout):
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = tables[url.rsplit("/", 1)[-1][:-5]]
+            return response
+
+        mock_get.side_effect = respond
+
+        result = self.converter.convert_mixed(
+            [1, 2, 3, 4], ["USD", "EUR", "usd", "EUR"], "COP"
+        )
+
+        self.assertEqual(result, [4000, 9000, 12000, 18000])
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_convert_mixed_rejects_mismatched_lengths(self):
+        """
+        Tests that a mixed-currency batch with fewer currencies than amounts
+        is rejected.
+        """
+
+        with self.assertRaises(ValueError):
+            self.converter.convert_mixed([1, 2], ["USD"], "COP")
+
+    def test_concurrent_misses_share_one_request(self):
+        """
+        Tests that conversions from the same currency that miss the cache at
+        the same time send a single request to the API.
+        """
+
+        release = Event()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"usd": {"cop": 4000}}
+        session = MagicMock()
+        session.get.side_effect = lambda url, timeout: (
+            release.wait(5) and mock_response
+        )
+        converter = ApiCurrencyConverter(session=session)
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [
+                executor.submit(converter.convert, 1, "USD", "COP") for _ in range(10)
+            ]
+            deadline = time.monotonic() + 5
+            while converter.coalescing_stats["coalesced"] < 9:
+                self.assertLess(time.monotonic(), deadline)
+                time.sleep(0.001)
+            release.set()
+
+            self.assertEqual([future.result(5) for future in futures], [4000] * 10)
+
+        session.get.assert_called_once()
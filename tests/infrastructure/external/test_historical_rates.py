@@ -0,0 +1,135 @@
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from core.domain import ExchangeRate
+from infrastructure.exceptions import ConversionError
+from infrastructure.external import ApiCurrencyConverter
+from infrastructure.persistence import InMemoryExchangeRateRepository
+
+TODAY = date(2026, 3, 20)
+LATEST_URL = "https://rates.test/latest/"
+HISTORY_URL = "https://rates.test/{date}/"
+
+
+class TestHistoricalRates(TestCase):
+    """Test case for date-accurate conversions through the rate store."""
+
+    def setUp(self) -> None:
+        """
+        Creates a converter on a stub session that answers every URL with a
+        table whose COP rate depends on the date in the URL.
+        """
+
+        self.session = MagicMock()
+        self.session.get.side_effect = self._respond
+        self.rate_repository = InMemoryExchangeRateRepository()
+        self.converter = self._make_converter(HISTORY_URL)
+
+    def _make_converter(self, history_url: str) -> ApiCurrencyConverter:
+        return ApiCurrencyConverter(
+            session=self.session,
+            api_url=LATEST_URL,
+            rate_repository=self.rate_repository,
+            history_url=history_url,
+            today=lambda: TODAY,
+        )
+
+    def _respond(self, url: str, timeout: tuple) -> MagicMock:
+        rate = 4000.0 if url.startswith(LATEST_URL) else 3000.0 + int(url[-11:-9])
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"usd": {"cop": rate, "eur": 0.9}}
+        return response
+
+    def test_past_date_is_fetched_once_and_stored(self):
+        """
+        Tests that a past date is fetched from the history URL and that later
+        conversions for that date, to any currency, are served from the store.
+        """
+
+        expense_date = date(2026, 3, 2)
+
+        self.assertEqual(self.converter.convert_on(2, "USD", "COP", expense_date), 6004)
+        self.assertEqual(self.converter.convert_on(1, "USD", "COP", expense_date), 3002)
+        self.assertEqual(self.converter.convert_on(10, "USD", "EUR", expense_date), 9)
+
+        self.session.get.assert_called_once()
+        self.assertEqual(
+            self.session.get.call_args.args[0], "https://rates.test/2026-03-02/usd.json"
+        )
+        stored = self.rate_repository.get_rate("usd", "cop", expense_date)
+        self.assertEqual((stored.rate_date, stored.rate), (expense_date, 3002))
+
+    def test_stored_rate_covers_the_next_days_up_to_the_gap(self):
+        """
+        Tests that a stored rate is used for later dates within the allowed gap
+        and that a date past it is fetched.
+        """
+
+        self.converter.convert_on(1, "USD", "COP", date(2026, 3, 6))
+
+        self.assertEqual(
+            self.converter.convert_on(1, "USD", "COP", date(2026, 3, 9)), 3006
+        )
+        self.assertEqual(self.session.get.call_count, 1)
+
+        self.assertEqual(
+            self.converter.convert_on(1, "USD", "COP", date(2026, 3, 10)), 3010
+        )
+        self.assertEqual(self.session.get.call_count, 2)
+
+    def test_today_uses_the_latest_rates_not_the_store(self):
+        """
+        Tests that converting for today ignores a recent stored rate and uses
+        the latest rates through the cache, without writing them to the store.
+        """
+
+        self.rate_repository.save_many(
+            [ExchangeRate(TODAY - timedelta(days=1), "USD", "COP", 3019.0)]
+        )
+
+        self.assertEqual(self.converter.convert_on(1, "USD", "COP", TODAY), 4000)
+        self.assertEqual(self.converter.convert_on(2, "USD", "COP", TODAY), 8000)
+
+        self.session.get.assert_called_once()
+        self.assertEqual(
+            self.session.get.call_args.args[0], "https://rates.test/latest/usd.json"
+        )
+        self.assertEqual(self.rate_repository.get_rate("USD", "COP", TODAY).rate, 3019)
+
+    def test_without_history_url_past_dates_need_a_stored_rate(self):
+        """
+        Tests that without a history URL a past date is converted with a stored
+        rate within the gap, and that a date with none raises ConversionError
+        instead of silently using the latest rates.
+        """
+
+        converter = self._make_converter("")
+        self.rate_repository.save_many(
+            [ExchangeRate(TODAY - timedelta(days=12), "USD", "COP", 3008.0)]
+        )
+
+        self.assertEqual(
+            converter.convert_on(1, "USD", "COP", TODAY - timedelta(days=10)), 3008
+        )
+        with self.assertRaises(ConversionError):
+            converter.convert_on(1, "USD", "COP", TODAY - timedelta(days=8))
+
+        self.session.get.assert_not_called()
+
+    def test_convert_mixed_resolves_each_currency_and_date_once(self):
+        """
+        Tests that a dated batch looks up each distinct date once and applies
+        to every amount the rate of its own date.
+        """
+
+        dates = [date(2026, 3, 2), date(2026, 3, 16), date(2026, 3, 2)]
+
+        result = self.converter.convert_mixed(
+            [1, 1, 2], ["USD", "USD", "USD"], "COP", dates
+        )
+
+        self.assertEqual(result, [3002, 3016, 6004])
+        self.assertEqual(self.session.get.call_count, 2)
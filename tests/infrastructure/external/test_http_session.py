@@ -0,0 +1,121 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import List
+from unittest import TestCase
+
+from infrastructure.caching import TTLLRUCache
+from infrastructure.exceptions import ConversionError
+from infrastructure.external import ApiCurrencyConverter, create_http_session
+
+
+class StubRatesServer(ThreadingHTTPServer):
+    """
+    Local rates API that answers with queued statuses, then with 200, and
+    counts the TCP connections it accepts.
+    """
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubRatesHandler)
+        self.connections = 0
+        self.requests = 0
+        self.statuses: List[int] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address
+        return f"http://{host}:{port}/"
+
+
+class StubRatesHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.connections += 1
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        base_currency = self.path.strip("/").removesuffix(".json")
+        body = json.dumps({base_currency: {"cop": 4000}}).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class TestHttpSession(TestCase):
+    """Test case for the pooled HTTP session of the currency converter."""
+
+    def setUp(self) -> None:
+        """
+        Starts the stub server and a converter that reaches it through a new
+        session with two retries and no backoff.
+        """
+
+        self.server = StubRatesServer()
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.session = create_http_session(
+            max_retries=2, backoff_seconds=0, pool_maxsize=2
+        )
+        self.addCleanup(self.session.close)
+        self.converter = ApiCurrencyConverter(
+            TTLLRUCache(max_entries=8, ttl_seconds=60),
+            session=self.session,
+            api_url=self.server.url,
+        )
+
+    def test_connection_is_reused(self):
+        """
+        Tests that sequential fetches share one keep-alive connection.
+        """
+
+        for currency in ("USD", "EUR", "GBP", "MXN"):
+            self.assertEqual(self.converter.convert(1, currency, "COP"), 4000)
+
+        self.assertEqual(self.server.requests, 4)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_server_errors_are_retried(self):
+        """
+        Tests that 5xx answers are retried until one succeeds.
+        """
+
+        self.server.statuses = [503, 500]
+
+        self.assertEqual(self.converter.convert(2, "USD", "COP"), 8000)
+        self.assertEqual(self.server.requests, 3)
+
+    def test_retries_are_bounded(self):
+        """
+        Tests that the last 5xx answer is reported once the retries are spent.
+        """
+
+        self.server.statuses = [502, 502, 502, 502]
+
+        with self.assertRaises(ConversionError):
+            self.converter.convert(1, "USD", "COP")
+        self.assertEqual(self.server.requests, 3)
+
+    def test_unreachable_api_raises_conversion_error(self):
+        """
+        Tests that connection failures surface as ConversionError.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+        converter = ApiCurrencyConverter(session=self.session, api_url=self.server.url)
+
+        with self.assertRaises(ConversionError):
+            converter.convert(1, "USD", "COP")
@@ -0,0 +1,130 @@
+import threading
+import time
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from core.domain import Trip
+from infrastructure.caching import TTLLRUCache
+from infrastructure.external import ApiCurrencyConverter, RateRefresher
+from infrastructure.persistence import InMemoryTripRepository
+
+TODAY = date(2026, 5, 10)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateRefresher(TestCase):
+    """Test case for the exchange-rate snapshot and its background refresher."""
+
+    def setUp(self) -> None:
+        """
+        Creates trips in USD (active), EUR (active), COP (active) and GBP
+        (finished) and a converter whose HTTP session answers from a table
+        of rates.
+        """
+
+        self.trip_repository = InMemoryTripRepository()
+        for currency, start in (("USD", -2), ("EUR", 0), ("COP", -1), ("GBP", -30)):
+            start_date = TODAY + timedelta(days=start)
+            self.trip_repository.save(
+                Trip(
+                    uuid4(),
+                    start_date,
+                    start_date + timedelta(days=5),
+                    True,
+                    100.0,
+                    currency,
+                )
+            )
+
+        self.rates = {"usd": {"cop": 4000.0}, "eur": {"cop": 4400.0}}
+        self.session = MagicMock()
+        self.session.get.side_effect = self._answer
+        self.clock = FakeClock()
+        self.converter = ApiCurrencyConverter(
+            TTLLRUCache(max_entries=8, ttl_seconds=3600),
+            session=self.session,
+            api_url="http://rates.test/",
+            clock=self.clock,
+        )
+        self.refresher = RateRefresher(
+            self.converter, self.trip_repository, 60, today=lambda: TODAY
+        )
+
+    def _answer(self, url: str, timeout: tuple):
+        base_currency = url.rsplit("/", 1)[-1].removesuffix(".json")
+        response = MagicMock()
+        response.status_code = 200 if base_currency in self.rates else 503
+        response.json.return_value = {base_currency: self.rates.get(base_currency, {})}
+        return response
+
+    def test_active_currencies_are_served_without_io(self):
+        """
+        Tests that a refresh loads the active foreign currencies only and that
+        conversions from them make no HTTP call.
+        """
+
+        self.assertEqual(self.refresher.refresh(), ["eur", "usd"])
+        self.assertNotIn(
+            "http://rates.test/cop.json",
+            [call.args[0] for call in self.session.get.call_args_list],
+        )
+        self.session.get.reset_mock()
+
+        self.assertEqual(self.converter.convert(2, "USD", "COP"), 8000.0)
+        self.assertEqual(self.converter.convert(1, "EUR", "COP"), 4400.0)
+        self.session.get.assert_not_called()
+
+    def test_failed_table_keeps_its_previous_version_until_it_expires(self):
+        """
+        Tests that a failed reload keeps the last good table, which stops being
+        used once it is older than the rate TTL.
+        """
+
+        self.converter.refresh_rates(["USD", "EUR"])
+        self.clock.now += 3000
+        del self.rates["eur"]
+        self.rates["usd"] = {"cop": 4100.0}
+
+        self.assertEqual(self.converter.refresh_rates(["USD", "EUR"]), ["usd"])
+        self.assertEqual(self.converter.snapshot_currencies, ["eur", "usd"])
+        self.assertEqual(self.converter.convert(1, "USD", "COP"), 4100.0)
+
+        self.clock.now += 1000
+        self.assertEqual(self.converter.snapshot_currencies, ["usd"])
+
+    def test_background_thread_refreshes_until_stopped(self):
+        """
+        Tests that start() leaves every fetch to the background thread, which
+        loads the snapshot at once and keeps reloading it.
+        """
+
+        fetching_threads = []
+
+        def answer(url: str, timeout: tuple):
+            fetching_threads.append(threading.current_thread().name)
+            return self._answer(url, timeout)
+
+        self.session.get.side_effect = answer
+        refresher = RateRefresher(
+            self.converter, self.trip_repository, 0.01, today=lambda: TODAY
+        )
+        refresher.start()
+        self.addCleanup(refresher.stop, 1)
+
+        deadline = time.monotonic() + 2
+        while self.session.get.call_count < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        refresher.stop(timeout=1)
+
+        self.assertEqual(self.converter.snapshot_currencies, ["eur", "usd"])
+        self.assertGreaterEqual(self.session.get.call_count, 6)
+        self.assertEqual(set(fetching_threads), {"rate-refresher"})
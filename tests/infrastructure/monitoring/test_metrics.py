@@ -0,0 +1,131 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from infrastructure.database.pool_stats import PoolStats
+from infrastructure.monitoring import (MetricsRegistry, PoolMetricsCollector,
+                                       instrument_repository, timed)
+
+
+class TestMetrics(TestCase):
+    """Test case for the metrics registry, decorators and collectors."""
+
+    def setUp(self) -> None:
+        """
+        Creates an empty registry with a latency histogram and an error counter.
+        """
+
+        self.registry = MetricsRegistry()
+        self.seconds = self.registry.histogram(
+            "op_seconds", "Operation latency.", ("operation",), buckets=(0.1, 1.0)
+        )
+        self.errors = self.registry.counter(
+            "op_errors_total", "Failed operations.", ("operation", "error")
+        )
+
+    def test_histogram_buckets_are_cumulative(self):
+        """
+        Tests that bucket counts are exposed cumulatively, with sum and count.
+        """
+
+        for value in (0.05, 0.5, 0.5, 3.0):
+            self.seconds.observe(value, operation="load")
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn('op_seconds_bucket{operation="load",le="0.1"} 1', lines)
+        self.assertIn('op_seconds_bucket{operation="load",le="1"} 3', lines)
+        self.assertIn('op_seconds_bucket{operation="load",le="+Inf"} 4', lines)
+        self.assertIn('op_seconds_sum{operation="load"} 4.05', lines)
+        self.assertIn('op_seconds_count{operation="load"} 4', lines)
+        self.assertIn("# TYPE op_seconds histogram", lines)
+
+    def test_labels_must_match(self):
+        """
+        Tests that observations with missing or unknown labels are rejected.
+        """
+
+        with self.assertRaises(ValueError):
+            self.seconds.observe(1.0)
+
+        with self.assertRaises(ValueError):
+            self.errors.inc(operation="load", status="500")
+
+    def test_timed_records_latency_and_errors(self):
+        """
+        Tests that the decorator times successful and failing calls and counts
+        failures by exception type.
+        """
+
+        @timed(self.seconds, self.errors, operation="convert")
+        def convert(amount: float) -> float:
+            if amount < 0:
+                raise ValueError("negative amount")
+            return amount * 2
+
+        self.assertEqual(convert(2), 4)
+        with self.assertRaises(ValueError):
+            convert(-1)
+
+        self.assertEqual(self.seconds.count(operation="convert"), 2)
+        self.assertEqual(self.errors.value(operation="convert", error="ValueError"), 1)
+
+    def test_timed_generator_is_measured_until_exhausted(self):
+        """
+        Tests that a decorated generator is observed once, after it is consumed.
+        """
+
+        @timed(self.seconds, operation="stream")
+        def stream():
+            yield from range(3)
+
+        rows = stream()
+        self.assertEqual(self.seconds.count(operation="stream"), 0)
+        self.assertEqual(list(rows), [0, 1, 2])
+        self.assertEqual(self.seconds.count(operation="stream"), 1)
+
+    def test_instrument_repository_wraps_public_methods(self):
+        """
+        Tests that only public methods of a repository class are wrapped.
+        """
+
+        class FakeRepository:
+            def get_by_id(self, trip_id):
+                return self._load(trip_id)
+
+            def _load(self, trip_id):
+                return trip_id
+
+        instrumented = instrument_repository(FakeRepository)
+
+        self.assertTrue(hasattr(instrumented.get_by_id, "__wrapped__"))
+        self.assertFalse(hasattr(instrumented._load, "__wrapped__"))
+        self.assertEqual(instrumented().get_by_id(7), 7)
+
+    def test_pool_collector_reads_a_stats_snapshot(self):
+        """
+        Tests that the pool collector exposes the pool counters at scrape time.
+        """
+
+        db_connection = MagicMock()
+        db_connection.get_pool_stats.return_value = PoolStats(
+            pool_size=5,
+            in_use=2,
+            idle=3,
+            waiting=1,
+            checkouts=40,
+            waits=4,
+            timeouts=1,
+            rejected=0,
+            recycled=2,
+            average_checkout_ms=1.5,
+            max_checkout_ms=250.0,
+        )
+        self.registry.register("db_pool", PoolMetricsCollector(db_connection))
+
+        lines = self.registry.render().splitlines()
+
+        self.assertIn("db_pool_in_use 2", lines)
+        self.assertIn("db_pool_waiting 1", lines)
+        self.assertIn("db_pool_checkouts_total 40", lines)
+        self.assertIn("db_pool_checkout_max_seconds 0.25", lines)
+        self.assertIn("# TYPE db_pool_timeouts_total counter", lines)
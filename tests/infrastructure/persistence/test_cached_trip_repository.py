@@ -0,0 +1,143 @@
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from core.domain import Trip
+from core.exceptions import TripNotFoundError
+from core.interfaces.repositories import TripRepository
+from infrastructure.caching import TTLLRUCache
+from infrastructure.persistence import CachedTripRepository
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic expiry tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCachedTripRepository(TestCase):
+    """Test case for CachedTripRepository class."""
+
+    def __init__(self, methodName: str = "runTest") -> None:
+        """
+        Initializes the test case with a mocked trip repository and a small cache.
+        """
+
+        super().__init__(methodName)
+        self.inner = MagicMock(spec=TripRepository)
+        self.clock = FakeClock()
+        self.repository = CachedTripRepository(
+            self.inner, TTLLRUCache(max_entries=1, ttl_seconds=60, clock=self.clock)
+        )
+        self.trip = Trip(
+            trip_id=uuid4(),
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=3),
+            is_international=False,
+            daily_budget=100000,
+        )
+        self.inner.get_by_id.return_value = self.trip
+
+    def test_get_by_id_reads_through_once(self):
+        """
+        Tests that repeated lookups of the same trip query the repository once.
+        """
+
+        first = self.repository.get_by_id(self.trip.trip_id)
+        second = self.repository.get_by_id(self.trip.trip_id)
+
+        self.assertIs(first, self.trip)
+        self.assertIs(second, self.trip)
+        self.inner.get_by_id.assert_called_once_with(self.trip.trip_id)
+        self.assertEqual(self.repository.stats["hits"], 1)
+        self.assertEqual(self.repository.stats["misses"], 1)
+
+    def test_save_invalidates_cached_trip(self):
+        """
+        Tests that saving a trip forces the next lookup back to the repository.
+        """
+
+        self.repository.get_by_id(self.trip.trip_id)
+        self.repository.save(self.trip)
+        self.repository.get_by_id(self.trip.trip_id)
+
+        self.inner.save.assert_called_once_with(self.trip)
+        self.assertEqual(self.inner.get_by_id.call_count, 2)
+
+    def test_identity_map_serves_evicted_unchanged_trip(self):
+        """
+        Tests that a trip evicted from the LRU but still referenced is reloaded
+        and, being unchanged, served as the same instance.
+        """
+
+        other = Trip(
+            trip_id=uuid4(),
+            start_date=date.today(),
+            end_date=date.today() + timedelta(days=1),
+            is_international=False,
+            daily_budget=50000,
+        )
+        reloaded = Trip(
+            trip_id=self.trip.trip_id,
+            start_date=self.trip.start_date,
+            end_date=self.trip.end_date,
+            is_international=False,
+            daily_budget=100000,
+        )
+        self.inner.get_by_id.side_effect = [self.trip, other, reloaded]
+
+        self.repository.get_by_id(self.trip.trip_id)
+        self.repository.get_by_id(other.trip_id)
+        again = self.repository.get_by_id(self.trip.trip_id)
+
+        self.assertIs(again, self.trip)
+        self.assertEqual(self.inner.get_by_id.call_count, 3)
+        self.assertEqual(self.repository.stats["identity_map_hits"], 1)
+
+    def test_reload_never_changes_a_held_instance(self):
+        """
+        Tests that once the TTL has passed a changed trip is read again from the
+        repository and returned as a new instance, leaving the one a caller
+        already holds untouched.
+        """
+
+        updated = Trip(
+            trip_id=self.trip.trip_id,
+            start_date=self.trip.start_date,
+            end_date=self.trip.end_date + timedelta(days=2),
+            is_international=False,
+            daily_budget=250000,
+        )
+        self.inner.get_by_id.side_effect = [self.trip, updated]
+        held = self.repository.get_by_id(self.trip.trip_id)
+        held_end_date, held_budget = held.end_date, held.daily_budget
+
+        self.clock.now += 61
+        second = self.repository.get_by_id(self.trip.trip_id)
+        third = self.repository.get_by_id(self.trip.trip_id)
+
+        self.assertIs(second, updated)
+        self.assertIs(third, updated)
+        self.assertEqual(held.end_date, held_end_date)
+        self.assertEqual(held.daily_budget, held_budget)
+        self.assertEqual(self.inner.get_by_id.call_count, 2)
+        self.assertEqual(self.repository.stats["identity_map_hits"], 0)
+
+    def test_not_found_is_not_cached(self):
+        """
+        Tests that a missing trip is looked up again on the next call.
+        """
+
+        missing_id = uuid4()
+        self.inner.get_by_id.side_effect = TripNotFoundError(missing_id)
+
+        for _ in range(2):
+            with self.assertRaises(TripNotFoundError):
+                self.repository.get_by_id(missing_id)
+
+        self.assertEqual(self.inner.get_by_id.call_count, 2)
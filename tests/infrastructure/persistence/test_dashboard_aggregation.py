@@ -0,0 +1,79 @@
+from contextlib import contextmanager
+from unittest import TestCase
+
+from core.services import ReportService
+from infrastructure.persistence import (MySQLExpenseRepository,
+                                        MySQLTripRepository)
+
+
+class CountingCursor:
+    """Cursor double that records every executed statement."""
+
+    def __init__(self, executed: list, trip_count: int) -> None:
+        self._executed = executed
+        self._trip_count = trip_count
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        self._executed.append((query, params))
+
+    def fetchone(self):
+        if "FROM trips" in self._executed[-1][0]:
+            return (self._trip_count, self._trip_count // 2, self._trip_count * 10)
+        return (1000.0 * self._trip_count,)
+
+
+class CountingDatabaseConnection:
+    """DatabaseConnection double that hands out counting cursors."""
+
+    def __init__(self, trip_count: int) -> None:
+        self.executed: list = []
+        self._trip_count = trip_count
+
+    @contextmanager
+    def get_connection(self):
+        yield self
+
+    def cursor(self) -> CountingCursor:
+        return CountingCursor(self.executed, self._trip_count)
+
+
+class TestDashboardAggregation(TestCase):
+    """Regression tests for the number of queries issued by the dashboard."""
+
+    def _build_service(self, trip_count: int):
+        db_connection = CountingDatabaseConnection(trip_count)
+        service = ReportService(
+            expense_repository=MySQLExpenseRepository(db_connection),
+            trip_repository=MySQLTripRepository(db_connection),
+        )
+        return service, db_connection
+
+    def test_query_count_is_constant(self):
+        """
+        Tests that the dashboard summary issues the same number of queries
+        regardless of how many trips are stored.
+        """
+
+        small_service, small_db = self._build_service(trip_count=1)
+        large_service, large_db = self._build_service(trip_count=5000)
+
+        small_service.get_dashboard_summary()
+        large_service.get_dashboard_summary()
+
+        self.assertEqual(len(small_db.executed), 2)
+        self.assertEqual(len(large_db.executed), 2)
+
+    def test_summary_values(self):
+        """
+        Tests that the aggregated rows are combined into the dashboard summary.
+        """
+
+        service, _ = self._build_service(trip_count=4)
+
+        summary = service.get_dashboard_summary()
+
+        self.assertEqual(summary["total_trips"], 4)
+        self.assertEqual(summary["active_trips"], 2)
+        self.assertEqual(summary["total_expenses"], 4000.0)
+        self.assertEqual(summary["total_days"], 40)
+        self.assertEqual(summary["average_daily_expense"], 100.0)
@@ -0,0 +1,85 @@
+import os
+from datetime import date
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from core.domain import ExchangeRate
+from core.interfaces.repositories import ExchangeRateRepository
+from infrastructure.database import SQLiteConnection
+from infrastructure.persistence import (InMemoryExchangeRateRepository,
+                                        SQLiteExchangeRateRepository)
+
+
+class ExchangeRateRepositoryContract:
+    """Behaviour shared by every ExchangeRateRepository implementation."""
+
+    repository: ExchangeRateRepository
+
+    def test_is_an_exchange_rate_repository(self):
+        """
+        Tests that the repository implements the ExchangeRateRepository interface.
+        """
+
+        self.assertIsInstance(self.repository, ExchangeRateRepository)
+
+    def test_get_rate_returns_latest_on_or_before_date(self):
+        """
+        Tests that a lookup returns the exact date when stored, otherwise the
+        closest earlier one, and nothing before the first stored date.
+        """
+
+        self.repository.save_many(
+            [
+                ExchangeRate(date(2026, 3, 5), "USD", "COP", 3900.5),
+                ExchangeRate(date(2026, 3, 1), "USD", "COP", 3800.25),
+                ExchangeRate(date(2026, 3, 1), "EUR", "COP", 4200.0),
+            ]
+        )
+
+        exact = self.repository.get_rate("USD", "COP", date(2026, 3, 5))
+        earlier = self.repository.get_rate("usd", "cop", date(2026, 3, 4))
+
+        self.assertEqual((exact.rate_date, exact.rate), (date(2026, 3, 5), 3900.5))
+        self.assertEqual((earlier.rate_date, earlier.rate), (date(2026, 3, 1), 3800.25))
+        self.assertEqual(earlier.base_currency, "USD")
+        self.assertIsNone(self.repository.get_rate("USD", "COP", date(2026, 2, 28)))
+        self.assertIsNone(self.repository.get_rate("GBP", "COP", date(2026, 3, 5)))
+
+    def test_save_many_replaces_rates_of_the_same_date(self):
+        """
+        Tests that saving a table again for the same date replaces its rates.
+        """
+
+        self.repository.save_many([ExchangeRate(date(2026, 3, 1), "USD", "COP", 1.0)])
+        self.repository.save_many([ExchangeRate(date(2026, 3, 1), "USD", "COP", 2.0)])
+
+        self.assertEqual(
+            self.repository.get_rate("USD", "COP", date(2026, 3, 1)).rate, 2.0
+        )
+
+
+class TestInMemoryExchangeRateRepository(ExchangeRateRepositoryContract, TestCase):
+    """Test case for InMemoryExchangeRateRepository."""
+
+    def setUp(self) -> None:
+        """
+        Creates an empty repository.
+        """
+
+        self.repository = InMemoryExchangeRateRepository()
+
+
+class TestSQLiteExchangeRateRepository(ExchangeRateRepositoryContract, TestCase):
+    """Test case for SQLiteExchangeRateRepository."""
+
+    def setUp(self) -> None:
+        """
+        Creates a repository on a database file in a temporary directory.
+        """
+
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        db_connection = SQLiteConnection(os.path.join(directory.name, "rates.db"))
+        self.addCleanup(db_connection.close)
+
+        self.repository = SQLiteExchangeRateRepository(db_connection)
@@ -0,0 +1,203 @@
+from datetime import date, timedelta
+from threading import Thread
+from unittest import TestCase
+from uuid import UUID, uuid4
+
+from core.domain import Expense, Trip
+from core.enums import ExpenseType, PaymentMethod
+from core.exceptions import TripNotFoundError
+from core.interfaces.repositories import ExpenseRepository, TripRepository
+from infrastructure.persistence import (InMemoryExpenseRepository,
+                                        InMemoryTripRepository,
+                                        create_repositories)
+
+START = date(2026, 3, 1)
+
+
+def make_expense(
+    trip_id: UUID,
+    day: int,
+    amount: float,
+    payment_method: PaymentMethod = PaymentMethod.CASH,
+    expense_type: ExpenseType = ExpenseType.FOOD,
+    expense_id: UUID = None,
+) -> Expense:
+    return Expense(
+        expense_id or uuid4(),
+        trip_id,
+        START + timedelta(days=day),
+        amount,
+        "COP",
+        amount,
+        payment_method,
+        expense_type,
+    )
+
+
+class TestInMemoryRepositories(TestCase):
+    """Test case for the in-memory trip and expense repositories."""
+
+    def setUp(self) -> None:
+        """
+        Creates empty repositories and a trip ID to store expenses under.
+        """
+
+        self.trip_repository = InMemoryTripRepository()
+        self.expense_repository = InMemoryExpenseRepository()
+        self.trip_id = uuid4()
+
+    def test_repositories_implement_the_interfaces(self):
+        """
+        Tests that the memory backend builds repositories of the interfaces.
+        """
+
+        trip_repository, expense_repository = create_repositories("memory")
+
+        self.assertIsInstance(trip_repository, TripRepository)
+        self.assertIsInstance(expense_repository, ExpenseRepository)
+        with self.assertRaises(ValueError):
+            create_repositories("oracle")
+
+    def test_trips_are_listed_by_start_date_descending(self):
+        """
+        Tests get_all ordering, lookups by ID and the dashboard counters.
+        """
+
+        trips = [
+            Trip(
+                uuid4(),
+                START + timedelta(days=offset),
+                START + timedelta(days=9),
+                False,
+                1,
+            )
+            for offset in (5, 0, 3)
+        ]
+        for trip in trips:
+            self.trip_repository.save(trip)
+
+        self.assertEqual(
+            [trip.start_date.day for trip in self.trip_repository.get_all()], [6, 4, 1]
+        )
+        self.assertIs(self.trip_repository.get_by_id(trips[1].trip_id), trips[1])
+        self.assertEqual(
+            self.trip_repository.get_dashboard_totals(START + timedelta(days=4)),
+            {"total_trips": 3, "active_trips": 2, "total_days": 22},
+        )
+        self.assertEqual(
+            self.trip_repository.get_active_currencies(START + timedelta(days=4)),
+            ["COP"],
+        )
+        with self.assertRaises(TripNotFoundError):
+            self.trip_repository.get_by_id(uuid4())
+        with self.assertRaises(RuntimeError):
+            self.trip_repository.save(trips[0])
+
+    def test_lookups_by_date_and_rollups(self):
+        """
+        Tests the per-date index and the totals kept on save.
+        """
+
+        self.expense_repository.save_many(
+            [
+                make_expense(self.trip_id, 0, 100.0),
+                make_expense(self.trip_id, 0, 50.0, PaymentMethod.CARD),
+                make_expense(
+                    self.trip_id, 2, 25.0, expense_type=ExpenseType.TRANSPORTATION
+                ),
+            ]
+        )
+        self.expense_repository.save(make_expense(uuid4(), 0, 1.0))
+
+        self.assertEqual(
+            len(self.expense_repository.get_by_trip_and_date(self.trip_id, START)), 2
+        )
+        self.assertEqual(
+            self.expense_repository.get_daily_total(self.trip_id, START), 150.0
+        )
+        self.assertEqual(
+            self.expense_repository.get_daily_totals(self.trip_id)[START],
+            {"cash": 100.0, "card": 50.0, "total": 150.0},
+        )
+        self.assertEqual(
+            self.expense_repository.get_type_totals(self.trip_id),
+            {
+                ExpenseType.FOOD: {"cash": 100.0, "card": 50.0, "total": 150.0},
+                ExpenseType.TRANSPORTATION: {"cash": 25.0, "card": 0.0, "total": 25.0},
+            },
+        )
+        self.assertEqual(
+            self.expense_repository.get_trip_totals(self.trip_id),
+            {"total": 175.0, "count": 3},
+        )
+        self.assertEqual(self.expense_repository.get_total_amount(), 176.0)
+        self.assertEqual(len(self.expense_repository.get_columns(self.trip_id)), 3)
+
+    def test_keyset_pages_follow_date_and_id_order(self):
+        """
+        Tests that pages resume after the given (date, id), including inside a
+        date bucket, and that streaming returns the same order.
+        """
+
+        ids = sorted((uuid4() for _ in range(5)), key=str)
+        expenses = [
+            make_expense(self.trip_id, day, 1.0, expense_id=expense_id)
+            for day, expense_id in zip((1, 0, 1, 0, 1), ids)
+        ]
+        self.expense_repository.save_many(expenses)
+        expected = sorted(
+            expenses,
+            key=lambda expense: (expense.expense_date, str(expense.expense_id)),
+        )
+
+        first = self.expense_repository.get_page(self.trip_id, 3)
+        last = first[-1]
+        second = self.expense_repository.get_page(
+            self.trip_id, 3, (last.expense_date, last.expense_id)
+        )
+
+        self.assertEqual(first + second, expected)
+        self.assertEqual(
+            list(self.expense_repository.iter_by_trip_id(self.trip_id, batch_size=2)),
+            expected,
+        )
+        self.assertEqual(self.expense_repository.get_page(uuid4(), 3), [])
+
+    def test_duplicate_ids_leave_the_store_unchanged(self):
+        """
+        Tests that a batch with an already stored ID is rejected as a whole.
+        """
+
+        expense = make_expense(self.trip_id, 0, 10.0)
+        self.expense_repository.save(expense)
+
+        with self.assertRaises(RuntimeError):
+            self.expense_repository.save_many(
+                [make_expense(self.trip_id, 1, 5.0), expense]
+            )
+
+        self.assertEqual(
+            self.expense_repository.get_trip_totals(self.trip_id),
+            {"total": 10.0, "count": 1},
+        )
+
+    def test_concurrent_saves_are_all_counted(self):
+        """
+        Tests that saves from several threads keep the index and rollup consistent.
+        """
+
+        def save_expenses() -> None:
+            for day in range(200):
+                self.expense_repository.save(make_expense(self.trip_id, day % 7, 1.0))
+
+        threads = [Thread(target=save_expenses) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(self.expense_repository.get_by_trip_id(self.trip_id)), 800)
+        self.assertEqual(
+            self.expense_repository.get_trip_totals(self.trip_id),
+            {"total": 800.0, "count": 800},
+        )
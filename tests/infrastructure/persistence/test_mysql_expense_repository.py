@@ -0,0 +1,164 @@
+from contextlib import contextmanager
+from datetime import date
+from decimal import Decimal
+from unittest import TestCase
+from uuid import uuid4
+
+from core.domain import Expense
+from core.enums import ExpenseType, PaymentMethod
+from infrastructure.persistence import MySQLExpenseRepository
+
+
+class RecordingCursor:
+    """Cursor double that records statements and their parameters."""
+
+    def __init__(self, calls: list, rows: list) -> None:
+        self._calls = calls
+        self._rows = rows
+        self.rowcount = 0
+
+    def execute(self, query: str, params: tuple = ()) -> None:
+        self._calls.append(("execute", " ".join(query.split()), params))
+
+    def executemany(self, query: str, seq_params: list) -> None:
+        self._calls.append(("executemany", " ".join(query.split()), seq_params))
+
+    def fetchall(self) -> list:
+        return self._rows
+
+
+class RecordingDatabaseConnection:
+    """DatabaseConnection double that records transaction boundaries."""
+
+    def __init__(self) -> None:
+        self.calls: list = []
+        self.rows: list = []
+
+    @contextmanager
+    def get_connection(self):
+        yield self
+
+    def cursor(self, **kwargs) -> RecordingCursor:
+        return RecordingCursor(self.calls, self.rows)
+
+    def start_transaction(self) -> None:
+        self.calls.append(("start_transaction",))
+
+    def commit(self) -> None:
+        self.calls.append(("commit",))
+
+
+class TestMySQLExpenseRepository(TestCase):
+    """Test case for the write path and row mapping of MySQLExpenseRepository."""
+
+    def __init__(self, methodName: str = "runTest") -> None:
+        """
+        Initializes the test case with a recording connection.
+        """
+
+        super().__init__(methodName)
+        self.db_connection = RecordingDatabaseConnection()
+        self.repository = MySQLExpenseRepository(self.db_connection)
+        self.trip_id = uuid4()
+
+    def _expense(self, expense_date: date, amount: float, method: PaymentMethod):
+        return Expense(
+            expense_id=uuid4(),
+            trip_id=self.trip_id,
+            expense_date=expense_date,
+            original_amount=amount,
+            converted_amount_cop=amount,
+            payment_method=method,
+            expense_type=ExpenseType.FOOD,
+        )
+
+    def test_save_updates_rollup_in_same_transaction(self):
+        """
+        Tests that saving an expense also upserts its daily total
+        between the same transaction boundaries.
+        """
+
+        self.repository.save(
+            self._expense(date(2025, 6, 1), 1000.0, PaymentMethod.CASH)
+        )
+
+        kinds = [call[0] for call in self.db_connection.calls]
+        self.assertEqual(kinds, ["start_transaction", "execute", "execute", "commit"])
+        self.assertIn("INSERT INTO trip_daily_totals", self.db_connection.calls[2][1])
+        self.assertEqual(
+            self.db_connection.calls[2][2],
+            (str(self.trip_id), date(2025, 6, 1), 1000.0, 0.0, 1000.0, 1),
+        )
+
+    def test_save_many_aggregates_rollup_per_day(self):
+        """
+        Tests that a batch produces one rollup delta per trip and date.
+        """
+
+        self.repository.save_many(
+            [
+                self._expense(date(2025, 6, 1), 1000.0, PaymentMethod.CASH),
+                self._expense(date(2025, 6, 1), 500.0, PaymentMethod.CARD),
+                self._expense(date(2025, 6, 2), 200.0, PaymentMethod.CARD),
+            ]
+        )
+
+        _, expense_insert, rollup_upsert, _ = self.db_connection.calls
+        self.assertEqual(len(expense_insert[2]), 3)
+        self.assertEqual(
+            rollup_upsert[2],
+            [
+                (str(self.trip_id), date(2025, 6, 1), 1000.0, 500.0, 1500.0, 2),
+                (str(self.trip_id), date(2025, 6, 2), 0.0, 200.0, 200.0, 1),
+            ],
+        )
+
+    def test_rebuild_locks_trip_expenses_before_replacing_rollup(self):
+        """
+        Tests that a rebuild first locks the trip's expenses, then deletes and
+        re-aggregates its rollup rows, all inside one transaction.
+        """
+
+        self.repository.rebuild_daily_totals(self.trip_id)
+
+        calls = self.db_connection.calls
+        self.assertEqual(calls[0], ("start_transaction",))
+        self.assertEqual(calls[-1], ("commit",))
+        statements = [call[1] for call in calls[1:-1]]
+        self.assertEqual(
+            statements[0],
+            "SELECT COUNT(*) FROM expenses WHERE trip_id = %s FOR UPDATE",
+        )
+        self.assertTrue(statements[1].startswith("DELETE FROM trip_daily_totals"))
+        self.assertTrue(statements[2].startswith("INSERT INTO trip_daily_totals"))
+        self.assertEqual(calls[1][2], (str(self.trip_id),))
+
+    def test_rows_are_mapped_from_tuples(self):
+        """
+        Tests that expenses are read with an explicit column list and mapped
+        positionally from tuple rows.
+        """
+
+        expense_id = uuid4()
+        self.db_connection.rows.append(
+            (
+                str(expense_id),
+                str(self.trip_id),
+                date(2025, 6, 1),
+                Decimal("10.50"),
+                "USD",
+                Decimal("42000.00"),
+                "Card",
+                "Food",
+            )
+        )
+
+        (expense,) = self.repository.get_by_trip_id(self.trip_id)
+
+        self.assertNotIn("SELECT *", self.db_connection.calls[0][1])
+        self.assertEqual(expense.expense_id, expense_id)
+        self.assertEqual(expense.original_amount, 10.5)
+        self.assertEqual(expense.converted_amount_cop, 42000.0)
+        self.assertEqual(expense.payment_method, PaymentMethod.CARD)
+        self.assertEqual(expense.expense_type, ExpenseType.FOOD)
+        self.assertFalse(hasattr(expense, "__dict__"))
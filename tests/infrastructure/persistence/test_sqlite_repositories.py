@@ -0,0 +1,221 @@
+import os
+from datetime import date, timedelta
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest import TestCase
+from uuid import UUID, uuid4
+
+from core.domain import Expense, Trip
+from core.enums import ExpenseType, PaymentMethod
+from core.exceptions import TripNotFoundError
+from core.interfaces.repositories import ExpenseRepository, TripRepository
+from infrastructure.database import SQLiteConnection
+from infrastructure.persistence import (SQLiteExpenseRepository,
+                                        SQLiteTripRepository,
+                                        create_repositories)
+
+START = date(2026, 3, 1)
+
+
+def make_expense(
+    trip_id: UUID,
+    day: int,
+    amount: float,
+    payment_method: PaymentMethod = PaymentMethod.CASH,
+    expense_type: ExpenseType = ExpenseType.FOOD,
+    expense_id: UUID = None,
+) -> Expense:
+    return Expense(
+        expense_id or uuid4(),
+        trip_id,
+        START + timedelta(days=day),
+        amount,
+        "COP",
+        amount,
+        payment_method,
+        expense_type,
+    )
+
+
+class TestSQLiteRepositories(TestCase):
+    """Test case for the SQLite trip and expense repositories."""
+
+    def setUp(self) -> None:
+        """
+        Creates repositories on a database file in a temporary directory and
+        stores a trip to attach expenses to.
+        """
+
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.db_connection = SQLiteConnection(
+            os.path.join(directory.name, "expenses.db")
+        )
+        self.addCleanup(self.db_connection.close)
+
+        self.trip_repository = SQLiteTripRepository(self.db_connection)
+        self.expense_repository = SQLiteExpenseRepository(self.db_connection)
+        self.trip = Trip(uuid4(), START, START + timedelta(days=9), True, 100.0, "USD")
+        self.trip_repository.save(self.trip)
+        self.trip_id = self.trip.trip_id
+
+    def test_repositories_implement_the_interfaces(self):
+        """
+        Tests that the sqlite backend builds repositories of the interfaces and
+        that the database runs in WAL mode.
+        """
+
+        trip_repository, expense_repository = create_repositories(
+            "sqlite", sqlite_connection_factory=lambda: self.db_connection
+        )
+
+        self.assertIsInstance(trip_repository, TripRepository)
+        self.assertIsInstance(expense_repository, ExpenseRepository)
+        with self.db_connection.get_connection() as connection:
+            cursor = connection.cursor()
+            cursor.execute("PRAGMA journal_mode")
+            self.assertEqual(cursor.fetchone(), ("wal",))
+
+    def test_trips_round_trip(self):
+        """
+        Tests get_all ordering, lookups by ID and the dashboard counters.
+        """
+
+        other = Trip(
+            uuid4(), START + timedelta(days=5), START + timedelta(days=6), False, 1
+        )
+        self.trip_repository.save(other)
+
+        stored = self.trip_repository.get_by_id(self.trip_id)
+        self.assertEqual(
+            (stored.start_date, stored.end_date, stored.is_international),
+            (self.trip.start_date, self.trip.end_date, True),
+        )
+        self.assertEqual(
+            [trip.trip_id for trip in self.trip_repository.get_all()],
+            [other.trip_id, self.trip_id],
+        )
+        self.assertEqual(
+            self.trip_repository.get_dashboard_totals(START + timedelta(days=2)),
+            {"total_trips": 2, "active_trips": 1, "total_days": 12},
+        )
+        self.assertEqual(
+            self.trip_repository.get_active_currencies(START + timedelta(days=5)),
+            ["COP", "USD"],
+        )
+        with self.assertRaises(TripNotFoundError):
+            self.trip_repository.get_by_id(uuid4())
+        with self.assertRaises(RuntimeError):
+            self.trip_repository.save(other)
+
+    def test_lookups_by_date_and_rollups(self):
+        """
+        Tests the per-date lookups and the rollup kept on save and rebuilt
+        from the expenses table.
+        """
+
+        self.expense_repository.save_many(
+            [
+                make_expense(self.trip_id, 0, 100.0),
+                make_expense(self.trip_id, 0, 50.0, PaymentMethod.CARD),
+                make_expense(
+                    self.trip_id, 2, 25.0, expense_type=ExpenseType.TRANSPORTATION
+                ),
+            ]
+        )
+        self.expense_repository.save(make_expense(self.trip_id, 0, 1.0))
+
+        self.assertEqual(
+            len(self.expense_repository.get_by_trip_and_date(self.trip_id, START)), 3
+        )
+        self.assertEqual(
+            self.expense_repository.get_daily_totals(self.trip_id)[START],
+            {"cash": 101.0, "card": 50.0, "total": 151.0},
+        )
+        self.assertEqual(
+            self.expense_repository.get_type_totals(self.trip_id),
+            {
+                ExpenseType.FOOD: {"cash": 101.0, "card": 50.0, "total": 151.0},
+                ExpenseType.TRANSPORTATION: {"cash": 25.0, "card": 0.0, "total": 25.0},
+            },
+        )
+        self.assertEqual(self.expense_repository.rebuild_daily_totals(), 2)
+        self.assertEqual(
+            self.expense_repository.get_trip_totals(self.trip_id),
+            {"total": 176.0, "count": 4},
+        )
+        self.assertEqual(
+            self.expense_repository.get_daily_total(self.trip_id, START), 151.0
+        )
+        self.assertEqual(len(self.expense_repository.get_columns(self.trip_id)), 4)
+
+    def test_keyset_pages_follow_date_and_id_order(self):
+        """
+        Tests that pages resume after the given (date, id), including inside a
+        date, and that streaming returns the same order.
+        """
+
+        ids = sorted((uuid4() for _ in range(5)), key=str)
+        expenses = [
+            make_expense(self.trip_id, day, 1.0, expense_id=expense_id)
+            for day, expense_id in zip((1, 0, 1, 0, 1), ids)
+        ]
+        self.expense_repository.save_many(expenses)
+        expected = [
+            expense.expense_id
+            for expense in sorted(
+                expenses,
+                key=lambda expense: (expense.expense_date, str(expense.expense_id)),
+            )
+        ]
+
+        first = self.expense_repository.get_page(self.trip_id, 3)
+        last = first[-1]
+        second = self.expense_repository.get_page(
+            self.trip_id, 3, (last.expense_date, last.expense_id)
+        )
+        streamed = self.expense_repository.iter_by_trip_id(self.trip_id, batch_size=2)
+
+        self.assertEqual([expense.expense_id for expense in first + second], expected)
+        self.assertEqual([expense.expense_id for expense in streamed], expected)
+
+    def test_failed_batch_is_rolled_back(self):
+        """
+        Tests that a batch with an already stored ID leaves both the expenses
+        and the rollup unchanged.
+        """
+
+        expense = make_expense(self.trip_id, 0, 10.0)
+        self.expense_repository.save(expense)
+
+        with self.assertRaises(RuntimeError):
+            self.expense_repository.save_many(
+                [make_expense(self.trip_id, 1, 5.0), expense]
+            )
+
+        self.assertEqual(len(self.expense_repository.get_by_trip_id(self.trip_id)), 1)
+        self.assertEqual(
+            self.expense_repository.get_trip_totals(self.trip_id),
+            {"total": 10.0, "count": 1},
+        )
+
+    def test_concurrent_saves_are_all_counted(self):
+        """
+        Tests that writers on separate per-thread connections queue on the
+        database lock instead of failing.
+        """
+
+        def save_expenses() -> None:
+            for day in range(50):
+                self.expense_repository.save(make_expense(self.trip_id, day % 7, 1.0))
+
+        threads = [Thread(target=save_expenses) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            self.expense_repository.get_trip_totals(self.trip_id),
+            {"total": 200.0, "count": 200},
+        )
@@ -0,0 +1,101 @@
+from datetime import date
+from unittest import TestCase
+
+from core.enums import PaymentMethod
+from infrastructure.persistence import (InMemoryExpenseRepository,
+                                        InMemoryTripRepository)
+from infrastructure.seeding import COP_RATES, SyntheticDataGenerator
+
+WINDOW_START = date(2026, 1, 1)
+WINDOW_END = date(2026, 6, 30)
+
+
+def snapshot(seed: int) -> list:
+    generator = SyntheticDataGenerator(seed, WINDOW_START, WINDOW_END)
+    trips = generator.trips(20)
+    return [
+        (
+            expense.expense_id,
+            expense.trip_id,
+            expense.expense_date,
+            expense.converted_amount_cop,
+            expense.payment_method,
+            expense.expense_type,
+        )
+        for expense in generator.expenses(trips, 500)
+    ]
+
+
+class TestSyntheticDataGenerator(TestCase):
+    """Test case for the synthetic dataset generator."""
+
+    def test_same_seed_gives_the_same_dataset(self):
+        """
+        Tests that datasets are reproducible, IDs included, and vary with the seed.
+        """
+
+        self.assertEqual(snapshot(7), snapshot(7))
+        self.assertNotEqual(snapshot(7), snapshot(8))
+
+    def test_expenses_fit_their_trips(self):
+        """
+        Tests the target size, the date ranges and the currency conversion.
+        """
+
+        generator = SyntheticDataGenerator(
+            1, WINDOW_START, WINDOW_END, international_share=0.5, card_share=1.0
+        )
+        trips = {trip.trip_id: trip for trip in generator.trips(30)}
+        expenses = list(generator.expenses(list(trips.values()), 1001))
+
+        self.assertEqual(len(expenses), 1001)
+        for trip in trips.values():
+            self.assertTrue(WINDOW_START <= trip.start_date <= WINDOW_END)
+            self.assertLessEqual(trip.start_date, trip.end_date)
+
+        for expense in expenses:
+            trip = trips[expense.trip_id]
+            self.assertTrue(trip.start_date <= expense.expense_date <= trip.end_date)
+            self.assertEqual(expense.currency, trip.currency)
+            self.assertEqual(expense.payment_method, PaymentMethod.CARD)
+            rate = COP_RATES[trip.currency] if trip.is_international else 1.0
+            self.assertAlmostEqual(
+                expense.converted_amount_cop, expense.original_amount * rate, places=2
+            )
+
+    def test_populate_writes_in_batches(self):
+        """
+        Tests that populate saves every row and reports progress per batch.
+        """
+
+        trip_repository = InMemoryTripRepository()
+        expense_repository = InMemoryExpenseRepository()
+        progress = []
+
+        report = SyntheticDataGenerator(3, WINDOW_START, WINDOW_END).populate(
+            trip_repository,
+            expense_repository,
+            trip_count=5,
+            expense_count=250,
+            batch_size=100,
+            on_progress=lambda written, elapsed: progress.append(written),
+        )
+
+        self.assertEqual((report.trips, report.expenses), (5, 250))
+        self.assertEqual(progress, [100, 200, 250])
+        self.assertEqual(len(trip_repository.get_all()), 5)
+        self.assertEqual(
+            sum(
+                expense_repository.get_trip_totals(trip.trip_id)["count"]
+                for trip in trip_repository.get_all()
+            ),
+            250,
+        )
+
+    def test_invalid_window_is_rejected(self):
+        """
+        Tests that a window ending before it starts raises ValueError.
+        """
+
+        with self.assertRaises(ValueError):
+            SyntheticDataGenerator(1, WINDOW_END, WINDOW_START)
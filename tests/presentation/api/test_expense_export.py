@@ -0,0 +1,226 @@
+import csv
+import io
+import json
+from datetime import date, timedelta
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from core.domain import Expense, Trip
+from core.enums import ExpenseType, PaymentMethod
+from core.services import ExpenseManager
+from infrastructure.concurrency import BoundedExecutor
+from infrastructure.persistence import (InMemoryExpenseRepository,
+                                        InMemoryTripRepository)
+from presentation.api.controllers.expense_controller import ExpenseController
+from presentation.api.exporters import ExpenseExporter
+
+START = date(2026, 3, 1)
+
+
+def make_expense(trip_id: UUID, day: int, amount: float) -> Expense:
+    return Expense(
+        uuid4(),
+        trip_id,
+        START + timedelta(days=day),
+        amount,
+        "USD",
+        amount * 4000,
+        PaymentMethod.CARD,
+        ExpenseType.FOOD,
+    )
+
+
+class TestExpenseExporter(TestCase):
+    """Test case for the NDJSON and CSV expense serializers."""
+
+    def setUp(self) -> None:
+        """
+        Stores seven expenses of a trip in an in-memory repository.
+        """
+
+        self.trip_id = uuid4()
+        self.repository = InMemoryExpenseRepository()
+        self.expenses = [make_expense(self.trip_id, day, 1.5 + day) for day in range(7)]
+        self.repository.save_many(self.expenses)
+
+    def test_csv_header_and_rows(self):
+        """
+        Tests that the CSV starts with the column header and writes one row per
+        expense with ISO dates and stored enum values.
+        """
+
+        content = "".join(ExpenseExporter().to_csv(self.expenses[:1]))
+        expense = self.expenses[0]
+
+        self.assertEqual(
+            content.splitlines(),
+            [
+                "expense_id,trip_id,expense_date,amount,currency,converted_amount,"
+                "payment_method,expense_type",
+                f"{expense.expense_id},{self.trip_id},2026-03-01,1.5,USD,6000.0,"
+                f"{PaymentMethod.CARD.value},{ExpenseType.FOOD.value}",
+            ],
+        )
+
+    def test_ndjson_writes_one_object_per_line(self):
+        """
+        Tests that every NDJSON line is a JSON object keyed by the export columns.
+        """
+
+        content = "".join(ExpenseExporter().to_ndjson(self.expenses[:2]))
+
+        self.assertTrue(content.endswith("\n"))
+        lines = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual(
+            lines[1],
+            {
+                "expense_id": str(self.expenses[1].expense_id),
+                "trip_id": str(self.trip_id),
+                "expense_date": "2026-03-02",
+                "amount": 2.5,
+                "currency": "USD",
+                "converted_amount": 10000.0,
+                "payment_method": PaymentMethod.CARD.value,
+                "expense_type": ExpenseType.FOOD.value,
+            },
+        )
+
+    def test_chunks_span_several_pages(self):
+        """
+        Tests that chunks are cut every rows_per_chunk rows regardless of the
+        repository page boundaries, and that no expense is lost or repeated.
+        """
+
+        exporter = ExpenseExporter(rows_per_chunk=3)
+
+        with patch.object(
+            self.repository, "get_page", wraps=self.repository.get_page
+        ) as get_page:
+            ndjson_chunks = list(
+                exporter.to_ndjson(self.repository.iter_by_trip_id(self.trip_id, 2))
+            )
+            csv_chunks = list(
+                exporter.to_csv(self.repository.iter_by_trip_id(self.trip_id, 2))
+            )
+
+        self.assertEqual(get_page.call_count, 8)
+        self.assertEqual([chunk.count("\n") for chunk in ndjson_chunks], [3, 3, 1])
+        self.assertEqual([chunk.count("\n") for chunk in csv_chunks], [4, 3, 1])
+        exported_ids = [
+            row["expense_id"]
+            for row in csv.DictReader(io.StringIO("".join(csv_chunks)))
+        ]
+        self.assertEqual(
+            exported_ids,
+            [str(expense.expense_id) for expense in self.expenses],
+        )
+
+    def test_empty_input(self):
+        """
+        Tests that no expenses export as an empty NDJSON body and a header-only CSV.
+        """
+
+        self.assertEqual(list(ExpenseExporter().to_ndjson([])), [])
+        self.assertEqual(
+            list(ExpenseExporter().to_csv([])),
+            [",".join(ExpenseExporter.COLUMNS) + "\r\n"],
+        )
+
+
+class TestExpenseExportEndpoint(TestCase):
+    """Test case for the /expenses/{trip_id}/export endpoint."""
+
+    def setUp(self) -> None:
+        """
+        Serves the export endpoint over in-memory repositories holding a trip
+        with three expenses and a trip without expenses.
+        """
+
+        self.trip_repository = InMemoryTripRepository()
+        self.expense_repository = InMemoryExpenseRepository()
+        self.trip = Trip(uuid4(), START, START + timedelta(days=9), True, 100.0)
+        self.empty_trip = Trip(uuid4(), START, START + timedelta(days=2), False, 10.0)
+        self.trip_repository.save(self.trip)
+        self.trip_repository.save(self.empty_trip)
+        self.expense_repository.save_many(
+            [make_expense(self.trip.trip_id, day, 10.0) for day in range(3)]
+        )
+
+        executor = BoundedExecutor(max_workers=2, max_pending=4)
+        self.addCleanup(executor.shutdown)
+        controller = ExpenseController(
+            ExpenseManager(self.expense_repository, self.trip_repository, MagicMock()),
+            executor,
+        )
+        router = APIRouter()
+        router.add_api_route(
+            "/expenses/{trip_id}/export", controller.export_expenses, methods=["GET"]
+        )
+        app = FastAPI()
+        app.include_router(router)
+        self.client = TestClient(app)
+
+    def test_exports_csv(self):
+        """
+        Tests that format=csv streams a CSV attachment with every expense.
+        """
+
+        response = self.client.get(
+            f"/expenses/{self.trip.trip_id}/export", params={"format": "csv"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/csv"))
+        self.assertEqual(
+            response.headers["content-disposition"],
+            f'attachment; filename="expenses-{self.trip.trip_id}.csv"',
+        )
+        self.assertEqual(len(response.text.splitlines()), 4)
+
+    def test_exports_ndjson_by_default(self):
+        """
+        Tests that the default format is NDJSON with one line per expense.
+        """
+
+        response = self.client.get(f"/expenses/{self.trip.trip_id}/export")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(
+            response.headers["content-type"].startswith("application/x-ndjson")
+        )
+        self.assertEqual(len(response.text.splitlines()), 3)
+
+    def test_empty_trip(self):
+        """
+        Tests that a trip without expenses exports an empty body.
+        """
+
+        response = self.client.get(f"/expenses/{self.empty_trip.trip_id}/export")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, "")
+
+    def test_unknown_trip_returns_404(self):
+        """
+        Tests that exporting the expenses of an unknown trip answers 404.
+        """
+
+        response = self.client.get(f"/expenses/{uuid4()}/export")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_invalid_format_returns_400(self):
+        """
+        Tests that an unsupported format answers 400 instead of 422.
+        """
+
+        response = self.client.get(
+            f"/expenses/{self.trip.trip_id}/export", params={"format": "xml"}
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["detail"], "Unsupported export format: xml")
@@ -0,0 +1,84 @@
+import asyncio
+from threading import Event
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+import httpx
+from fastapi import APIRouter, FastAPI
+
+from core.services import ReportService, TripService
+from infrastructure.concurrency import BoundedExecutor
+from presentation.api.controllers.dashboard_controller import \
+    DashboardController
+
+SUMMARY = {
+    "total_trips": 1,
+    "active_trips": 1,
+    "total_expenses": 0,
+    "average_daily_expense": 0.0,
+}
+
+
+class TestLoadShedding(TestCase):
+    """Test case for rejecting API bursts that exceed the executor queue."""
+
+    def setUp(self) -> None:
+        """
+        Serves the dashboard stats endpoint from an executor with one worker
+        and one queue slot, backed by a report service that blocks until
+        released.
+        """
+
+        self.started = Event()
+        self.release = Event()
+        self.report_service = MagicMock(spec=ReportService)
+        self.report_service.get_dashboard_summary.side_effect = self._summary
+        self.executor = BoundedExecutor(max_workers=1, max_pending=1, retry_after=2)
+        self.addCleanup(self.executor.shutdown)
+        self.addCleanup(self.release.set)
+
+        controller = DashboardController(
+            MagicMock(spec=TripService), self.report_service, self.executor
+        )
+        router = APIRouter()
+        router.add_api_route("/stats", controller.get_dashboard_stats, methods=["GET"])
+        self.app = FastAPI()
+        self.app.include_router(router)
+
+    def _summary(self) -> dict:
+        self.started.set()
+        self.release.wait(5)
+        return SUMMARY
+
+    async def _burst(self, size: int) -> list:
+        transport = httpx.ASGITransport(app=self.app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            requests = [
+                asyncio.ensure_future(client.get("/stats")) for _ in range(size)
+            ]
+            while not self.started.is_set():
+                await asyncio.sleep(0.001)
+            while self.executor.in_flight < 2:
+                await asyncio.sleep(0.001)
+
+            rejected = [await client.get("/stats") for _ in range(2)]
+            self.release.set()
+            return rejected + list(await asyncio.gather(*requests))
+
+    def test_burst_beyond_the_queue_answers_503(self):
+        """
+        Tests that requests arriving while the worker is busy and the queue is
+        full get 503 with Retry-After, while the accepted ones still succeed.
+        """
+
+        responses = asyncio.run(self._burst(2))
+
+        self.assertEqual(
+            [response.status_code for response in responses], [503, 503, 200, 200]
+        )
+        self.assertEqual(responses[0].headers["Retry-After"], "2")
+        self.assertEqual(responses[2].json()["total_trips"], 1)
+        self.assertEqual(self.report_service.get_dashboard_summary.call_count, 2)
+        self.assertEqual(self.executor.in_flight, 0)
@@ -0,0 +1,160 @@
+import json
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest import TestCase
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import numpy as np
+
+from application.dto import ExpenseColumns
+from core.domain import Trip
+from core.enums import ExpenseType, PaymentMethod
+from core.services import ColumnarReportService
+
+
+def database_reports(rows):
+    """
+    Reproduces the reports the MySQL repository builds from grouped DECIMAL sums.
+    """
+
+    daily, groups = {}, {}
+    for expense_date, expense_type, payment_method, amount in rows:
+        day = daily.setdefault(expense_date, [Decimal(0), Decimal(0)])
+        day[payment_method == PaymentMethod.CASH.value] += amount
+        key = (expense_type, payment_method)
+        groups[key] = groups.get(key, Decimal(0)) + amount
+
+    daily_report = {
+        expense_date: {
+            "cash": float(cash),
+            "card": float(card),
+            "total": float(card + cash),
+        }
+        for expense_date, (card, cash) in sorted(daily.items())
+    }
+
+    type_report = {}
+    for (expense_type, payment_method), amount in sorted(groups.items()):
+        entry = type_report.setdefault(
+            ExpenseType(expense_type), {"cash": 0.0, "card": 0.0, "total": 0.0}
+        )
+        if payment_method == PaymentMethod.CASH.value:
+            entry["cash"] += float(amount)
+        else:
+            entry["card"] += float(amount)
+        entry["total"] += float(amount)
+
+    total = float(sum(amount for _, _, _, amount in rows))
+    return daily_report, type_report, total
+
+
+class TestColumnarReportService(TestCase):
+    """Test case for ColumnarReportService class."""
+
+    def __init__(self, methodName: str = "runTest") -> None:
+        """
+        Initializes the test case with random expense rows and a service instance.
+        """
+
+        super().__init__(methodName)
+        generator = random.Random(42)
+        start = date(2025, 6, 1)
+        self.rows = [
+            (
+                start + timedelta(days=generator.randrange(10)),
+                generator.choice(list(ExpenseType)).value,
+                generator.choice(list(PaymentMethod)).value,
+                Decimal(generator.randrange(1, 50_000_000)) / 100,
+            )
+            for _ in range(2000)
+        ]
+        self.trip = Trip(uuid4(), start, start + timedelta(days=9), False, 100000)
+
+        self.mock_expense_repo = MagicMock()
+        self.mock_expense_repo.get_columns.return_value = ExpenseColumns.from_batches(
+            [self.rows]
+        )
+        self.mock_trip_repo = MagicMock()
+        self.mock_trip_repo.get_by_id.return_value = self.trip
+        self.service = ColumnarReportService(
+            expense_repository=self.mock_expense_repo,
+            trip_repository=self.mock_trip_repo,
+        )
+
+    def test_reports_match_database_aggregation(self):
+        """
+        Tests that the daily and type reports are identical, value and key order,
+        to the ones built from the database sums.
+        """
+
+        daily_report, type_report, _ = database_reports(self.rows)
+
+        daily = self.service.generate_daily_expense_report(self.trip.trip_id)
+        by_type = self.service.generate_expense_type_report(self.trip.trip_id)
+
+        self.assertEqual(
+            json.dumps(list(daily.items()), default=str),
+            json.dumps(list(daily_report.items()), default=str),
+        )
+        self.assertEqual(
+            json.dumps(list(by_type.items()), default=str),
+            json.dumps(list(type_report.items()), default=str),
+        )
+
+    def test_trip_summary_uses_exact_total(self):
+        """
+        Tests that the trip summary total equals the exact sum of the amounts.
+        """
+
+        _, _, total = database_reports(self.rows)
+
+        summary = self.service.get_trip_summary(self.trip.trip_id)
+
+        self.assertEqual(summary["total_expenses"], total)
+        self.assertEqual(summary["trip_days"], 10)
+        self.assertEqual(summary["remaining_budget"], 1000000 - total)
+        self.mock_expense_repo.get_trip_totals.assert_not_called()
+
+    def test_batches_fill_growing_arrays(self):
+        """
+        Tests that columns built batch by batch past the initial capacity, with
+        dates given as ISO strings, equal the ones built from a single batch.
+        """
+
+        expected = ExpenseColumns.from_batches([self.rows])
+        batches = (
+            [(day.isoformat(), *rest) for day, *rest in self.rows[start : start + 300]]
+            for start in range(0, len(self.rows), 300)
+        )
+
+        columns = ExpenseColumns.from_batches(batches, capacity=16)
+
+        self.assertEqual(len(columns), len(self.rows))
+        for field in ("dates", "type_codes", "payment_codes", "amount_cents"):
+            self.assertTrue(
+                np.array_equal(getattr(columns, field), getattr(expected, field))
+            )
+            self.assertEqual(
+                getattr(columns, field).dtype, getattr(expected, field).dtype
+            )
+
+    def test_empty_trip(self):
+        """
+        Tests that a trip without expenses produces empty reports.
+        """
+
+        self.mock_expense_repo.get_columns.return_value = ExpenseColumns.from_batches(
+            []
+        )
+
+        self.assertEqual(
+            self.service.generate_daily_expense_report(self.trip.trip_id), {}
+        )
+        self.assertEqual(
+            self.service.generate_expense_type_report(self.trip.trip_id), {}
+        )
+        self.assertEqual(
+            self.service.get_trip_summary(self.trip.trip_id)["total_expenses"], 0.0
+        )
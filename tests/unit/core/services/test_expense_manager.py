@@ -1,12 +1,13 @@
-from datetime import date
+from datetime import date, timedelta
 from unittest import TestCase
 from unittest.mock import MagicMock
 from uuid import uuid4
 
-from application.dto import ExpenseDTO
+from application.dto import ExpenseCursor, ExpenseDTO
 from core.domain import Expense, Trip
 from core.enums import ExpenseType, PaymentMethod
-from core.exceptions import InactiveTripError, TripNotFoundError
+from core.exceptions import (InactiveTripError, InvalidCursorError,
+                             TripNotFoundError)
 from core.services import ExpenseManager
 
 
@@ -61,7 +62,9 @@ class TestExpanseManager(TestCase):
         )
 
         self.mock_trip_repo.get_by_id.return_value = domestic_trip
-        self.mock_expense_repo.get_by_trip_and_date.return_value = [expense]
+        self.mock_expense_repo.get_daily_total.return_value = (
+            expense.converted_amount_cop
+        )
 
         result = self.manager.register_expense(dto)
 
@@ -69,7 +72,7 @@ class TestExpanseManager(TestCase):
         self.mock_expense_repo.save.assert_called_once()
         saved_expense = self.mock_expense_repo.save.call_args[0][0]
         self.assertEqual(saved_expense.converted_amount_cop, 350000)
-        self.mock_converter.convert.assert_not_called()
+        self.mock_converter.convert_on.assert_not_called()
 
     def test_international_trip_success(self):
         """
@@ -103,11 +106,13 @@ class TestExpanseManager(TestCase):
         )
 
         self.mock_trip_repo.get_by_id.return_value = international_trip
-        self.mock_converter.convert.return_value = 200000
-        expense.converted_amount_cop = self.mock_converter.convert(
-            dto.amount, international_trip.currency, "COP"
+        self.mock_converter.convert_on.return_value = 200000
+        expense.converted_amount_cop = self.mock_converter.convert_on(
+            dto.amount, international_trip.currency, "COP", dto.expense_date
+        )
+        self.mock_expense_repo.get_daily_total.return_value = (
+            expense.converted_amount_cop
         )
-        self.mock_expense_repo.get_by_trip_and_date.return_value = [expense]
 
         result = self.manager.register_expense(dto)
 
@@ -157,3 +162,207 @@ class TestExpanseManager(TestCase):
         with self.assertRaises(TripNotFoundError):
             self.manager.register_expense(dto)
         self.mock_expense_repo.save.assert_not_called()
+
+    def test_register_expenses_batch(self):
+        """
+        Tests that a batch looks up each trip once, converts the international
+        amounts in one call, saves every expense in one call and reports each
+        affected date.
+        """
+
+        today = date.today()
+        international_trip = Trip(
+            uuid4(),
+            today - timedelta(days=2),
+            today + timedelta(days=2),
+            True,
+            500000,
+            "USD",
+        )
+        domestic_trip = Trip(
+            uuid4(),
+            today - timedelta(days=2),
+            today + timedelta(days=2),
+            False,
+            300000,
+            "COP",
+        )
+        trips = {trip.trip_id: trip for trip in (international_trip, domestic_trip)}
+
+        dtos = [
+            ExpenseDTO(
+                international_trip.trip_id,
+                today,
+                10,
+                PaymentMethod.CARD,
+                ExpenseType.FOOD,
+            ),
+            ExpenseDTO(
+                international_trip.trip_id,
+                today,
+                20,
+                PaymentMethod.CASH,
+                ExpenseType.FOOD,
+            ),
+            ExpenseDTO(
+                international_trip.trip_id,
+                today - timedelta(days=1),
+                5,
+                PaymentMethod.CASH,
+                ExpenseType.OTHER,
+            ),
+            ExpenseDTO(
+                domestic_trip.trip_id,
+                today,
+                100000,
+                PaymentMethod.CASH,
+                ExpenseType.FOOD,
+            ),
+        ]
+
+        self.mock_trip_repo.get_by_id.side_effect = lambda trip_id: trips[trip_id]
+        self.mock_converter.convert_mixed.side_effect = (
+            lambda amounts, from_currencies, to_currency, on_dates: [
+                amount * (4000 if on_date == today else 3900)
+                for amount, on_date in zip(amounts, on_dates)
+            ]
+        )
+        self.mock_expense_repo.get_daily_total.return_value = 0.0
+
+        result = self.manager.register_expenses(dtos)
+
+        self.assertEqual(self.mock_trip_repo.get_by_id.call_count, 2)
+        self.mock_converter.convert_mixed.assert_called_once_with(
+            [10, 20, 5],
+            ["USD", "USD", "USD"],
+            "COP",
+            [today, today, today - timedelta(days=1)],
+        )
+        self.mock_converter.convert.assert_not_called()
+        self.mock_converter.convert_on.assert_not_called()
+        self.mock_expense_repo.save_many.assert_called_once()
+        saved_expenses = self.mock_expense_repo.save_many.call_args[0][0]
+        self.assertEqual(
+            [expense.converted_amount_cop for expense in saved_expenses],
+            [40000, 80000, 19500, 100000],
+        )
+        self.assertEqual(
+            list(result),
+            [
+                (international_trip.trip_id, today),
+                (international_trip.trip_id, today - timedelta(days=1)),
+                (domestic_trip.trip_id, today),
+            ],
+        )
+
+    def test_register_expenses_inactive_trip(self):
+        """
+        Tests that no expense of a batch is saved when one of its trips is inactive.
+        """
+
+        inactive_trip = Trip(
+            uuid4(), date(2025, 1, 1), date(2025, 1, 10), False, 500000, "COP"
+        )
+        dto = ExpenseDTO(
+            inactive_trip.trip_id,
+            date(2025, 1, 5),
+            1000,
+            PaymentMethod.CASH,
+            ExpenseType.FOOD,
+        )
+        self.mock_trip_repo.get_by_id.return_value = inactive_trip
+
+        with self.assertRaises(InactiveTripError):
+            self.manager.register_expenses([dto])
+        self.mock_expense_repo.save_many.assert_not_called()
+
+    def test_get_expenses_page(self):
+        """
+        Tests that a page fetches one extra row to detect the next page
+        and resumes after the cursor it returned.
+        """
+
+        trip_id = uuid4()
+        expenses = [
+            Expense(
+                uuid4(), trip_id, date(2025, 6, day), 1000, converted_amount_cop=1000
+            )
+            for day in (1, 2, 3)
+        ]
+        self.mock_expense_repo.get_page.return_value = expenses
+        self.mock_expense_repo.get_trip_totals.return_value = {
+            "total": 5000.0,
+            "count": 5,
+        }
+
+        page = self.manager.get_expenses_page(trip_id, limit=2)
+
+        self.mock_expense_repo.get_page.assert_called_once_with(trip_id, 3, None)
+        self.assertEqual(page.expenses, expenses[:2])
+        self.assertEqual(page.total_count, 5)
+        self.assertEqual(
+            ExpenseCursor.decode(page.next_cursor),
+            ExpenseCursor(date(2025, 6, 2), expenses[1].expense_id),
+        )
+
+        self.mock_expense_repo.get_page.return_value = expenses[2:]
+        last_page = self.manager.get_expenses_page(trip_id, 2, page.next_cursor)
+
+        self.mock_expense_repo.get_page.assert_called_with(
+            trip_id, 3, (date(2025, 6, 2), expenses[1].expense_id)
+        )
+        self.assertIsNone(last_page.next_cursor)
+
+    def test_get_expenses_page_invalid_cursor(self):
+        """
+        Tests that a malformed cursor is rejected with an InvalidCursorError.
+        """
+
+        with self.assertRaises(InvalidCursorError):
+            self.manager.get_expenses_page(uuid4(), 10, "not-a-cursor")
+
+    def test_get_expenses_page_unknown_trip(self):
+        """
+        Tests that paging the expenses of an unknown trip raises
+        TripNotFoundError instead of returning an empty page.
+        """
+
+        trip_id = uuid4()
+        self.mock_trip_repo.get_by_id.side_effect = TripNotFoundError(trip_id)
+
+        with self.assertRaises(TripNotFoundError):
+            self.manager.get_expenses_page(trip_id, 10)
+
+        self.mock_expense_repo.get_page.assert_not_called()
+
+    def test_iter_expenses_reads_first_page_eagerly(self):
+        """
+        Tests that the first page is read when the iterator is created, so a
+        storage error is raised before any expense is streamed.
+        """
+
+        trip_id = uuid4()
+        expenses = [
+            Expense(uuid4(), trip_id, date(2025, 6, day), 1000) for day in (1, 2)
+        ]
+        reads = []
+
+        def stream(requested_trip_id):
+            reads.append(requested_trip_id)
+            yield from expenses
+
+        self.mock_expense_repo.iter_by_trip_id.side_effect = stream
+
+        streamed = self.manager.iter_expenses_by_trip_id(trip_id)
+
+        self.assertEqual(reads, [trip_id])
+        self.assertEqual(list(streamed), expenses)
+
+        def fail(requested_trip_id):
+            raise RuntimeError("Error retrieving expenses")
+            yield
+
+        self.mock_expense_repo.iter_by_trip_id.side_effect = fail
+
+        with self.assertRaises(RuntimeError):
+            self.manager.iter_expenses_by_trip_id(trip_id)
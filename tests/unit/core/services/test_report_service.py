@@ -0,0 +1,61 @@
+from datetime import date
+from unittest import TestCase
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from core.domain import Trip
+from core.enums import ExpenseType
+from core.services import ReportService
+
+
+class TestReportService(TestCase):
+    """Test case for ReportService class."""
+
+    def __init__(self, methodName: str = "runTest") -> None:
+        """
+        Initializes the test case with mock repositories and a service instance.
+        """
+
+        super().__init__(methodName)
+        self.mock_expense_repo = MagicMock()
+        self.mock_trip_repo = MagicMock()
+        self.service = ReportService(
+            expense_repository=self.mock_expense_repo,
+            trip_repository=self.mock_trip_repo,
+        )
+
+    def test_type_report_uses_grouped_totals(self):
+        """
+        Tests that the expense type report is served by the grouped repository query
+        without loading individual expenses.
+        """
+
+        trip_id = uuid4()
+        grouped = {ExpenseType.FOOD: {"cash": 100.0, "card": 50.0, "total": 150.0}}
+        self.mock_expense_repo.get_type_totals.return_value = grouped
+
+        report = self.service.generate_expense_type_report(trip_id)
+
+        self.assertEqual(report, grouped)
+        self.mock_expense_repo.get_type_totals.assert_called_once_with(trip_id)
+        self.mock_expense_repo.get_by_trip_id.assert_not_called()
+
+    def test_trip_summary(self):
+        """
+        Tests the trip summary computed from the aggregated trip total.
+        """
+
+        trip = Trip(uuid4(), date(2025, 6, 1), date(2025, 6, 4), False, 100000, "COP")
+        self.mock_trip_repo.get_by_id.return_value = trip
+        self.mock_expense_repo.get_trip_totals.return_value = {
+            "total": 300000.0,
+            "count": 6,
+        }
+
+        summary = self.service.get_trip_summary(trip.trip_id)
+
+        self.assertEqual(summary["total_budget"], 400000)
+        self.assertEqual(summary["remaining_budget"], 100000)
+        self.assertEqual(summary["trip_days"], 4)
+        self.assertEqual(summary["average_daily_expense"], 75000)
+        self.mock_expense_repo.get_by_trip_id.assert_not_called()